@@ -0,0 +1,82 @@
+"""decode speed of the compiled tables against the opcode handlers
+
+lengths is the boundary only walk over the same image.
+
+python -m benchmarks.bench_decode [image]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from src.yad80.decoder import boundaries, decode
+from src.yad80.exceptions import InstructionError
+from src.yad80.memory import Memory
+from src.yad80.mnemonic import MNEMONIC
+
+DEFAULT_IMAGE = Path(__file__).parent.parent / "tests" / "zilog.bin"
+REPEAT = 200
+
+
+def handler_decode(mem):
+    addr = mem.addr
+    op = mem.next_byte()
+    if op is None:
+        return None
+    inst = MNEMONIC[op](op, mem)
+    inst.addr = addr
+    inst.code = mem[addr : mem.addr]
+    inst.length = len(inst.code)
+    return inst
+
+
+def decode_all(func, mem):
+    count = 0
+    mem.rewind()
+    while True:
+        try:
+            inst = func(mem)
+        except (InstructionError, TypeError):
+            break
+        if inst is None:
+            break
+        count += 1
+    return count
+
+
+def count_boundaries(mem):
+    return sum(1 for _ in boundaries(mem, mem.min_addr))
+
+
+def measure(funcs, mem):
+    """(count, best seconds) of every func, the runs are interleaved so that
+    a change of the machine load affects all of them alike"""
+    best = [None] * len(funcs)
+    counts = [0] * len(funcs)
+    for _ in range(REPEAT):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            counts[n] = func(mem)
+            elapsed = time.perf_counter() - start
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    return list(zip(counts, best))
+
+
+def main():
+    image = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_IMAGE
+    mem = Memory(image.read_bytes())
+    funcs = {
+        "handlers": lambda mem: decode_all(handler_decode, mem),
+        "tables": lambda mem: decode_all(decode, mem),
+        "lengths": count_boundaries,
+    }
+    results = {}
+    for name, (count, elapsed) in zip(funcs, measure(list(funcs.values()), mem)):
+        results[name] = elapsed
+        print(f"{name:10}{count:8} insts {elapsed * 1000:8.2f} ms")
+    for name in ["tables", "lengths"]:
+        print(f"{name:10}speedup {results['handlers'] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""throughput of yad80 on synthetic images, results are written as JSON
+
+simple  disasm_nlines of the whole image
+eager   Disassembler.analyse and render
+decode  decode every instruction of the image without formatting
+render  render of an analysis made beforehand
+
+python -m benchmarks.bench_suite [--output FILE] [--compare FILE]
+"""
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.images import KINDS, SIZES, generate
+from src.yad80.disasm import disasm_iter, disasm_nlines
+from src.yad80.eager import Disassembler
+from src.yad80.memory import Memory
+from src.yad80.output import Writer
+from src.yad80.listing import render
+
+REPEAT = 5
+DEFAULT_OUTPUT = "bench.json"
+
+
+def run_simple(mem):
+    disasm_nlines(mem, mem.min_addr, 0, Writer(io.StringIO()))
+
+
+def run_eager(mem):
+    analysis = Disassembler().analyse(mem)
+    Writer(io.StringIO()).write_lines(render(analysis))
+
+
+def run_decode(mem):
+    return sum(1 for _ in disasm_iter(mem, mem.min_addr))
+
+
+def render_runner(mem):
+    analysis = Disassembler().analyse(mem)
+
+    def run_render(_):
+        Writer(io.StringIO()).write_lines(render(analysis))
+
+    return run_render
+
+
+def measure(func, mem, repeat):
+    """best time of repeat runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(mem)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_image(image, repeat):
+    mem = Memory(image)
+    result = {
+        "bytes": len(image),
+        "instructions": run_decode(mem),
+        "reached": len(Disassembler().analyse(mem).instructions),
+    }
+    runners = [
+        ("simple", run_simple),
+        ("eager", run_eager),
+        ("decode", run_decode),
+        ("render", render_runner(mem)),
+    ]
+    for name, func in runners:
+        result[name] = measure(func, mem, repeat)
+    return result
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except OSError:
+        return None
+    return commit.stdout.strip() or None
+
+
+def bench_all(kinds, sizes, repeat):
+    results = {}
+    for kind in kinds:
+        for size in sizes:
+            name = f"{kind}-{size}"
+            results[name] = bench_image(generate(kind, SIZES[size]), repeat)
+            print(format_result(name, results[name]), flush=True)
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def format_result(name, result):
+    times = " ".join(
+        f"{path} {result[path] * 1000:8.2f} ms"
+        for path in ["simple", "eager", "decode", "render"]
+    )
+    return f"{name:12}{result['instructions']:7} insts {times}"
+
+
+def compare(old, new):
+    """ratio lines of the new times to the old ones, below 1.0 is faster"""
+    for name, result in new["results"].items():
+        base = old["results"].get(name)
+        if base is None:
+            continue
+        ratios = " ".join(
+            f"{path} {result[path] / base[path]:5.2f}"
+            for path in ["simple", "eager", "decode", "render"]
+        )
+        yield f"{name:12}{ratios}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_suite")
+    parser.add_argument("--kind", nargs="*", choices=KINDS, default=KINDS)
+    parser.add_argument("--size", nargs="*", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON results")
+    parser.add_argument("--compare", default=None, help="JSON results of a base run")
+    args = parser.parse_args(argv)
+
+    results = bench_all(args.kind, args.size, args.repeat)
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare is not None:
+        old = json.loads(Path(args.compare).read_text())
+        print(f"against {old.get('commit')}")
+        for line in compare(old, results):
+            print(line)
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
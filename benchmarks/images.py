@@ -0,0 +1,179 @@
+"""deterministic synthetic Z80 images built from the decode tables
+
+random  valid instructions of every table in random order
+branch  straight code with a branch, call or return every few instructions
+mixed   branch dense routines and data blocks, every routine is called from
+        the start and its data is referred to by LD instructions. data bytes
+        are never DD, ED or FD, so simple mode decodes the whole image.
+
+every branch target is an instruction start, so eager mode never decodes
+from the middle of an instruction.
+"""
+
+import random
+
+from src.yad80.decoder import OPERAND, REL, TABLES, WORD
+from src.yad80.instruction import FALL, RETURN
+
+SIZES = {"4k": 0x1000, "16k": 0x4000, "64k": 0x10000}
+KINDS = ["random", "branch", "mixed"]
+SEED = 80
+
+# code bytes before the opcode of each table, ddcb/fdcb have a displacement
+TABLE_PREFIX = {
+    "main": [],
+    "cb": [0xCB],
+    "ed": [0xED],
+    "dd": [0xDD],
+    "fd": [0xFD],
+    "ddcb": [0xDD, 0xCB],
+    "fdcb": [0xFD, 0xCB],
+}
+
+CALL = 0xCD
+HALT = 0x76
+RET = 0xC9
+LD_A_NN = 0x3A
+LD_HL_NN = 0x21
+
+DATA_BYTES = [b for b in range(256) if b not in {0xDD, 0xED, 0xFD}]
+TEXT_BYTES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+
+
+def opcodes(select):
+    """(table name, opcode) of the valid instructions which select(entry)"""
+    return [
+        (name, op)
+        for name, table in TABLES.items()
+        for op, entry in enumerate(table)
+        if entry is not None and select(entry)
+    ]
+
+
+# a constant target, e.g. of RST, may be in the middle of an instruction
+ANY_OPCODES = opcodes(lambda entry: entry[5] in {None, OPERAND})
+FALL_OPCODES = opcodes(lambda entry: entry[3] == FALL)
+BRANCH_OPCODES = opcodes(
+    lambda entry: entry[5] == OPERAND or (entry[3] == RETURN and entry[4])
+)
+
+
+def encode(rnd, name, op):
+    """(code bytes with random operands, decode table entry)"""
+    entry = TABLES[name][op]
+    prefix = TABLE_PREFIX[name]
+    if name in {"ddcb", "fdcb"}:
+        return bytes(prefix + [rnd.randrange(256), op]), entry
+    operands = [rnd.randrange(256) for _ in range(entry[0] - len(prefix) - 1)]
+    return bytes(prefix + [op] + operands), entry
+
+
+def link(rnd, items, base):
+    """code of (code, entry) items at base, branch targets are item starts"""
+    starts = []
+    addr = base
+    for code, _ in items:
+        starts.append(addr)
+        addr += len(code)
+
+    image = bytearray()
+    for n, (code, entry) in enumerate(items):
+        code = bytearray(code)
+        addr = starts[n]
+        if entry is not None and entry[5] == OPERAND:
+            for _, kind, pos, _ in entry[7]:
+                if kind == REL:
+                    near = starts[max(0, n - 40) : n + 40]
+                    target = rnd.choice(
+                        [s for s in near if -126 <= s - addr <= 129]
+                    )
+                    code[pos] = (target - addr - 2) & 0xFF
+                elif kind == WORD:
+                    target = rnd.choice(starts)
+                    code[pos : pos + 2] = [target & 0xFF, target >> 8]
+        image += code
+    return image
+
+
+def random_image(size, rnd):
+    items = []
+    length = 0
+    while True:
+        code, entry = encode(rnd, *rnd.choice(ANY_OPCODES))
+        if length + len(code) > size:
+            break
+        items.append((code, entry))
+        length += len(code)
+    return link(rnd, items, 0) + bytes(size - length)
+
+
+def routine(rnd, base, size, data=()):
+    """branch dense code at base which ends with RET
+
+    data is a list of addresses which are loaded by LD instructions.
+    """
+    items = []
+    length = 1  # RET
+    data = list(data)
+    while True:
+        if data:
+            addr = data.pop()
+            op = rnd.choice([LD_A_NN, LD_HL_NN])
+            item = (bytes([op, addr & 0xFF, addr >> 8]), None)
+        elif rnd.randrange(4) == 0:
+            item = encode(rnd, *rnd.choice(BRANCH_OPCODES))
+        else:
+            item = encode(rnd, *rnd.choice(FALL_OPCODES))
+        if length + len(item[0]) > size:
+            break
+        items.append(item)
+        length += len(item[0])
+    items.append((bytes([RET]), None))
+    return link(rnd, items, base)
+
+
+def branch_image(size, rnd):
+    image = routine(rnd, 0, size)
+    return image + bytes(size - len(image))
+
+
+def mixed_image(size, rnd):
+    """CALLs of every routine and HALT at 0, then routines and data blocks"""
+    blocks = []
+    count = max(1, size // 0x400)
+    head = 3 * count + 1
+    addr = head
+    for _ in range(count):
+        routine_size = rnd.randrange(0x100, 0x300)
+        data_size = rnd.randrange(0x40, 0x100)
+        if addr + routine_size + data_size > size:
+            break
+        data = [addr + routine_size + n for n in range(0, data_size, 0x20)]
+        code = routine(rnd, addr, routine_size, data)
+        if rnd.randrange(2):
+            block = bytes(rnd.choice(DATA_BYTES) for _ in range(data_size))
+        else:
+            block = bytes(rnd.choice(TEXT_BYTES) for _ in range(data_size))
+        blocks.append((addr, code))
+        addr += len(code)
+        blocks.append((None, block))
+        addr += len(block)
+
+    image = bytearray()
+    for start, _ in blocks:
+        if start is not None:
+            image += bytes([CALL, start & 0xFF, start >> 8])
+    image += bytes([HALT])
+    image += bytes(head - len(image))
+    for _, block in blocks:
+        image += block
+    return image + bytes(size - len(image))
+
+
+GENERATORS = {"random": random_image, "branch": branch_image, "mixed": mixed_image}
+
+
+def generate(kind, size, seed=SEED):
+    """image bytes of kind and size, the same bytes for the same arguments"""
+    rnd = random.Random(f"{kind}:{size}:{seed}")
+    return bytes(GENERATORS[kind](size, rnd))
@@ -1,5 +1,38 @@
-from .disasm import disasm_line, disasm_nlines
-from .exceptions import AddressError, InstructionError
-from .memory import Memory
+# names are imported on first use, so that the command line tools start
+# without the modules they do not need.
+_MODULES = {
+    "Memory": "memory",
+    "Instruction": "instruction",
+    "BasicBlock": "cfg",
+    "ControlFlowGraph": "cfg",
+    "CallGraph": "cfg",
+    "disasm_nlines": "disasm",
+    "disasm_line": "disasm",
+    "length_at": "decoder",
+    "boundaries": "decoder",
+    "Disassembler": "eager",
+    "Analysis": "eager",
+    "Profile": "profiling",
+    "render": "listing",
+    "load": "loader",
+    "AddressError": "exceptions",
+    "InstructionError": "exceptions",
+    "FileFormatError": "exceptions",
+}
 
-__all__ = ["Memory", "disasm_nlines", "disasm_line", "AddressError", "InstructionError"]
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,77 @@
+import copy
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from .eager import disasm_eagerly
+from .memory import RAM, Memory
+from .output import Writer
+
+
+def split_banks(data, window):
+    """(bank number, block) for every window sized bank of data"""
+    size = len(window)
+    for number, index in enumerate(range(0, len(data), size)):
+        yield number, bytes(data[index : index + size])
+
+
+def unit_args(args, mem):
+    """args with the addresses which are within mem"""
+    args = copy.copy(args)
+    args.code = [rng for rng in args.code if mem.addr_in(rng.start)]
+    args.string = [rng for rng in args.string if mem.addr_in(rng.start)]
+    args.addr = [addr for addr in args.addr if mem.addr_in(addr)]
+    return args
+
+
+def analyse_unit(args, header, segments, prefix=""):
+    """(listing, instructions) of the memory made of (addr, block, kind) segments
+
+    addresses outside the segments, including the other banks, are external.
+    every label name starts with prefix.
+    """
+    mem = Memory()
+    for addr, block, kind in segments:
+        mem.add_segment(addr, block, kind)
+    fp = io.StringIO()
+    name = f"{args.FILE} {header[2:]}"
+    unit = unit_args(args, mem)
+    count = disasm_eagerly(unit, mem, Writer(fp), name=name, prefix=prefix)
+    return fp.getvalue(), count
+
+
+def disasm_banks(args, data, common, out, jobs=0):
+    """analyse the common segments and every bank of data independently
+
+    the banks are mapped at args.bank in turn and analysed in a process pool
+    of jobs(0 for the number of CPUs) processes. the labels of bank NN are
+    prefixed with BNN_, so that no two banks define the same label. returns
+    the number of instructions of all units.
+    """
+    units = []
+    if common:
+        units.append(("; common", common, ""))
+    window = args.bank
+    for number, block in split_banks(data, window):
+        header = f"; bank {number:02x}: {window.start:04x}-{window.stop - 1:04x}"
+        units.append((header, [(window.start, block, RAM)], f"B{number:02X}_"))
+
+    if jobs == 1 or len(units) == 1:
+        results = [analyse_unit(args, *unit) for unit in units]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+            results = list(
+                executor.map(analyse_unit, [args] * len(units), *zip(*units))
+            )
+
+    for (header, _, _), (listing, _) in zip(units, results):
+        if args.format == "jsonl":
+            out.write(json.dumps({"type": "unit", "name": header[2:]}))
+            out.write_lines(listing.splitlines())
+            continue
+        out.write(header)
+        out.write("")
+        out.write_lines(listing.splitlines())
+        out.write("")
+    out.flush()
+    return sum(count for _, count in results)
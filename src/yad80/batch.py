@@ -0,0 +1,218 @@
+"""disassemble many files in a process pool
+
+the listing of NAME.ext is written next to it as NAME.ext.asm. with --outdir,
+the directories below a directory or the fixed part of a glob pattern are made
+again under --outdir. an option file NAME.ext.opt next to an input is used for
+that input. with --sqlite, every analysis is exported to one database.
+"""
+
+import argparse
+import glob
+import io
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from .cli import cli_main
+
+LISTING_SUFFIX = ".asm"
+OPTION_SUFFIX = ".opt"
+
+
+def glob_base(pattern):
+    """directory of the parts of pattern before the first wildcard"""
+    base = []
+    for part in Path(pattern).parts:
+        if glob.has_magic(part):
+            break
+        base.append(part)
+    return Path(*base)
+
+
+def find_inputs(paths):
+    """(file, base) of paths, a path is a file, a directory or a glob pattern
+
+    base is the directory which the listing path under --outdir is relative to.
+    a file named more than once is taken the first time.
+    """
+    inputs = []
+    seen = set()
+    for path in paths:
+        if glob.has_magic(path):
+            base = glob_base(path)
+            candidates = [Path(p) for p in sorted(glob.glob(path, recursive=True))]
+        elif Path(path).is_dir():
+            base = Path(path)
+            candidates = sorted(base.iterdir())
+        else:
+            base = Path(path).parent
+            candidates = [Path(path)]
+        for file in candidates:
+            if not file.is_file() or file.name.startswith("."):
+                continue
+            if file.suffix.lower() in {LISTING_SUFFIX, OPTION_SUFFIX}:
+                continue
+            resolved = file.resolve()
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            inputs.append((file, base))
+    return inputs
+
+
+def disasm_file(file, output, options):
+    """(instructions, error message or None) of a yad80 run for file"""
+    argv = list(options)
+    option_file = file.with_name(file.name + OPTION_SUFFIX)
+    if option_file.exists():
+        argv += ["--option", str(option_file)]
+    argv += ["--output", str(output), "--", str(file)]
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # the listing of an earlier run is not taken for this one
+    output.unlink(missing_ok=True)
+    fp = io.StringIO()
+    err = io.StringIO()
+    try:
+        with redirect_stdout(fp), redirect_stderr(err):
+            count = cli_main(argv)
+    except SystemExit as e:
+        # e.g. an invalid option in the option file
+        if e.code:
+            lines = err.getvalue().strip().splitlines()
+            return 0, lines[-1] if lines else f"exit status {e.code}"
+        count = None
+    except Exception as e:
+        return 0, str(e)
+    sys.stderr.write(err.getvalue())
+    message = fp.getvalue().strip()
+    if message:
+        return 0, message.splitlines()[0]
+    if count is None or not output.exists():
+        return 0, "no listing written"
+    return count, None
+
+
+def output_path(file, base, outdir):
+    name = file.name + LISTING_SUFFIX
+    if outdir is None:
+        return file.with_name(name)
+    try:
+        relative = file.parent.relative_to(base)
+    except ValueError:
+        relative = Path()
+    return Path(outdir) / relative / name
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="yad80-batch")
+    parser.add_argument(
+        "--eager", "-e", action="store_true", help="disasm eagerly(default false)"
+    )
+    parser.add_argument(
+        "--max-lines",
+        "-m",
+        type=int,
+        default=None,
+        metavar="N",
+        help="max lines to output in simple mode, 0 for no limit",
+    )
+    parser.add_argument(
+        "--outdir", metavar="DIR", default=None, help="directory for the listings"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="processes, 0 for the number of CPUs(default 0)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="neither use nor store the cached listing",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="DB",
+        default=None,
+        help="export every analysis to the sqlite DB(eager)",
+    )
+    parser.add_argument(
+        "PATH", nargs="+", help="file, directory or glob pattern to disasm"
+    )
+    return parser
+
+
+def batch_main(argv):
+    """disassemble every input, print and return the summary"""
+    args = build_parser().parse_args(argv)
+    options = []
+    if args.max_lines is not None:
+        options += ["--max-lines", str(args.max_lines)]
+    if args.eager:
+        options.append("--eager")
+    if args.no_cache:
+        options.append("--no-cache")
+    if args.sqlite is not None:
+        options += ["--sqlite", str(Path(args.sqlite).resolve())]
+    if args.outdir is not None:
+        Path(args.outdir).mkdir(parents=True, exist_ok=True)
+
+    inputs = find_inputs(args.PATH)
+    files = [file for file, _ in inputs]
+    outputs = [output_path(file, base, args.outdir) for file, base in inputs]
+    # a listing path used twice fails for all but its first file
+    results = [None] * len(files)
+    owners = {}
+    jobs = []
+    for n, output in enumerate(outputs):
+        owner = owners.setdefault(output.resolve(), n)
+        if owner == n:
+            jobs.append(n)
+        else:
+            results[n] = (0, f"same listing {output} as {files[owner]}")
+
+    job_files = [files[n] for n in jobs]
+    job_outputs = [outputs[n] for n in jobs]
+    start = time.perf_counter()
+    if args.jobs == 1 or len(jobs) <= 1:
+        done = [disasm_file(*job, options) for job in zip(job_files, job_outputs)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as executor:
+            done = list(
+                executor.map(
+                    disasm_file, job_files, job_outputs, [options] * len(jobs)
+                )
+            )
+    elapsed = time.perf_counter() - start
+    for n, result in zip(jobs, done):
+        results[n] = result
+
+    failures = [(file, error) for file, (_, error) in zip(files, results) if error]
+    summary = {
+        "files": len(files),
+        "bytes": sum(file.stat().st_size for file in files),
+        "instructions": sum(count for count, _ in results),
+        "time": elapsed,
+        "failures": len(failures),
+    }
+    print(
+        f"files: {summary['files']}, bytes: {summary['bytes']}, "
+        f"instructions: {summary['instructions']}, time: {elapsed:.2f}s, "
+        f"failures: {summary['failures']}"
+    )
+    for file, error in failures:
+        print(f"  {file}: {error}")
+    return summary
+
+
+def main():
+    batch_main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""regenerate decode_tables.py from the opcode handlers
+
+python -m yad80.build_tables
+"""
+
+from .decoder import write_tables
+
+if __name__ == "__main__":
+    write_tables()
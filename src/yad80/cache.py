@@ -0,0 +1,161 @@
+"""on-disk cache of listings
+
+a listing is stored under a digest of the yad80 sources, the memory contents
+and the options which affect the output. the first line of a cache file is the
+number of instructions of the listing. the least recently used listings are
+removed when the cache grows over its size limit.
+"""
+
+import hashlib
+import json
+import os
+from functools import cache
+from pathlib import Path
+
+CACHE_SIZE = 64 * 1024 * 1024
+
+# the count is written when the listing is complete, over a line of this width
+COUNT_WIDTH = 10
+
+
+def cache_dir():
+    directory = os.environ.get("YAD80_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    return Path.home() / ".cache" / "yad80"
+
+
+@cache
+def source_digest():
+    """digest of the package sources, a new version never hits old listings"""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def normalized_args(args):
+    def ranges(rngs):
+        return [[rng.start, rng.stop] for rng in rngs]
+
+    return {
+        "eager": args.eager,
+        "code": ranges(args.code),
+        "string": ranges(args.string),
+        "addr": list(args.addr),
+        "range": None if args.range is None else ranges([args.range])[0],
+        "max_lines": args.max_lines,
+        "offset": args.offset,
+        "format": args.format,
+    }
+
+
+def cache_key(args, mem):
+    digest = hashlib.sha256(source_digest().encode())
+    digest.update(json.dumps(normalized_args(args), sort_keys=True).encode())
+    digest.update(json.dumps([mem.start] + mem.entries).encode())
+    for segment in mem.segments:
+        digest.update(f"{segment.start:x} {len(segment):x} {segment.kind};".encode())
+        digest.update(segment.block)
+    return digest.hexdigest()
+
+
+class CacheEntry:
+    """listing written to a temporary file of the cache until commit()
+
+    the text is not kept in memory. an entry which grows over limit is
+    dropped and the rest of the text is ignored.
+    """
+
+    def __init__(self, path, limit):
+        self.path = path
+        self.temp = path.with_suffix(f".{os.getpid()}.tmp")
+        self.limit = limit
+        self.size = 0
+        self.fp = open(self.temp, "w")
+        self.fp.write(" " * COUNT_WIDTH + "\n")
+
+    def write(self, text):
+        if self.fp is None:
+            return
+        self.size += len(text)
+        if self.size > self.limit:
+            self.discard()
+            return
+        self.fp.write(text)
+
+    def discard(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+            self.temp.unlink(missing_ok=True)
+
+    def commit(self, instructions):
+        """put the listing in place, False if it was dropped"""
+        if self.fp is None:
+            return False
+        self.fp.seek(0)
+        self.fp.write(f"{instructions:>{COUNT_WIDTH}}")
+        self.fp.close()
+        self.fp = None
+        os.replace(self.temp, self.path)
+        return True
+
+
+class ResultCache:
+    def __init__(self, directory=None, size=CACHE_SIZE):
+        self.directory = cache_dir() if directory is None else Path(directory)
+        self.size = size
+
+    def path(self, key):
+        return self.directory / f"{key}.lst"
+
+    def get(self, key):
+        """(instructions, listing) or None, a hit makes it the most recently used"""
+        path = self.path(key)
+        try:
+            text = path.read_text()
+        except FileNotFoundError:
+            return None
+        count, _, listing = text.partition("\n")
+        try:
+            count = int(count)
+        except ValueError:
+            # e.g. emptied by an eviction of another process
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return count, listing
+
+    def entry(self, key):
+        """CacheEntry of key, commit() it with commit()"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return CacheEntry(self.path(key), self.size)
+
+    def commit(self, entry, instructions):
+        if entry.commit(instructions):
+            self.evict()
+
+    def put(self, key, text, instructions):
+        entry = self.entry(key)
+        entry.write(text)
+        self.commit(entry, instructions)
+
+    def evict(self):
+        """remove the least recently used listings over the size limit"""
+        entries = []
+        for path in self.directory.glob("*.lst"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
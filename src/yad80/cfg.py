@@ -0,0 +1,185 @@
+from bisect import bisect_right
+
+from .instruction import CALL, FALL, JUMP
+
+
+def falls_through(inst):
+    """True if the next instruction can be executed after inst"""
+    return inst.flow in {FALL, CALL} or inst.conditional
+
+
+class BasicBlock:
+    """straight-line run of instructions, end is an exclusive address"""
+
+    __slots__ = ("start", "end", "instructions", "successors", "predecessors")
+
+    def __init__(self, instructions):
+        self.start = instructions[0].addr
+        self.end = instructions[-1].addr + instructions[-1].length
+        self.instructions = instructions
+        self.successors = []
+        self.predecessors = []
+
+    def __repr__(self):
+        return f"BasicBlock({self.start:04x}-{self.end - 1:04x}, {self.exit})"
+
+    def __contains__(self, addr):
+        return self.start <= addr < self.end
+
+    @property
+    def last(self):
+        return self.instructions[-1]
+
+    @property
+    def exit(self):
+        """flow of the last instruction: fallthrough, jump, call, return or halt"""
+        return self.last.flow
+
+
+class ControlFlowGraph:
+    """basic blocks of decoded instructions and the edges between them
+
+    a call is not an edge, the block after a call is its successor.
+    call targets are in call_graph.
+    """
+
+    def __init__(self, instructions, entries=()):
+        insts = {inst.addr: inst for inst in instructions}
+        self.blocks = {}
+        leaders = find_leaders(insts)
+        for leader in sorted(leaders):
+            block = BasicBlock(collect_block(insts, leader, leaders))
+            self.blocks[block.start] = block
+        self.starts = sorted(self.blocks.keys())
+        self._entries = set(addr for addr in entries if addr in self.blocks)
+        self._call_graph = None
+
+        for block in self.blocks.values():
+            last = block.last
+            if falls_through(last) and block.end in self.blocks:
+                block.successors.append(block.end)
+            if last.flow == JUMP and last.target in self.blocks:
+                if last.target not in block.successors:
+                    block.successors.append(last.target)
+            for addr in block.successors:
+                self.blocks[addr].predecessors.append(block.start)
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return (self.blocks[addr] for addr in self.starts)
+
+    def block_at(self, addr):
+        """block containing addr, or None"""
+        index = bisect_right(self.starts, addr) - 1
+        if index < 0:
+            return None
+        block = self.blocks[self.starts[index]]
+        return block if addr in block else None
+
+    @property
+    def entries(self):
+        """given entry points and start addresses of blocks without predecessors"""
+        return [
+            addr
+            for addr in self.starts
+            if addr in self._entries or not self.blocks[addr].predecessors
+        ]
+
+    @property
+    def call_graph(self):
+        if self._call_graph is None:
+            self._call_graph = CallGraph(self)
+        return self._call_graph
+
+
+def find_leaders(insts):
+    leaders = set()
+    fall_in = {}
+    for inst in insts.values():
+        end = inst.addr + inst.length
+        if inst.flow != FALL and end in insts:
+            leaders.add(end)
+        if inst.flow in {JUMP, CALL} and inst.target in insts:
+            leaders.add(inst.target)
+        if falls_through(inst):
+            fall_in[end] = fall_in.get(end, 0) + 1
+
+    for addr in insts:
+        if fall_in.get(addr, 0) != 1:
+            leaders.add(addr)
+    return leaders
+
+
+def collect_block(insts, leader, leaders):
+    block = []
+    addr = leader
+    while True:
+        inst = insts[addr]
+        block.append(inst)
+        addr += inst.length
+        if inst.flow != FALL or addr not in insts or addr in leaders:
+            break
+    return block
+
+
+class CallGraph:
+    """routines and CALL/RST edges between them
+
+    a routine is identified by its entry address, a call target or an entry
+    of the control flow graph. targets outside the decoded code are routines
+    without blocks.
+    """
+
+    def __init__(self, cfg):
+        self.sites = {}
+        for block in cfg:
+            last = block.last
+            if last.flow == CALL and last.target is not None:
+                self.sites.setdefault(last.target, []).append(last.addr)
+
+        entries = set(self.sites.keys()) | set(cfg.entries)
+        self.routines = {}
+        for entry in sorted(entries):
+            self.routines[entry] = reachable_blocks(cfg, entry, entries)
+
+        self.calls = {entry: set() for entry in self.routines}
+        self._callers = {}
+        for entry, starts in self.routines.items():
+            for start in starts:
+                last = cfg.blocks[start].last
+                if last.flow != CALL or last.target is None:
+                    continue
+                self.calls[entry].add(last.target)
+                self._callers.setdefault(last.target, set()).add(entry)
+
+    def callees(self, entry):
+        """entries of routines called from the routine"""
+        return self.calls.get(entry, set())
+
+    def callers(self, entry):
+        """entries of routines which call the routine"""
+        return self._callers.get(entry, set())
+
+    def call_sites(self, target):
+        """addresses of CALL/RST instructions to target"""
+        return sorted(self.sites.get(target, []))
+
+    def routines_of(self, addr):
+        """entries of routines containing the block at addr"""
+        return {entry for entry, starts in self.routines.items() if addr in starts}
+
+
+def reachable_blocks(cfg, entry, entries):
+    if entry not in cfg.blocks:
+        return set()
+    found = {entry}
+    stack = [entry]
+    while stack:
+        for addr in cfg.blocks[stack.pop()].successors:
+            if addr in found or addr in entries:
+                continue
+            found.add(addr)
+            stack.append(addr)
+    return found
@@ -1,12 +1,16 @@
 import argparse
 import re
 import sys
-import traceback
+from functools import partial
 from pathlib import Path
 
-from .disasm import disasm_nlines
-from .eager import disasm_eagerly
-from .loader import load
+from .exceptions import AddressError, FileFormatError, InstructionError
+from .loader import load, load_segment, read_file
+from .memory import RAM, ROM
+from .output import Capture, open_writer
+
+# the eager engine, the cache, the servers and the debug aids are imported
+# where they are used, a simple run starts without them
 
 DEFAULT_MAX_LINES = 32
 
@@ -34,6 +38,13 @@ def parse_range(arg):
     return range(start, stop)
 
 
+def parse_segment(arg):
+    addr, sep, file = arg.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"invalid segment: {arg}")
+    return parse_addr(addr), check_file(file)
+
+
 def parse_option_file(file):
     if not Path(file).exists():
         raise argparse.ArgumentTypeError(f"'{file}' not found")
@@ -56,8 +67,18 @@ def parse_option_file(file):
                 "-a",
                 "--max-lines",
                 "-m",
+                "--range",
+                "-r",
                 "--offset",
                 "-o",
+                "--output",
+                "--load",
+                "--rom",
+                "--bank",
+                "--jobs",
+                "--no-cache",
+                "--format",
+                "--sqlite",
             }:
                 raise argparse.ArgumentTypeError(f"unrecognized option {cols[0]}")
             options.extend(cols)
@@ -86,6 +107,38 @@ def build_parser():
         default=0,
         help="address offset for binary file",
     )
+    parser.add_argument(
+        "--load",
+        action="extend",
+        nargs="*",
+        type=parse_segment,
+        default=[],
+        metavar="ADDR:FILE",
+        help="binary file to map at ADDR as RAM",
+    )
+    parser.add_argument(
+        "--rom",
+        action="extend",
+        nargs="*",
+        type=parse_segment,
+        default=[],
+        metavar="ADDR:FILE",
+        help="binary file to map at ADDR as ROM",
+    )
+    parser.add_argument(
+        "--bank",
+        type=parse_range,
+        default=None,
+        metavar="RANGE",
+        help="window address range(a1-a2) of the banks in FILE(eager)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="processes to analyse banks, 0 for the number of CPUs(default 0)",
+    )
     parser.add_argument(
         "--addr",
         "-a",
@@ -116,13 +169,64 @@ def build_parser():
         metavar="RANGE",
         help="address range(a1-a2) as string. a2 is an inclusive address",
     )
+    parser.add_argument(
+        "--range",
+        "-r",
+        type=parse_range,
+        default=None,
+        metavar="RANGE",
+        help="address range(a1-a2) to disasm simply. a2 is an inclusive address",
+    )
     parser.add_argument(
         "--max-lines",
         "-m",
         type=int,
         default=DEFAULT_MAX_LINES,
         metavar="N",
-        help=f"max lines to output(default {DEFAULT_MAX_LINES})",
+        help=f"max lines to output, 0 for no limit(default {DEFAULT_MAX_LINES})",
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", default=None, help="output file(default stdout)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="listing format, jsonl for a JSON record per line(default text)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="neither use nor store the cached listing",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="DB",
+        default=None,
+        help="export instructions, labels and xrefs to the sqlite DB(eager)",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="SOCKET",
+        help="answer JSON requests on the Unix socket(default stdin/stdout)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="report the time of each phase to stderr, FILE for cProfile stats(eager)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        default=False,
+        help="render --output again whenever FILE or the option file changes",
     )
     parser.add_argument("FILE", type=check_file, help="file to disasm")
     parser.add_argument(
@@ -146,33 +250,183 @@ def parse_args(args):
     base.code.extend(parsed.code)
     base.string.extend(parsed.string)
     base.addr.extend(parsed.addr)
+    base.load.extend(parsed.load)
+    base.rom.extend(parsed.rom)
     base.eager = base.eager or parsed.eager
     base.debug = base.debug or parsed.debug
+    base.no_cache = base.no_cache or parsed.no_cache
+    base.watch = base.watch or parsed.watch
     if parsed.max_lines != DEFAULT_MAX_LINES:
         base.max_lines = parsed.max_lines
     if parsed.offset != 0:
         base.offset = parsed.offset
+    if parsed.output is not None:
+        base.output = parsed.output
+    if parsed.format != "text":
+        base.format = parsed.format
+    if parsed.sqlite is not None:
+        base.sqlite = parsed.sqlite
+    if parsed.range is not None:
+        base.range = parsed.range
+    if parsed.bank is not None:
+        base.bank = parsed.bank
+    if parsed.serve is not None:
+        base.serve = parsed.serve
+    if parsed.profile is not None:
+        base.profile = parsed.profile
+    if parsed.jobs != 0:
+        base.jobs = parsed.jobs
 
     return base
 
 
 def cli_main(argv):
+    """run yad80 with argv, returns the number of instructions of the listing
+
+    None when there is no listing, e.g. on an error.
+    """
     args = parse_args(argv)
     if args.debug:
         print(args)
-    mem = load(args.FILE, args.offset)
+    if args.watch:
+        if args.output is None:
+            print("--watch needs --output")
+            return
+        # watch depends on this module
+        from .watch import watch
+
+        watch(argv)
+        return
+    if args.profile is not None and not args.eager:
+        print("--profile needs --eager")
+        return
+    if args.sqlite is not None and not args.eager:
+        print("--sqlite needs --eager")
+        return
+    if args.bank is not None:
+        return disasm_banked(args)
+
+    try:
+        mem = load_memory(args)
+    except (AddressError, FileFormatError) as e:
+        print(e)
+        return
+
+    if args.serve is not None:
+        run_server(args, mem)
+        return
 
     if args.eager:
+        render = partial(run_eager, args, mem)
+    else:
+        render = simple_renderer(args, mem)
+        if render is None:
+            return
+
+    # a profile measures the analysis, not the cache. an export needs it too
+    cache = None
+    if not args.no_cache and args.profile is None and args.sqlite is None:
+        from .cache import ResultCache, cache_key
+
+        cache = ResultCache()
+    with open_writer(args.output) as out:
+        if cache is None:
+            return render(out=out)
+        key = cache_key(args, mem)
+        cached = cache.get(key)
+        if cached is not None:
+            count, text = cached
+            out.write_text(text)
+            return count
+        entry = cache.entry(key)
+        out.fp = Capture(out.fp, entry)
         try:
-            disasm_eagerly(args, mem)
-        except Exception as e:
-            if args.debug:
-                traceback.print_exception(e)
-            else:
-                print(f"Exception {e}")
+            count = render(out=out)
+            if count is not None:
+                out.flush()
+                cache.commit(entry, count)
+        finally:
+            entry.discard()
+        return count
+
+
+def print_traceback(e):
+    import traceback
+
+    traceback.print_exception(e)
+
+
+def load_memory(args):
+    """memory of FILE and the --load and --rom segments"""
+    mem = load(args.FILE, args.offset)
+    for kind, segments in [(RAM, args.load), (ROM, args.rom)]:
+        for addr, file in segments:
+            load_segment(mem, file, addr, kind)
+    return mem
+
+
+def run_eager(args, mem, out):
+    """eager listing to out, returns the number of instructions, None on an error"""
+    from .eager import disasm_eagerly
+
+    profile = profiler = None
+    if args.profile is not None:
+        from .profiling import Profile
+
+        profile = Profile()
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    try:
+        if profiler is None:
+            count = disasm_eagerly(args, mem, out, profile)
+        else:
+            count = profiler.runcall(disasm_eagerly, args, mem, out, profile)
+    except (AddressError, InstructionError) as e:
+        if args.debug:
+            print_traceback(e)
+        else:
+            print(e)
+        return None
+    except Exception as e:
+        if args.debug:
+            print_traceback(e)
+        else:
+            print(f"Exception {e}")
+        return None
+    if profiler is not None:
+        profiler.dump_stats(args.profile)
+    if profile is not None:
+        print("\n".join(profile.report()), file=sys.stderr)
+    return count
+
+
+def run_server(args, mem):
+    """analyse mem eagerly and answer the requests until the input ends"""
+    from .eager import Disassembler
+    from .server import Session, serve
+
+    try:
+        analysis = Disassembler(args.code, args.string, args.addr).analyse(mem)
+    except (AddressError, InstructionError) as e:
+        print(e)
         return
+    serve(Session(analysis), args.serve)
+
 
-    if not args.addr:
+def simple_renderer(args, mem):
+    """run_simple with the range of args, None for invalid args"""
+    max_lines = args.max_lines
+    stop = None
+    if args.range is not None:
+        if args.addr:
+            print("both --addr and --range specified")
+            return
+        start_addr, stop = args.range.start, args.range.stop
+        if max_lines == DEFAULT_MAX_LINES:
+            max_lines = 0
+    elif not args.addr:
         start_addr = mem.start
     elif len(args.addr) == 1:
         start_addr = args.addr[0]
@@ -180,7 +434,42 @@ def cli_main(argv):
         print(f"mulitple address {args.addr} specified")
         return
 
-    disasm_nlines(mem, start_addr, args.max_lines)
+    return partial(run_simple, mem, start_addr, max_lines, stop, args.format)
+
+
+def run_simple(mem, addr, max_lines, stop, format, out):
+    """simple listing to out, returns the number of instructions, None on an error"""
+    # imported here, a listing from the result cache needs no decoder
+    from .disasm import disasm_nlines, text_line
+
+    formatter = text_line
+    if format == "jsonl":
+        from .jsonl import inst_line as formatter
+    try:
+        return disasm_nlines(mem, addr, max_lines, out, stop, formatter)
+    except (AddressError, InstructionError) as e:
+        print(e)
+        return None
+
+
+def disasm_banked(args):
+    from .bank import disasm_banks
+
+    if not args.eager:
+        print("--bank needs --eager")
+        return
+    common = []
+    for kind, segments in [(RAM, args.load), (ROM, args.rom)]:
+        for addr, file in segments:
+            common.append((addr, bytes(read_file(file)), kind))
+    with open_writer(args.output) as out:
+        try:
+            return disasm_banks(args, read_file(args.FILE), common, out, args.jobs)
+        except Exception as e:
+            if args.debug:
+                print_traceback(e)
+            else:
+                print(f"Exception {e}")
 
 
 def main():
@@ -0,0 +1,50 @@
+import re
+from bisect import bisect_left
+
+UNKNOWN = 0
+CODE = 1
+STRING = 2
+DATA = 3
+
+
+class Coverage:
+    """kind of every byte in the address space, UNKNOWN, CODE, STRING or DATA"""
+
+    def __init__(self, size=0x10000):
+        self.map = bytearray(size)
+
+    def __len__(self):
+        return len(self.map)
+
+    def __getitem__(self, addr):
+        return self.map[addr]
+
+    def mark(self, rng, kind):
+        start = max(rng.start, 0)
+        stop = min(rng.stop, len(self.map))
+        if start < stop:
+            self.map[start:stop] = bytes([kind]) * (stop - start)
+
+    def count(self, kind):
+        return self.map.count(kind)
+
+    def runs(self, kind, start=0, stop=None):
+        """ranges of consecutive bytes of kind within start..stop"""
+        if stop is None:
+            stop = len(self.map)
+        pattern = re.compile(re.escape(bytes([kind])) + b"+")
+        found = pattern.finditer(self.map, max(start, 0), min(stop, len(self.map)))
+        return [range(m.start(), m.end()) for m in found]
+
+    def gaps(self, start, stop, splits=()):
+        """UNKNOWN ranges within start..stop, divided at sorted split addresses"""
+        ranges = []
+        for rng in self.runs(UNKNOWN, start, stop):
+            n = bisect_left(splits, rng.start + 1)
+            begin = rng.start
+            while n < len(splits) and splits[n] < rng.stop:
+                ranges.append(range(begin, splits[n]))
+                begin = splits[n]
+                n += 1
+            ranges.append(range(begin, rng.stop))
+        return ranges
@@ -0,0 +1,984 @@
+"""decode tables prebuilt from the opcode handlers, do not edit
+
+generated by python -m yad80.build_tables
+"""
+
+import marshal
+
+# fmt: off
+TABLES = marshal.loads(
+    b'{\xda\x04main[\x00\x01\x00\x00)\x08\xe9\x01\x00\x00\x00\xda\x03NOP\xa9\x00\xda\x0bfall'
+    b'throughFNNr\x03\x00\x00\x00)\x08\xe9\x03\x00\x00\x00\xda\x02LD)\x02\xda\x02BC'
+    b'Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00\xe9\x02\x00\x00\x00r\x01\x00\x00\x00N)\x08r'
+    b'\x01\x00\x00\x00r\x06\x00\x00\x00)\x02\xfa\x04(BC)\xda\x01Ar\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x01\x00\x00\x00\xda\x03INC)\x01r\x07\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01\xda\x01Br\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x01\x00\x00\x00\xda\x03DEC)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x01\x00\x00\x00\xe9\x00\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00\xda\x04RLCAr\x03\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x02EX)\x02\xda\x02AF\xfa'
+    b"\x03AF'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03ADD)\x02\xda"
+    b'\x02HLr\x07\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r\n\x00\x00\x00r\t\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00'
+    b'\x00r\r\x00\x00\x00)\x01r\x07\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00'
+    b'\x00r\x0b\x00\x00\x00)\x01\xda\x01Cr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'\r\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\x15\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00'
+    b'\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00\xda\x04RRCAr\x03\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04DJNZ)\x01N\xda\x04jumpT\xe9\xff'
+    b'\xff\xff\xffN)\x01)\x04r\x0e\x00\x00\x00r\x05\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02\xda\x02DENr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00'
+    b'\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02\xfa\x04(DE)r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01r\x1a\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01\xda\x01Dr\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00'
+    b'\x00\x00\xda\x03RLAr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'\xda\x02JR)\x01Nr\x18\x00\x00\x00Fr\x19\x00\x00\x00N)\x01)\x04r\x0e\x00\x00\x00r\x05\x00\x00'
+    b'\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\x14\x00\x00\x00r\x1a\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r'
+    b'\x1b\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r'
+    b'\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01\xda'
+    b'\x01Er\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r\x1f\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00'
+    b'\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)'
+    b'\x08r\x01\x00\x00\x00\xda\x03RRAr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00r\x1e\x00\x00\x00)\x02\xda\x02NZNr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04'
+    b'r\x01\x00\x00\x00r\x05\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x14'
+    b'\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N'
+    b')\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x14\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00'
+    b')\x01)\x04r\x0e\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00'
+    b')\x01r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00'
+    b')\x01\xda\x01Hr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01'
+    b'r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02'
+    b'r"\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00'
+    b'\x00N)\x08r\x01\x00\x00\x00\xda\x03DAAr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r\x1e\x00\x00\x00)\x02\xda\x01ZNr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01'
+    b')\x04r\x01\x00\x00\x00r\x05\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02'
+    b'r\x14\x00\x00\x00r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02r\x14\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x01\x00\x00\x00'
+    b'r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r\x14\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01\xda\x01Lr\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00'
+    b'\xda\x03CPLr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x1e'
+    b'\x00\x00\x00)\x02\xda\x02NCNr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r'
+    b'\x05\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02\xda\x02SPNr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00'
+    b'r\x06\x00\x00\x00)\x02Nr\n\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x0e\x00'
+    b'\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01r(\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01\xfa\x04(HL'
+    b')r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r)\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00'
+    b'\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08'
+    b'r\x01\x00\x00\x00\xda\x03SCFr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00r\x1e\x00\x00\x00)\x02r\x15\x00\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04'
+    b'r\x01\x00\x00\x00r\x05\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\x14'
+    b'\x00\x00\x00r(\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x01\x00\x00\x00r\x08'
+    b'\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r(\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x0b\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\r\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00'
+    b'\xda\x03CCFr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02r\x0c\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00r\x1f\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00r"'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c'
+    b'\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r\x0c\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00'
+    b'\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00'
+    b'\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)'
+    b'\x02r\x15\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r\x0c\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r'
+    b'\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r'
+    b'\x1c\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02r\x1c\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00r\n\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00'
+    b'\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02r\x1f\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00'
+    b'r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00r%\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02'
+    b'r\x1f\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02r"\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r"\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r"\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r"\x00\x00\x00r\x1f\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r"\x00\x00\x00r"'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r"'
+    b'\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r"\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00'
+    b'\x00r\x06\x00\x00\x00)\x02r"\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00'
+    b'\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)'
+    b'\x02r%\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r%\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00\x00r\x0c\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00\x00r'
+    b'\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r'
+    b')\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02r)\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x04HALTr\x03\x00\x00\x00\xda\x04haltFNN'
+    b'r\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r)\x00\x00\x00r\n\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r\x0c\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00'
+    b'\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02r\n\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00'
+    b'r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00r)\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00'
+    b'r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02'
+    b'r\n\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13'
+    b'\x00\x00\x00)\x02r\n\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01'
+    b'\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00r"\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00r%'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00\x00)\x02r\n'
+    b'\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r\x13\x00\x00'
+    b'\x00)\x02r\n\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00'
+    b'\x00\xda\x03ADC)\x02r\n\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x01\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00r\x1f\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00'
+    b'\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r.\x00\x00\x00)'
+    b'\x02r\n\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'.\x00\x00\x00)\x02r\n\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x01\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00\xda\x03SUB)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00r/\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x01\x00\x00\x00\xda\x03SBC)\x02r\n\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00r\x15\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00r'
+    b'\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r0\x00\x00\x00)\x02r'
+    b'\n\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r0\x00'
+    b'\x00\x00)\x02r\n\x00\x00\x00r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00'
+    b'\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x01\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00r)\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00r\n\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03AND)\x01r\x0c\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r1\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03XOR)\x01r\x0c\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r2\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x02OR)\x01r\x0c\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r3\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x02CP)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r4\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03RET)\x01r!\x00\x00\x00\xda\x06ret'
+    b'urnTNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03POP)\x01r\x07\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00\xda\x02JP)\x02r!\x00\x00\x00Nr\x18'
+    b'\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08'
+    b'r\x05\x00\x00\x00r8\x00\x00\x00)\x01Nr\x18\x00\x00\x00Fr\x19\x00\x00\x00N)\x01)\x04r\x0e\x00'
+    b'\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00\xda\x04CALL)\x02r!\x00\x00'
+    b'\x00N\xda\x04callTr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00'
+    b'\x00\x00N)\x08r\x01\x00\x00\x00\xda\x04PUSH)\x01r\x07\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNN'
+    b')\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00\xda\x03RST'
+    b')\x01z\x03$00r:\x00\x00\x00Fr\x0e\x00\x00\x00Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'5\x00\x00\x00)\x01r$\x00\x00\x00r6\x00\x00\x00TNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r'
+    b'5\x00\x00\x00r\x03\x00\x00\x00r6\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r8\x00'
+    b'\x00\x00)\x02r$\x00\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r'
+    b'\x08\x00\x00\x00r\x01\x00\x00\x00NN)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02r$\x00\x00\x00Nr'
+    b':\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)'
+    b'\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x01Nr:\x00\x00\x00Fr\x19\x00\x00\x00N)\x01)\x04r\x0e'
+    b'\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00'
+    b'\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08'
+    b'r\x01\x00\x00\x00r<\x00\x00\x00)\x01z\x03$08r:\x00\x00\x00F\xe9\x08\x00\x00\x00Nr\x03\x00'
+    b"\x00\x00)\x08r\x01\x00\x00\x00r5\x00\x00\x00)\x01r'\x00\x00\x00r6\x00\x00\x00TNNr\x03\x00"
+    b'\x00\x00)\x08r\x01\x00\x00\x00r7\x00\x00\x00)\x01r\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b"\x00\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02r'\x00\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00"
+    b'\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x08\x00\x00\x00\xda\x03O'
+    b'UT)\x02Nr\n\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\x01\x00\x00\x00'
+    b"r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02r'\x00\x00\x00Nr:\x00\x00\x00T"
+    b'r\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00'
+    b'\x00r;\x00\x00\x00)\x01r\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00r/\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\x0e\x00\x00\x00r'
+    b'\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r<\x00\x00\x00)\x01z\x03$10r:\x00\x00\x00F\xe9\x10'
+    b'\x00\x00\x00Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r5\x00\x00\x00)\x01r\x15\x00\x00\x00r6\x00\x00'
+    b'\x00TNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00\xda\x03EXXr\x03\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02r\x15\x00\x00\x00Nr\x18\x00\x00\x00'
+    b'Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x08\x00'
+    b'\x00\x00\xda\x02IN)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r'
+    b'\x01\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02r\x15\x00\x00\x00Nr:'
+    b'\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00NN)'
+    b'\x08r\x08\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x01\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r<\x00\x00\x00)\x01z\x03$'
+    b'18r:\x00\x00\x00F\xe9\x18\x00\x00\x00Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r5\x00\x00\x00)'
+    b'\x01\xda\x02POr6\x00\x00\x00TNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r7\x00\x00\x00)\x01'
+    b'r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02'
+    b'rC\x00\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00'
+    b'r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r\x10\x00\x00\x00)\x02\xfa\x04(SP)r\x14\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02rC\x00\x00\x00N'
+    b'r:\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N'
+    b')\x08r\x01\x00\x00\x00r;\x00\x00\x00)\x01r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r1\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00'
+    b'r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r<\x00\x00\x00)\x01z\x03$20r:'
+    b'\x00\x00\x00F\xe9 \x00\x00\x00Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r5\x00\x00\x00)\x01\xda\x02P'
+    b'Er6\x00\x00\x00TNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r8\x00\x00\x00)\x01\xfa\x04(H'
+    b'L)r\x18\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02rF\x00'
+    b'\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00'
+    b'\x00\x00N)\x08r\x01\x00\x00\x00r\x10\x00\x00\x00)\x02r\x1a\x00\x00\x00r\x14\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02rF\x00\x00\x00Nr:\x00\x00'
+    b'\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00NN)\x08r'
+    b'\x08\x00\x00\x00r2\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\x0e\x00'
+    b'\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r<\x00\x00\x00)\x01z\x03$28r:\x00\x00\x00'
+    b'F\xe9(\x00\x00\x00Nr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r5\x00\x00\x00)\x01\xda\x01Pr6\x00'
+    b'\x00\x00TNNr\x03\x00\x00\x00)\x08r\x01\x00\x00\x00r7\x00\x00\x00)\x01r\x11\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02rI\x00\x00\x00Nr\x18'
+    b'\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08'
+    b'r\x01\x00\x00\x00\xda\x02DIr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00'
+    b'\x00\x00r9\x00\x00\x00)\x02rI\x00\x00\x00Nr:\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r'
+    b'\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r;\x00\x00\x00)\x01r\x11\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r3\x00\x00\x00)\x01Nr\x04'
+    b'\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00'
+    b'\x00r<\x00\x00\x00)\x01z\x03$30r:\x00\x00\x00F\xe90\x00\x00\x00Nr\x03\x00\x00\x00)\x08'
+    b'r\x01\x00\x00\x00r5\x00\x00\x00)\x01\xda\x01Mr6\x00\x00\x00TNNr\x03\x00\x00\x00)\x08r\x01'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r(\x00\x00\x00r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x05\x00\x00\x00r8\x00\x00\x00)\x02rL\x00\x00\x00Nr\x18\x00\x00\x00Tr\x19\x00\x00\x00'
+    b'N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00\xda\x02EI'
+    b'r\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r9\x00\x00\x00)\x02'
+    b'rL\x00\x00\x00Nr:\x00\x00\x00Tr\x19\x00\x00\x00N)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00'
+    b'r\x01\x00\x00\x00NN)\x08r\x08\x00\x00\x00r4\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01'
+    b')\x04r\x0e\x00\x00\x00r\x0e\x00\x00\x00r\x01\x00\x00\x00N)\x08r\x01\x00\x00\x00r<\x00\x00\x00)\x01'
+    b'z\x03$38r:\x00\x00\x00F\xe98\x00\x00\x00Nr\x03\x00\x00\x00\xda\x02cb[\x00\x01\x00\x00)'
+    b'\x08r\x08\x00\x00\x00\xda\x03RLC)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rP\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00\xda\x03RRC)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rQ\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00\xda\x02RL)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rR\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00\xda\x02RR)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rS\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00\xda\x03SLA)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rT\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00\xda\x03SRA)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rU\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNN'
+    b'NNNNN)\x08r\x08\x00\x00\x00\xda\x03SRL)\x01r\x0c\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r\x15\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r\x1c\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r\x1f\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r"\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r%\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r)\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rV\x00\x00\x00)\x01r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03BIT)\x02z\x010r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x010r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x010r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x010r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z'
+    b'\x010r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00'
+    b')\x02z\x010r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW'
+    b'\x00\x00\x00)\x02z\x010r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rW\x00\x00\x00)\x02z\x010r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x011'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02'
+    b'z\x011r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00'
+    b'\x00)\x02z\x012r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'W\x00\x00\x00)\x02z\x012r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rW\x00\x00\x00)\x02z\x012r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x012r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x012r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x012r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x012r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x012r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x013r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x01'
+    b'3r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)'
+    b'\x02z\x013r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00'
+    b'\x00\x00)\x02z\x013r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rW\x00\x00\x00)\x02z\x013r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rW\x00\x00\x00)\x02z\x013r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x013r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x013r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x014r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x014r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x014r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x014r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z'
+    b'\x014r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00'
+    b')\x02z\x014r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW'
+    b'\x00\x00\x00)\x02z\x014r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rW\x00\x00\x00)\x02z\x014r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x015'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02'
+    b'z\x015r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00'
+    b'\x00)\x02z\x016r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'W\x00\x00\x00)\x02z\x016r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rW\x00\x00\x00)\x02z\x016r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x016r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x016r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x016r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x016r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x016r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x017r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x01'
+    b'7r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)'
+    b'\x02z\x017r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rW\x00'
+    b'\x00\x00)\x02z\x017r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rW\x00\x00\x00)\x02z\x017r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rW\x00\x00\x00)\x02z\x017r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x017r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rW\x00\x00\x00)\x02z\x017r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03RES)\x02z\x010r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x010r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x010r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x010r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z'
+    b'\x010r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00'
+    b')\x02z\x010r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX'
+    b'\x00\x00\x00)\x02z\x010r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rX\x00\x00\x00)\x02z\x010r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x011'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02'
+    b'z\x011r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00'
+    b'\x00)\x02z\x012r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'X\x00\x00\x00)\x02z\x012r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rX\x00\x00\x00)\x02z\x012r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x012r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x012r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x012r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x012r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x012r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x013r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x01'
+    b'3r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)'
+    b'\x02z\x013r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00'
+    b'\x00\x00)\x02z\x013r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rX\x00\x00\x00)\x02z\x013r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rX\x00\x00\x00)\x02z\x013r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x013r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x013r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x014r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x014r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x014r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x014r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z'
+    b'\x014r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00'
+    b')\x02z\x014r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX'
+    b'\x00\x00\x00)\x02z\x014r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rX\x00\x00\x00)\x02z\x014r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x015'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02'
+    b'z\x015r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00'
+    b'\x00)\x02z\x016r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'X\x00\x00\x00)\x02z\x016r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rX\x00\x00\x00)\x02z\x016r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x016r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x016r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x016r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x016r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x016r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x017r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x01'
+    b'7r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)'
+    b'\x02z\x017r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rX\x00'
+    b'\x00\x00)\x02z\x017r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rX\x00\x00\x00)\x02z\x017r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rX\x00\x00\x00)\x02z\x017r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x017r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rX\x00\x00\x00)\x02z\x017r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03SET)\x02z\x010r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x010r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x010r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x010r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z'
+    b'\x010r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00'
+    b')\x02z\x010r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY'
+    b'\x00\x00\x00)\x02z\x010r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rY\x00\x00\x00)\x02z\x010r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x011'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02'
+    b'z\x011r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00'
+    b'\x00)\x02z\x012r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'Y\x00\x00\x00)\x02z\x012r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rY\x00\x00\x00)\x02z\x012r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x012r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x012r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x012r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x012r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x012r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x013r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x01'
+    b'3r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)'
+    b'\x02z\x013r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00'
+    b'\x00\x00)\x02z\x013r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rY\x00\x00\x00)\x02z\x013r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rY\x00\x00\x00)\x02z\x013r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x013r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x013r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x014r\x0c\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x014r\x15\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x014r\x1c\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x014r'
+    b'\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z'
+    b'\x014r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00'
+    b')\x02z\x014r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY'
+    b'\x00\x00\x00)\x02z\x014r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00rY\x00\x00\x00)\x02z\x014r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r\x1f\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r"\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015r%\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x015'
+    b'r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02'
+    b'z\x015r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00'
+    b'\x00)\x02z\x016r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'Y\x00\x00\x00)\x02z\x016r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00rY\x00\x00\x00)\x02z\x016r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x016r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x016r"\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x016r%\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x016r)\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x016r\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x017r\x0c'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x01'
+    b'7r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)'
+    b'\x02z\x017r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rY\x00'
+    b'\x00\x00)\x02z\x017r\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'rY\x00\x00\x00)\x02z\x017r"\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00rY\x00\x00\x00)\x02z\x017r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x017r)\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00rY\x00\x00\x00)\x02z\x017r\n\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00\xda\x02ed[\x00\x01\x00\x00NNNNNNNNNNNNNNNNNN'
+    b'NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN'
+    b'NNNNNNNNNNNNNN)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x02r\x0c\x00\x00'
+    b'\x00\xfa\x03(C)r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)'
+    b'\x02r[\x00\x00\x00r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'0\x00\x00\x00)\x02r\x14\x00\x00\x00r\x07\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08\xe9'
+    b'\x04\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x07\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)'
+    b'\x04r\x0e\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N)\x08r\x08\x00\x00\x00\xda\x03NEGr\x03\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04RETNr\x03\x00\x00'
+    b'\x00r6\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x02IM)\x01\xda\x010r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02\xda\x01Ir\n\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x02r\x15\x00\x00'
+    b'\x00r[\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)'
+    b'\x02r[\x00\x00\x00r\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'.\x00\x00\x00)\x02r\x14\x00\x00\x00r\x07\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\\\x00\x00\x00r\x06\x00\x00\x00)\x02r\x07\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)'
+    b'\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00NN)\x08r\x08\x00\x00\x00\xda\x04RETIr'
+    b'\x03\x00\x00\x00r6\x00\x00\x00FNNr\x03\x00\x00\x00N)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02'
+    b'\xda\x01Rr\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rA\x00\x00'
+    b'\x00)\x02r\x1c\x00\x00\x00r[\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00r>\x00\x00\x00)\x02r[\x00\x00\x00r\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00r0\x00\x00\x00)\x02r\x14\x00\x00\x00r\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x1a\x00\x00\x00r\x04\x00\x00\x00FNr'
+    b'\x19\x00\x00\x00)\x01)\x04r\x0e\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00NNN)\x08r\x08\x00\x00'
+    b'\x00r_\x00\x00\x00)\x01\xda\x011r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\n\x00\x00\x00ra\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00rA\x00\x00\x00)\x02r\x1f\x00\x00\x00r[\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)\x02r[\x00\x00\x00r\x1f\x00\x00\x00r\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\x14\x00\x00\x00r\x1a\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1a\x00\x00\x00N'
+    b'r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N'
+    b'NN)\x08r\x08\x00\x00\x00r_\x00\x00\x00)\x01\xda\x012r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00rc\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x02r"\x00\x00\x00r[\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)\x02r[\x00\x00\x00r"\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r0\x00\x00\x00)\x02r\x14\x00'
+    b'\x00\x00r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02Nr\x14\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x0e\x00\x00\x00r\x08\x00'
+    b'\x00\x00r\x08\x00\x00\x00NNNN)\x08r\x08\x00\x00\x00\xda\x03RRDr\x03\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x02r%\x00\x00\x00r[\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)\x02r[\x00\x00'
+    b'\x00r%\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r.\x00\x00\x00)'
+    b'\x02r\x14\x00\x00\x00r\x14\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\x14\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x01\x00\x00'
+    b'\x00r\x08\x00\x00\x00r\x08\x00\x00\x00NNNN)\x08r\x08\x00\x00\x00\xda\x03RLDr\x03\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x01r[\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00)\x02r[\x00\x00\x00'
+    b'r`\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r0\x00\x00\x00)\x02'
+    b'r\x14\x00\x00\x00r(\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02Nr(\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x0e\x00\x00\x00'
+    b'r\x08\x00\x00\x00r\x08\x00\x00\x00NNNNN)\x08r\x08\x00\x00\x00rA\x00\x00\x00)\x02r\n\x00'
+    b'\x00\x00r[\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r>\x00\x00\x00'
+    b')\x02r[\x00\x00\x00r\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'r.\x00\x00\x00)\x02r\x14\x00\x00\x00r(\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\\\x00\x00\x00r\x06\x00\x00\x00)\x02r(\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01'
+    b')\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00NNNNNNNNNNNNNNN'
+    b'NNNNNNNNNNNNNNNNNNNNNN)\x08r\x08\x00\x00\x00\xda\x03L'
+    b'DIr\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03CPI'
+    b'r\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03INIr\x03'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04OUTIr\x03\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNN)\x08r\x08\x00\x00\x00\xda\x03LDDr'
+    b'\x03\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03CPDr\x03\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x03INDr\x03\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04OUTDr\x03\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNN)\x08r\x08\x00\x00\x00\xda\x04LDIRr\x03\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04CPIRr\x03\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04INIRr\x03\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04OTIRr\x03\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNN)\x08r\x08\x00\x00\x00\xda\x04LDDRr\x03\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04CPDRr\x03\x00\x00'
+    b'\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04INDRr\x03\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00\xda\x04OTDRr\x03\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNNNNNNNNNNNNNNNNNN'
+    b'NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN'
+    b'NNNNNNNNNNNNNNNN\xda\x02dd[\x00\x01\x00\x00NNNNNNN'
+    b'NN)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02\xda\x02IXr\x07\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00NNNNNNNNNNNNNNN)\x08r\x08\x00\x00\x00r\x13\x00\x00'
+    b'\x00)\x02ry\x00\x00\x00r\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNNNN'
+    b'N)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02ry\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02N'
+    b'ry\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x0e\x00\x00\x00r\x08\x00\x00\x00r'
+    b'\x08\x00\x00\x00N)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01ry\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01z\x03IXHr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01z\x03IXHr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHNr\x04\x00\x00\x00FN'
+    b'N)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x08\x00\x00\x00NNN)\x08r\x08\x00\x00\x00r\x13'
+    b'\x00\x00\x00)\x02ry\x00\x00\x00ry\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02ry\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04'
+    b'r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01ry'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01z\x03'
+    b'IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01z\x03'
+    b'IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03'
+    b'IXLNr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x08\x00\x00\x00N'
+    b'NNNNN)\x08r\x05\x00\x00\x00r\x0b\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04'
+    b'r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\r\x00\x00\x00)'
+    b'\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02I'
+    b'X)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02NNr\x04\x00\x00\x00FNN)\x02)\x04r\x0e\x00'
+    b'\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x05\x00\x00'
+    b'\x00NNN)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02ry\x00\x00\x00r(\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00NNNNNNNNNN)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)'
+    b'\x02r\x0c\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00'
+    b'\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r\x15\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02r\x1c\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00'
+    b'r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00z\x03IXLr\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXN)\x08r\x08\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02z\x03IXHr\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHr\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHr\x1c\x00\x00\x00r\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHr\x1f\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHz\x03'
+    b'IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03'
+    b'IXHz\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02r"\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r'
+    b'\x08\x00\x00\x00z\x02IX)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXHr\n\x00\x00\x00'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXL'
+    b'r\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02'
+    b'z\x03IXLr\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02z\x03IXLr\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXLr\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXLz\x03IXHr\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXLz\x03IXLr\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08'
+    b'r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IXLr\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x0c\x00\x00\x00r\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02Nr\x15\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00'
+    b'r\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x1c\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08r\x05'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x1f\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00'
+    b'\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr"'
+    b'\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02'
+    b'IX)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr%\x00\x00\x00r\x04\x00\x00\x00FNN)\x01'
+    b')\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02Nr)\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r'
+    b'\x08\x00\x00\x00z\x02IX)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\n\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNN)'
+    b'\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXLr\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNN'
+    b'N)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FN'
+    b'Nr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXLr\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNN)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXHr\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXL'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00'
+    b'Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IX'
+    b'NNNNN)\x08r\x08\x00\x00\x00r/\x00\x00\x00)\x01z\x03IXHr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r/\x00\x00\x00)\x01z\x03IXLr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r/\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04'
+    b'r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00r'
+    b'0\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x05\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01'
+    b')\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00'
+    b'\x00r1\x00\x00\x00)\x01z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00'
+    b'\x00r1\x00\x00\x00)\x01z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00'
+    b'\x00r1\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r'
+    b'\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00r2\x00\x00\x00)\x01z\x03IXH'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r2\x00\x00\x00)\x01z\x03IXL'
+    b'r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r2\x00\x00\x00)\x01Nr\x04\x00\x00'
+    b'\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN'
+    b')\x08r\x08\x00\x00\x00r3\x00\x00\x00)\x01z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r3\x00\x00\x00)\x01z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x05\x00\x00\x00r3\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNN)\x08r\x08\x00\x00\x00r4\x00\x00\x00)'
+    b'\x01z\x03IXHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r4\x00\x00\x00)'
+    b'\x01z\x03IXLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r4\x00\x00\x00)'
+    b'\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02I'
+    b'XNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN'
+    b'NNN)\x08r\x08\x00\x00\x00r7\x00\x00\x00)\x01ry\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00N)\x08r\x08\x00\x00\x00r\x10\x00\x00\x00)\x02\xfa\x04(SP)ry\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00N)\x08r\x08\x00\x00\x00r;\x00\x00\x00)\x01ry\x00\x00\x00r\x04'
+    b'\x00\x00\x00FNNr\x03\x00\x00\x00NNN)\x08r\x08\x00\x00\x00r8\x00\x00\x00)\x01z\x04(I'
+    b'X)r\x18\x00\x00\x00FNNr\x03\x00\x00\x00NNNNNNNNNNNNNNN)\x08'
+    b'r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r(\x00\x00\x00ry\x00\x00\x00r\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00NNNNNNz\x04ddcb[\x00\x01\x00\x00NNNNNN)\x08r\\\x00\x00'
+    b'\x00rP\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r'
+    b'\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rQ\x00\x00\x00)\x01Nr\x04'
+    b'\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNN'
+    b'NNNN)\x08r\\\x00\x00\x00rR\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00'
+    b'rS\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08'
+    b'\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rT\x00\x00\x00)\x01Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rU\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e'
+    b'\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNNNNNNNNNN'
+    b')\x08r\\\x00\x00\x00rV\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00'
+    b'\x00)\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x011Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rW\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00'
+    b'\x00)\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x015Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rW\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00'
+    b'\x00)\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x011Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rX\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00'
+    b'\x00)\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x015Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rX\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00'
+    b'\x00)\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x011Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rY\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00'
+    b'\x00)\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IXNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x015Nr'
+    b'\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNN'
+    b'NNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)'
+    b'\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXNNNNNNN)\x08r'
+    b'\\\x00\x00\x00rY\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IXN\xda\x02fd[\x00\x01\x00\x00NNNNNNNN'
+    b'N)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02\xda\x02IYr\x07\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00NNNNNNNNNNNNNNN)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00'
+    b')\x02r|\x00\x00\x00r\x1a\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00NNNNNNN'
+    b')\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02r|\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04'
+    b'r\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N)\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02Nr'
+    b'|\x00\x00\x00r\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r\x0e\x00\x00\x00r\x08\x00\x00\x00r\x08'
+    b'\x00\x00\x00N)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01r|\x00\x00\x00r\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01z\x03IYHr\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01z\x03IYHr\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHNr\x04\x00\x00\x00FNN'
+    b')\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x08\x00\x00\x00NNN)\x08r\x08\x00\x00\x00r\x13\x00'
+    b'\x00\x00)\x02r|\x00\x00\x00r|\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\\\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02r|\x00\x00\x00Nr\x04\x00\x00\x00FNr\x19\x00\x00\x00)\x01)\x04r'
+    b'\x01\x00\x00\x00r\x08\x00\x00\x00r\x08\x00\x00\x00N)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01r|\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x0b\x00\x00\x00)\x01z\x03I'
+    b'YLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\r\x00\x00\x00)\x01z\x03I'
+    b'YLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03I'
+    b'YLNr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x08\x00\x00\x00NN'
+    b'NNNN)\x08r\x05\x00\x00\x00r\x0b\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\r\x00\x00\x00)\x01'
+    b'Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY'
+    b')\x08r\\\x00\x00\x00r\x06\x00\x00\x00)\x02NNr\x04\x00\x00\x00FNN)\x02)\x04r\x0e\x00\x00'
+    b'\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x04r\x01\x00\x00\x00r\x0e\x00\x00\x00r\x05\x00\x00\x00'
+    b'NNN)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r|\x00\x00\x00r(\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00NNNNNNNNNN)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02'
+    b'r\x0c\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06'
+    b'\x00\x00\x00)\x02r\x0c\x00\x00\x00z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r\x0c\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00'
+    b'\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02r\x15\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08'
+    b'r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x15\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01'
+    b'\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02r\x1c\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1c\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04'
+    b'r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r'
+    b'\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r'
+    b'\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\x1f\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01'
+    b')\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYN)\x08r\x08\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02z\x03IYHr\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHr\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHr\x1c\x00\x00\x00r\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHr\x1f\x00\x00\x00r\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHz\x03I'
+    b'YHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03I'
+    b'YHz\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02r"\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08'
+    b'\x00\x00\x00z\x02IY)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYHr\n\x00\x00\x00r'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYLr'
+    b'\x0c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z'
+    b'\x03IYLr\x15\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00'
+    b'\x00\x00)\x02z\x03IYLr\x1c\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02z\x03IYLr\x1f\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00\x00'
+    b')\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYLz\x03IYHr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYLz\x03IYLr\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r%\x00\x00\x00Nr\x04'
+    b'\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r'
+    b'\x08\x00\x00\x00r\x06\x00\x00\x00)\x02z\x03IYLr\n\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x0c\x00\x00\x00r\x04\x00\x00\x00FNN)\x01'
+    b')\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\x06\x00\x00'
+    b'\x00)\x02Nr\x15\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r'
+    b'\x08\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\x1c\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r\x05\x00'
+    b'\x00\x00r\x06\x00\x00\x00)\x02Nr\x1f\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00'
+    b'r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr"\x00'
+    b'\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02I'
+    b'Y)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr%\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00'
+    b')\x02Nr)\x00\x00\x00r\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08'
+    b'\x00\x00\x00z\x02IY)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02Nr\n\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN)\x08'
+    b'r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03'
+    b'\x00\x00\x00)\x08r\x08\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYLr\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x06\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00'
+    b'\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN'
+    b')\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNN'
+    b'r\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYLr\x04\x00'
+    b'\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r\x13\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04'
+    b'\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNN'
+    b'NN)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYHr\x04\x00\x00\x00F'
+    b'NNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYLr'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r.\x00\x00\x00)\x02r\n\x00\x00\x00N'
+    b'r\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYN'
+    b'NNNN)\x08r\x08\x00\x00\x00r/\x00\x00\x00)\x01z\x03IYHr\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r/\x00\x00\x00)\x01z\x03IYLr\x04\x00\x00\x00FNNr'
+    b'\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r/\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r'
+    b'\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r0'
+    b'\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08'
+    b'\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00)\x08r\x05\x00\x00\x00r0\x00\x00\x00)\x02r\n\x00\x00\x00Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00'
+    b'r1\x00\x00\x00)\x01z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00'
+    b'r1\x00\x00\x00)\x01z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00'
+    b'r1\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08'
+    b'\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r2\x00\x00\x00)\x01z\x03IYHr'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r2\x00\x00\x00)\x01z\x03IYLr'
+    b'\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r2\x00\x00\x00)\x01Nr\x04\x00\x00\x00'
+    b'FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)'
+    b'\x08r\x08\x00\x00\x00r3\x00\x00\x00)\x01z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x08\x00\x00\x00r3\x00\x00\x00)\x01z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)'
+    b'\x08r\x05\x00\x00\x00r3\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r'
+    b'\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN)\x08r\x08\x00\x00\x00r4\x00\x00\x00)\x01'
+    b'z\x03IYHr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x08\x00\x00\x00r4\x00\x00\x00)\x01'
+    b'z\x03IYLr\x04\x00\x00\x00FNNr\x03\x00\x00\x00)\x08r\x05\x00\x00\x00r4\x00\x00\x00)\x01'
+    b'Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IY'
+    b'NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN'
+    b'NN)\x08r\x08\x00\x00\x00r7\x00\x00\x00)\x01r|\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00'
+    b'\x00\x00N)\x08r\x08\x00\x00\x00r\x10\x00\x00\x00)\x02rz\x00\x00\x00r|\x00\x00\x00r\x04\x00\x00\x00'
+    b'FNNr\x03\x00\x00\x00N)\x08r\x08\x00\x00\x00r;\x00\x00\x00)\x01r|\x00\x00\x00r\x04\x00\x00'
+    b'\x00FNNr\x03\x00\x00\x00NNN)\x08r\x08\x00\x00\x00r8\x00\x00\x00)\x01z\x04(IY)'
+    b'r\x18\x00\x00\x00FNNr\x03\x00\x00\x00NNNNNNNNNNNNNNN)\x08r\x08'
+    b'\x00\x00\x00r\x06\x00\x00\x00)\x02r(\x00\x00\x00r|\x00\x00\x00r\x04\x00\x00\x00FNNr\x03\x00\x00'
+    b'\x00NNNNNNz\x04fdcb[\x00\x01\x00\x00NNNNNN)\x08r\\\x00\x00\x00r'
+    b'P\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00'
+    b'\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rQ\x00\x00\x00)\x01Nr\x04\x00\x00'
+    b'\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNN'
+    b'NN)\x08r\\\x00\x00\x00rR\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00'
+    b'\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rS'
+    b'\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00'
+    b'\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rT\x00\x00\x00)\x01Nr\x04\x00\x00\x00'
+    b'FNN)\x01)\x04r\x0e\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNN'
+    b'N)\x08r\\\x00\x00\x00rU\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00'
+    b'\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNNNNNNNNNN)\x08'
+    b'r\\\x00\x00\x00rV\x00\x00\x00)\x01Nr\x04\x00\x00\x00FNN)\x01)\x04r\x0e\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)'
+    b'\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x011Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rW\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)'
+    b'\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x015Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rW\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rW\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)'
+    b'\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x011Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rX\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)'
+    b'\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x015Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rX\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rX\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)'
+    b'\x02z\x010Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x011Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x012Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rY\x00\x00\x00)\x02z\x013Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)'
+    b'\x02z\x014Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00'
+    b'z\x02IYNNNNNNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x015Nr\x04\x00'
+    b'\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNN'
+    b'NNN)\x08r\\\x00\x00\x00rY\x00\x00\x00)\x02z\x016Nr\x04\x00\x00\x00FNN)\x01)'
+    b'\x04r\x01\x00\x00\x00r\\\x00\x00\x00r\x08\x00\x00\x00z\x02IYNNNNNNN)\x08r\\\x00'
+    b'\x00\x00rY\x00\x00\x00)\x02z\x017Nr\x04\x00\x00\x00FNN)\x01)\x04r\x01\x00\x00\x00r\\'
+    b'\x00\x00\x00r\x08\x00\x00\x00z\x02IYN0'
+)
@@ -0,0 +1,364 @@
+"""compiled decode tables
+
+every opcode handler in mnemonic*.py is run once per opcode with two sets of
+operand bytes, the operands which differ between the runs tell where each
+operand comes from. decoding is then a table lookup and operand fetch.
+
+the tables are prebuilt into decode_tables.py as marshal data, so neither the
+handlers nor a large literal have to be compiled at run time. regenerate it
+after a change of the handlers with
+
+python -m yad80.build_tables
+"""
+
+import marshal
+import os
+
+from .exceptions import InstructionError
+from .instruction import Instruction
+from .mnemonic_defs import uint8_to_int8
+
+# kind of operand fetched from the code
+BYTE = 0  # $XX
+PORT = 1  # ($XX)
+WORD = 2  # 16 bit value
+REL = 3  # relative branch target
+DISP = 4  # (IX+$XX)
+
+# target or ref taken from the WORD/REL operand
+OPERAND = -1
+
+PROBE_BASE = 0x8000
+PROBE_BYTES = ([0x12, 0x34], [0xFE, 0xBC])
+
+HEX8 = tuple(f"${b:02X}" for b in range(256))
+PORT8 = tuple(f"(${b:02X})" for b in range(256))
+
+
+def displacement(ixy, b):
+    ofs = uint8_to_int8(b)
+    sign = "-" if ofs < 0 else "+"
+    return f"({ixy}{sign}${abs(ofs):02X})"
+
+
+DISP8 = {ixy: tuple(displacement(ixy, b) for b in range(256)) for ixy in ["IX", "IY"]}
+
+
+class Probe:
+    """Memory substitute which feeds fixed bytes to a handler"""
+
+    def __init__(self, code):
+        self.code = code
+        self.current = 0
+
+    def next_byte(self):
+        if self.current < len(self.code):
+            b = self.code[self.current]
+            self.current += 1
+            return b
+        return None
+
+    @property
+    def addr(self):
+        return PROBE_BASE + self.current
+
+
+def run_handler(code):
+    from .mnemonic import MNEMONIC
+
+    probe = Probe(code)
+    op = probe.next_byte()
+    try:
+        inst = MNEMONIC[op](op, probe)
+    except InstructionError:
+        return None, 0
+    return inst, probe.current
+
+
+def fill(template, values):
+    values = iter(values)
+    return [next(values) if b is None else b for b in template]
+
+
+def operand_field(a, b, code_a, code_b, positions, length):
+    """kind and position of an operand which is a and b for two probes"""
+    for pos in positions:
+        if pos >= length:
+            break
+        x, y = code_a[pos], code_b[pos]
+        if isinstance(a, int):
+            if pos + 1 < length:
+                if (a, b) == (x | code_a[pos + 1] << 8, y | code_b[pos + 1] << 8):
+                    return WORD, pos, None
+            rel_a = PROBE_BASE + length + uint8_to_int8(x)
+            rel_b = PROBE_BASE + length + uint8_to_int8(y)
+            if (a, b) == (rel_a, rel_b):
+                return REL, pos, None
+            continue
+        if (a, b) == (HEX8[x], HEX8[y]):
+            return BYTE, pos, None
+        if (a, b) == (PORT8[x], PORT8[y]):
+            return PORT, pos, None
+        ixy = a[1:3]
+        if ixy in DISP8 and (a, b) == (DISP8[ixy][x], DISP8[ixy][y]):
+            return DISP, pos, ixy
+    raise ValueError(f"unknown operand {a!r} of {code_a}")
+
+
+def compile_entry(template):
+    """(length, mnemonic, operands, flow, conditional, target, ref, fields)
+
+    template is a list of code bytes, None for operand bytes.
+    returns None for an invalid instruction.
+    """
+    code_a = fill(template, PROBE_BYTES[0])
+    code_b = fill(template, PROBE_BYTES[1])
+    inst_a, length = run_handler(code_a)
+    inst_b, _ = run_handler(code_b)
+    if inst_a is None or inst_b is None:
+        if inst_a is not inst_b:
+            raise ValueError(f"operand dependent validity {template}")
+        return None
+
+    positions = [n for n, b in enumerate(template) if b is None]
+    operands = list(inst_a.operands)
+    fields = []
+    value = None
+    for slot, (a, b) in enumerate(zip(inst_a.operands, inst_b.operands)):
+        if a == b:
+            continue
+        kind, pos, ixy = operand_field(a, b, code_a, code_b, positions, length)
+        operands[slot] = None
+        fields.append((slot, kind, pos, ixy))
+        if kind in {WORD, REL}:
+            value = (a, b)
+
+    def source(a, b):
+        if a is None:
+            return None
+        if (a, b) == value:
+            return OPERAND
+        if a == b:
+            return a
+        raise ValueError(f"unknown address of {code_a}")
+
+    return (
+        length,
+        inst_a.mnemonic,
+        tuple(operands),
+        inst_a.flow,
+        inst_a.conditional,
+        source(inst_a.target, inst_b.target),
+        source(inst_a.ref, inst_b.ref),
+        tuple(fields),
+    )
+
+
+PREFIXES = frozenset([0xCB, 0xDD, 0xED, 0xFD])
+
+new_instruction = object.__new__
+
+
+def compile_tables():
+    """decode tables, each is a list of 256 entries indexed by the opcode"""
+    operands = [None, None]
+    tables = {}
+    tables["main"] = [
+        None if op in PREFIXES else compile_entry([op] + operands)
+        for op in range(256)
+    ]
+    tables["cb"] = [compile_entry([0xCB, op]) for op in range(256)]
+    tables["ed"] = [compile_entry([0xED, op] + operands) for op in range(256)]
+    for prefix, name in ((0xDD, "dd"), (0xFD, "fd")):
+        tables[name] = [
+            None if op == 0xCB else compile_entry([prefix, op] + operands)
+            for op in range(256)
+        ]
+        tables[name + "cb"] = [
+            compile_entry([prefix, 0xCB, None, op]) for op in range(256)
+        ]
+    return tables
+
+
+TABLES_MODULE = os.path.join(os.path.dirname(__file__), "decode_tables.py")
+
+
+def write_tables(path=TABLES_MODULE):
+    """write the compiled tables as a python module"""
+    lines = [
+        '"""decode tables prebuilt from the opcode handlers, do not edit',
+        "",
+        "generated by python -m yad80.build_tables",
+        '"""',
+        "",
+        "import marshal",
+        "",
+        "# fmt: off",
+        "TABLES = marshal.loads(",
+    ]
+    data = marshal.dumps(compile_tables())
+    lines.extend(f"    {data[i : i + 32]!r}" for i in range(0, len(data), 32))
+    lines.append(")")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+try:
+    from .decode_tables import TABLES
+except (ImportError, ValueError, EOFError):
+    # missing, or marshal data of another python version
+    TABLES = compile_tables()
+MAIN = TABLES["main"]
+CB = TABLES["cb"]
+ED = TABLES["ed"]
+INDEX = {0xDD: TABLES["dd"], 0xFD: TABLES["fd"]}
+INDEX_CB = {0xDD: TABLES["ddcb"], 0xFD: TABLES["fdcb"]}
+
+# instruction length by opcode, 0 for an invalid instruction
+LENGTHS = {
+    name: bytes(0 if entry is None else entry[0] for entry in table)
+    for name, table in TABLES.items()
+}
+MAIN_LENGTH = LENGTHS["main"]
+CB_LENGTH = LENGTHS["cb"]
+ED_LENGTH = LENGTHS["ed"]
+INDEX_LENGTH = {0xDD: LENGTHS["dd"], 0xFD: LENGTHS["fd"]}
+INDEX_CB_LENGTH = {0xDD: LENGTHS["ddcb"], 0xFD: LENGTHS["fdcb"]}
+
+
+def decode(mem):
+    """decode an instruction at mem.addr and advance mem.addr, None at the end"""
+    block = mem.block
+    index = mem.current
+    size = len(block)
+    if index >= size:
+        return None
+
+    op = block[index]
+    if op not in PREFIXES:
+        entry = MAIN[op]
+    elif index + 1 >= size:
+        entry = incomplete(mem.offset + index)
+    elif op == 0xCB:
+        entry = CB[block[index + 1]]
+    elif op == 0xED:
+        entry = ED[block[index + 1]]
+    elif block[index + 1] != 0xCB:
+        entry = INDEX[op][block[index + 1]]
+    elif index + 3 >= size:
+        entry = incomplete(mem.offset + index)
+    else:
+        entry = INDEX_CB[op][block[index + 3]]
+    if entry is None:
+        invalid(block, index, mem.offset + index)
+
+    length, mnemonic, operands, flow, conditional, target, ref, fields = entry
+    end = index + length
+    if end > size:
+        incomplete(mem.offset + index)
+    addr = mem.offset + index
+
+    if fields:
+        operands = list(operands)
+        for slot, kind, pos, ixy in fields:
+            b = block[index + pos]
+            if kind == BYTE:
+                operands[slot] = HEX8[b]
+            elif kind == DISP:
+                operands[slot] = DISP8[ixy][b]
+            elif kind == WORD:
+                operands[slot] = value = b | block[index + pos + 1] << 8
+            elif kind == REL:
+                operands[slot] = value = addr + length + (b if b < 0x80 else b - 256)
+            else:
+                operands[slot] = PORT8[b]
+        operands = tuple(operands)
+        if target == OPERAND:
+            target = value
+        if ref == OPERAND:
+            ref = value
+
+    # __init__ would set every slot twice, code is sliced when it is read
+    inst = new_instruction(Instruction)
+    inst.addr = addr
+    inst.length = length
+    inst.block = block
+    inst.index = index
+    inst.mnemonic = mnemonic
+    inst.operands = operands
+    inst.target = target
+    inst.ref = ref
+    inst.flow = flow
+    inst.conditional = conditional
+    mem.current = end
+    return inst
+
+
+def incomplete(addr):
+    raise InstructionError(f"incomplete instruction at {addr:04x}")
+
+
+def invalid(block, index, addr):
+    """raise the error for an invalid instruction at index"""
+    opcode_len = 4 if block[index] in {0xDD, 0xFD} and block[index + 1] == 0xCB else 2
+    code = " ".join(f"{b:02x}" for b in block[index : index + opcode_len])
+    raise InstructionError(f"invalid instruction {code} at {addr:04x}")
+
+
+def length_at(mem, addr):
+    """length of the instruction at addr, 0 for an invalid or incomplete one"""
+    run = mem.run_at(addr)
+    if run is None:
+        return 0
+    block = run.block
+    index = addr - run.start
+    size = len(block)
+
+    op = block[index]
+    if op not in PREFIXES:
+        length = MAIN_LENGTH[op]
+    elif index + 1 >= size:
+        return 0
+    elif op == 0xCB:
+        length = CB_LENGTH[block[index + 1]]
+    elif op == 0xED:
+        length = ED_LENGTH[block[index + 1]]
+    elif block[index + 1] != 0xCB:
+        length = INDEX_LENGTH[op][block[index + 1]]
+    elif index + 3 >= size:
+        return 0
+    else:
+        length = INDEX_CB_LENGTH[op][block[index + 3]]
+    return length if index + length <= size else 0
+
+
+def boundaries(mem, start, stop=None):
+    """instruction addresses from start until stop or an invalid instruction"""
+    # instructions do not cross a gap, so the walk stays in the run of start
+    run = mem.run_at(start)
+    if run is None:
+        return
+    block = run.block
+    size = len(block)
+    index = start - run.start
+    end = size if stop is None else min(size, stop - run.start)
+    while index < end:
+        op = block[index]
+        if op not in PREFIXES:
+            length = MAIN_LENGTH[op]
+        elif index + 1 >= size:
+            return
+        elif op == 0xCB:
+            length = CB_LENGTH[block[index + 1]]
+        elif op == 0xED:
+            length = ED_LENGTH[block[index + 1]]
+        elif block[index + 1] != 0xCB:
+            length = INDEX_LENGTH[op][block[index + 1]]
+        elif index + 3 >= size:
+            return
+        else:
+            length = INDEX_CB_LENGTH[op][block[index + 3]]
+        if length == 0 or index + length > size:
+            return
+        yield run.start + index
+        index += length
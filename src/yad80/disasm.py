@@ -1,73 +1,84 @@
-import re
+import sys
+from itertools import islice
 
-from .exceptions import InstructionError
+from .decoder import decode
+from .exceptions import AddressError
 from .memory import Memory
-from .mnemonic import MNEMONIC
+from .output import Writer
 
 
-def format_line(addr, text, code):
-    items = text.split(" ", maxsplit=2)
-    return f"{items[0]:8}{' '.join(items[1:]):32};[{addr:04x}] " + " ".join(
-        [f"{c:02x}" for c in code]
-    )
+def format_code(inst, resolve=None):
+    return f"{inst.mnemonic:8}{inst.operand_text(resolve)}".rstrip()
+
+
+def format_comment(inst):
+    return f"[{inst.addr:04x}] " + " ".join([f"{c:02x}" for c in inst.code])
+
+
+def format_line(inst, resolve=None):
+    return f"{inst.mnemonic:8}{inst.operand_text(resolve):32};" + format_comment(inst)
 
 
 def disasm_line(mem):
-    addr = mem.addr
-    op = mem.next_byte()
-    if op is None:
-        return -1, ""
-    try:
-        func = MNEMONIC.get(op)
-        text = func(op, mem)
-        line = format_line(addr, text, mem[addr : mem.addr])
-        return addr, line
-    except InstructionError as e:
-        raise InstructionError(f"{e} at {addr:04x}")
+    return decode(mem)
 
 
-def disasm_nlines(mem, addr, max_line):
-    if not mem.addr_in(addr):
-        print(f"start address is out of range {addr:04x}")
-        exit()
+def disasm_iter(mem, addr, stop=None):
+    """decode instructions from addr until stop or the end of memory
 
+    unmapped addresses between segments are skipped, mem.addr is not moved.
+    """
+    mem = mem.cursor()
     mem.addr = addr
-    op = mem.next_byte()
-    lines = {}
+    while stop is None or mem.addr < stop:
+        inst = disasm_line(mem)
+        if inst is None:
+            segment = mem.segment_after(mem.addr)
+            if segment is None or (stop is not None and segment.start >= stop):
+                return
+            mem.addr = segment.start
+            continue
+        yield inst
+
+
+def text_line(inst):
+    return " " * 16 + format_line(inst)
+
+
+def disasm_nlines(mem, addr, max_line, out=None, stop=None, formatter=text_line):
+    """write max_line(0 for no limit) instructions from addr to out
+
+    formatter makes the line of an instruction. the lines before an error are
+    written before it is raised. returns the number of instructions.
+    """
+    if not mem.addr_in(addr):
+        raise AddressError(f"start address is out of range {addr:04x}")
+
+    if out is None:
+        out = Writer(sys.stdout)
+    insts = disasm_iter(mem, addr, stop)
+    if max_line > 0:
+        insts = islice(insts, max_line)
     count = 0
-    while op is not None:
-        func = MNEMONIC.get(op)
-        try:
-            text = func(op, mem)
-            line = format_line(addr, text, mem[addr : mem.addr])
-            print(" " * 16 + line)
-            lines[addr] = line
-        except Exception as e:
-            print(e, f"at {addr:04x}")
-            return lines
-
-        lines[addr] = format_line(addr, text, mem[addr : mem.addr])
-        addr = mem.addr
-        op = mem.next_byte()
-        count += 1
-        if count >= max_line:
-            break
-    return lines
-
-
-def get_branchs(lines):
+    try:
+        for inst in insts:
+            out.write(formatter(inst))
+            count += 1
+    finally:
+        out.flush()
+    return count
+
+
+def get_branchs(insts):
     branches = {}
-    for addr, text in lines.items():
-        m = re.search(r"(?:JP|CALL|JR).*?\$([0-9A-F]{4})", text, flags=re.IGNORECASE)
-        if m is None:
+    for inst in insts:
+        if inst.mnemonic not in {"JP", "CALL", "JR"} or inst.target is None:
             continue
-        branches[addr] = int(m.group(1), base=16)
+        branches[inst.addr] = inst.target
     return branches
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) != 2:
         exit()
     mem = Memory(open(sys.argv[1], "rb").read())
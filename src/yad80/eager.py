@@ -1,11 +1,15 @@
-import re
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
+from contextlib import nullcontext
 from dataclasses import dataclass
-import traceback
 
+from .cfg import ControlFlowGraph
+from .coverage import CODE, DATA, STRING, Coverage
 from .disasm import disasm_line
-
-debug_mode = False
+from .instruction import HALT, JUMP, RETURN, Instruction
+from .output import Writer
+from .profiling import Profile
+from .listing import renderer
 
 
 @dataclass
@@ -13,7 +17,6 @@ class Label:
     addr: int
     label_type: set
     used_addr: set
-    processed: bool
     name_cache: str = ""
 
     @property
@@ -32,65 +35,132 @@ class Label:
             self.name_cache = "EX_" + self.name_cache
 
 
-def add_branch_label(labels, addr, line):
-    LABEL_TYPE = {"CALL": "CD", "JR": "JR", "JP": "JP", "DJNZ": "JR"}
-    m = re.search(
-        r"^\s*(JP|JR|DJNZ|CALL)\s+.*?\$([0-9a-f]{4})", line, flags=re.IGNORECASE
-    )
-    if m is None:
-        return
-    target = int(m.group(2), base=16)
-    label = labels.setdefault(target, Label(target, set(), set(), False))
-    label.label_type.add(LABEL_TYPE[m.group(1)])
-    label.used_addr.add(addr)
-
-
-def add_data_label(labels, addr, line):
-    m = re.search(r"\(\$([0-9a-f]{4})\)", line, flags=re.IGNORECASE)
-    if m is None:
-        return
-    target = int(m.group(1), base=16)
-    label = labels.setdefault(target, Label(target, set(), set(), False))
-    label.label_type.add("DT")
-    label.used_addr.add(addr)
-
-
-STOP = set(["RET", "RETI", "RETN", "HALT"])
+LABEL_TYPE = {"CALL": "CD", "JR": "JR", "JP": "JP", "DJNZ": "JR"}
 
 
-def should_pause(line):
-    code = line.split(";")[0].strip()
-    if code in STOP:
-        return True
-    m = re.search(r"^\s*(JP|JR)\s+[\$(]", line)
-    return m is not None
+def add_branch_label(labels, inst):
+    """add a label for the branch target, return True for a new target"""
+    label_type = LABEL_TYPE.get(inst.mnemonic)
+    if label_type is None or inst.target is None:
+        return False
+    target = inst.target
+    new_target = target not in labels
+    label = labels.setdefault(target, Label(target, set(), set()))
+    label.label_type.add(label_type)
+    label.used_addr.add(inst.addr)
+    return new_target
 
 
-def in_range(ranges, addr):
-    return any(addr in r for r in ranges)
-
-
-def replace_branch_addr_ref(labels, lines):
-    for target, label in labels.items():
-        # if target not in lines:
-        #     continue
-        for addr in label.used_addr:
-            lines[addr] = lines[addr].replace(f"${target:04X}", label.name)
-
-
-def addr_label(addr, branch_labels, data_labels):
-    if addr in branch_labels:
-        return branch_labels[addr].name
-    if addr in data_labels:
-        return data_labels[addr].name
-
-
-def bytes2ascii(bstr):
-    block = bytearray(bstr)
-    for n, b in enumerate(block):
-        if b < 0x20 or b >= 0x7E:
-            block[n] = ord(".")
-    return block.decode("ascii")
+def add_data_label(labels, inst):
+    if inst.ref is None:
+        return
+    target = inst.ref
+    label = labels.setdefault(target, Label(target, set(), set()))
+    label.label_type.add("DT")
+    label.used_addr.add(inst.addr)
+
+
+def should_pause(inst):
+    if inst.conditional:
+        return False
+    return inst.flow in {JUMP, RETURN, HALT}
+
+
+class Tracer:
+    """worklist driven traversal of the reachable code
+
+    every branch target is queued once, and a walk stops at an instruction
+    start which is already decoded, so each instruction is decoded only once.
+    """
+
+    def __init__(self, mem, lines, branch_labels, data_labels, coverage, decoded=None):
+        # own cursor, the caller's mem.addr is left as it is
+        self.mem = mem.cursor()
+        # address -> Instruction of earlier analyses of the same memory
+        self.decoded = decoded
+        self.lines = lines
+        self.branch_labels = branch_labels
+        self.data_labels = data_labels
+        self.coverage = coverage
+        self.pending = deque()
+        self.visited = bytearray(mem.max_addr - mem.min_addr + 1)
+        # instruction in --code range -> address where its flow leaves the range
+        self.open_tails = {}
+        # counters of the profile
+        self.decodes = 0
+        self.decoded_bytes = 0
+        self.walks = 0
+
+    def is_visited(self, addr):
+        index = addr - self.mem.min_addr
+        return 0 <= index < len(self.visited) and self.visited[index]
+
+    def decode(self):
+        mem = self.mem
+        if self.decoded is None:
+            inst = disasm_line(mem)
+        else:
+            inst = self.decoded.get(mem.addr)
+            if inst is None:
+                inst = disasm_line(mem)
+                if inst is not None:
+                    self.decoded[inst.addr] = inst
+            else:
+                mem.current += inst.length
+        if inst is None:
+            return None
+        self.decodes += 1
+        self.decoded_bytes += inst.length
+        self.visited[inst.addr - self.mem.min_addr] = 1
+        self.lines[inst.addr] = inst
+        if add_branch_label(self.branch_labels, inst):
+            self.pending.append(inst.target)
+        add_data_label(self.data_labels, inst)
+        return inst
+
+    def code_range(self, rng):
+        """decode whole range regardless of stop instructions"""
+        mem = self.mem
+        self.coverage.mark(rng, CODE)
+        mem.addr = rng.start
+        run = []
+        while mem.addr < rng.stop:
+            inst = self.decode()
+            if inst is None:
+                break
+            run.append(inst.addr)
+            if should_pause(inst):
+                run.clear()
+        for addr in run:
+            self.open_tails[addr] = mem.addr
+
+    def walk(self, start_addr):
+        """decode until a stop instruction or decoded instruction"""
+        self.walks += 1
+        mem = self.mem
+        mem.addr = start_addr
+        while True:
+            if self.is_visited(mem.addr):
+                # continue after --code range, the range itself is decoded
+                tail = self.open_tails.get(mem.addr)
+                if tail is None or not mem.addr_in(tail):
+                    break
+                mem.addr = tail
+                continue
+            inst = self.decode()
+            if inst is None or should_pause(inst):
+                break
+        rng = range(start_addr, mem.addr)
+        self.coverage.mark(rng, CODE)
+        return rng
+
+    def run(self):
+        """walk all pending branch targets"""
+        while self.pending:
+            start_addr = self.pending.popleft()
+            if start_addr in self.lines or not self.mem.addr_in(start_addr):
+                continue
+            self.walk(start_addr)
 
 
 def bytes2string(bstr):
@@ -123,70 +193,15 @@ def scan_str_ref(lines, branch_labels):
     target_addrs = set(
         addr for addr, lbl in branch_labels.items() if "ST" in lbl.label_type
     )
-    for addr, line in lines.items():
-        m = re.search(r"(\(?\$[0-9a-f]{4}\)?)", line, flags=re.IGNORECASE)
-        if m is None:
+    for addr, inst in lines.items():
+        if not isinstance(inst, Instruction):
             continue
-        if m.group(1)[0] == "$":
-            ref_addr = int(m.group(1)[1:], base=16)
-        else:
-            ref_addr = int(m.group(1)[2:6], base=16)
+        ref_addr = inst.value
         if ref_addr not in target_addrs:
             continue
         branch_labels[ref_addr].used_addr.add(addr)
 
 
-def merge_ranges(ranges):
-    ranges.sort(key=lambda r: r.start)
-
-    merged = True
-    ofs = 0
-    while merged:
-        merged = False
-        for n in range(ofs, len(ranges) - 1):
-            if ranges[n].stop < ranges[n + 1].start:
-                ofs += 1
-                continue
-            start = min(ranges[n].start, ranges[n + 1].start)
-            stop = max(ranges[n].stop, ranges[n + 1].stop)
-            ranges[n : n + 2] = [range(start, stop)]
-            merged = True
-            break
-
-
-def create_data_ranges(code_ranges, min_addr, max_addr, label_addrs):
-    data_ranges = []
-
-    min_start = min(r.start for r in code_ranges)
-    if min_addr < min_start:
-        data_ranges.append(range(min_addr, min_start))
-    max_stop = max(r.stop for r in code_ranges)
-    if max_stop <= max_addr:
-        data_ranges.append(range(max_stop, max_addr + 1))
-
-    for n, rng in enumerate(code_ranges[:-1]):
-        data_ranges.append(range(rng.stop, code_ranges[n + 1].start))
-
-    ret_ranges = []
-    addr_set = set(label_addrs)
-    for rng in data_ranges:
-        if not addr_set:
-            ret_ranges.append(rng)
-            continue
-        addrs = sorted(a for a in addr_set if a in rng)
-        if not addrs:
-            ret_ranges.append(rng)
-            continue
-        start = rng.start
-        for addr in addrs:
-            ret_ranges.append(range(start, addr))
-            start = addr
-        ret_ranges.append(range(start, rng.stop))
-        addr_set -= set(addrs)
-
-    return ret_ranges
-
-
 def create_db_lines(lines, data_ranges, mem):
     for rng in data_ranges:
         lines.update(set_db_line(mem, rng))
@@ -206,178 +221,209 @@ def set_db_line(mem, rng):
     return lines
 
 
-def define_equ(mem, line_addrs, *group):
-    for labels in group:
-        for addr in sorted(labels.keys()):
-            if not mem.addr_in(addr):
-                print(f"{labels[addr].name:16}EQU     ${labels[addr].addr:04x}")
-                continue
-            if addr not in line_addrs:
-                print(
-                    f"{labels[addr].name:16}EQU     ${labels[addr].addr:04x} ; within CODE"
-                )
-                continue
-    print("")
+class Analysis:
+    """result of an eager analysis of mem
 
+    lines maps an address to its Instruction, or to the DB text of a string or
+    data line. branch_labels and data_labels map an address to its Label.
+    """
 
-def disasm_eagerly(args, mem):
-    global debug_mode
-    if args.debug:
-        debug_mode = True
+    def __init__(self, mem, code=(), entries=()):
+        self.mem = mem
+        self.code = list(code)
+        self.entries = list(entries)
+        self.lines = {}
+        self.branch_labels = defaultdict(dict)
+        self.data_labels = defaultdict(dict)
+        self.coverage = Coverage(max(0x10000, mem.max_addr + 1))
+        self.data_ranges = []
+        self.profile = Profile()
+        self.decodes = 0
+        self.decoded_bytes = 0
+        self._cfg = None
 
-    ranges = []
-    lines = {}
-    branch_labels = defaultdict(dict)
-    data_labels = defaultdict(dict)
+    @property
+    def instructions(self):
+        """decoded instructions in address order"""
+        return [
+            self.lines[addr]
+            for addr in sorted(self.lines)
+            if isinstance(self.lines[addr], Instruction)
+        ]
 
-    # --code
-    for rng in args.code:
-        ranges.append(rng)
-        mem.addr = rng.start
-        branch_labels[rng.start] = Label(rng.start, set(["CO"]), set(), True)
-        print(f"; start: {mem.start:04x}")
-        while mem.addr < rng.stop:
-            try:
-                addr, line = disasm_line(mem)
-                if line == "":
-                    break
-                lines[addr] = line
-                add_branch_label(branch_labels, addr, line)
-                add_data_label(data_labels, addr, line)
-            except Exception as e:
-                if debug_mode:
-                    traceback.print_exception(e)
-                else:
-                    print(e)
-                exit()
-
-    # --string
-    for rng in args.string:
-        ranges.append(rng)
-        addr = rng.start
-        text = bytes2string(mem[addr : rng.stop])
-        line = f'DB    {text} ;[{addr:04x}] {" ".join(f"{b:02x}" for b in mem[addr:rng.stop])}'
-        lines[addr] = line
-        branch_labels[addr] = Label(addr, "ST", set(), True)
-
-    # --addr
-    addrs = args.addr
-    if not lines and not addrs:
-        # no --code, no --addr
-        addrs = [mem.start]
-
-    for start_addr in addrs:
-        if start_addr not in branch_labels:
-            branch_labels[start_addr] = Label(start_addr, set(["AO"]), set(), True)
-        if start_addr in lines:
-            continue
-        mem.addr = start_addr
-        while True:
-            try:
-                addr, line = disasm_line(mem)
-                if line == "":
-                    break
-                lines[addr] = line
-                add_branch_label(branch_labels, addr, line)
-                add_data_label(data_labels, addr, line)
-            except Exception as e:
-                if debug_mode:
-                    traceback.print_exception(e)
-                else:
-                    print(e)
-                exit()
-            if should_pause(line):
-                break
-        ranges.append(range(start_addr, mem.addr))
-
-    # branch addresses
-    while True:
-        branches = sorted(a for a, lbl in branch_labels.items() if not lbl.processed)
-        if not branches:
-            break
-        for start_addr in branches:
-            if start_addr in lines or not mem.addr_in(start_addr):
-                branch_labels[start_addr].processed = True
-                continue
+    @property
+    def labels(self):
+        """label name -> address"""
+        return {
+            label.name: addr
+            for labels in (self.branch_labels, self.data_labels)
+            for addr, label in labels.items()
+        }
 
-            mem.addr = start_addr
-            while True:
-                addr, line = disasm_line(mem)
-                if line == "":
-                    break
-                lines[addr] = line
-                add_branch_label(branch_labels, addr, line)
-                add_data_label(data_labels, addr, line)
-                if should_pause(line):
-                    ranges.append(range(start_addr, mem.addr))
-                    break
+    @property
+    def xrefs(self):
+        """address -> sorted addresses of the instructions which refer to it"""
+        refs = defaultdict(set)
+        for labels in (self.branch_labels, self.data_labels):
+            for addr, label in labels.items():
+                refs[addr] |= label.used_addr
+        return {addr: sorted(refs[addr]) for addr in sorted(refs)}
 
-    scan_str_ref(lines, branch_labels)
-    merge_ranges(ranges)
+    @property
+    def counters(self):
+        """sizes of the analysis and the work done by the tracer"""
+        covered = bytearray(len(self.coverage))
+        insts = self.instructions
+        for inst in insts:
+            covered[inst.addr : inst.addr + inst.length] = b"\x01" * inst.length
+        decoded = covered.count(1)
+
+        def covered_bytes(kind):
+            return sum(len(rng) for rng in self.coverage.runs(kind))
+
+        return {
+            "instructions": len(insts),
+            "decoded": self.decodes,
+            "code_bytes": covered_bytes(CODE),
+            "string_bytes": covered_bytes(STRING),
+            "data_bytes": covered_bytes(DATA),
+            "branch_labels": len(self.branch_labels),
+            "data_labels": len(self.data_labels),
+            "redecoded_bytes": self.decoded_bytes - decoded,
+        }
 
-    if debug_mode:
+    @property
+    def cfg(self):
+        if self._cfg is None:
+            entries = [rng.start for rng in self.code] + self.entries
+            self._cfg = ControlFlowGraph(self.instructions, entries)
+        return self._cfg
+
+
+class Disassembler:
+    """eager disassembler with the hints of --code, --string and --addr
+
+    analyse() only reads mem, so a Disassembler may analyse many memories
+    concurrently. errors are raised as InstructionError or AddressError.
+    decoded, a dict of address -> Instruction, keeps the instructions for
+    the next analysis of the same memory contents. prefix is put before every
+    label name, e.g. B01_ for a bank.
+    """
+
+    def __init__(self, code=(), string=(), addr=(), decoded=None, prefix=""):
+        self.code = list(code)
+        self.string = list(string)
+        self.addr = list(addr)
+        self.decoded = decoded
+        self.prefix = prefix
+
+    def analyse(self, mem, profile=None):
+        """Analysis of mem, the time of each phase is added to profile"""
+        analysis = Analysis(mem, self.code)
+        if profile is not None:
+            analysis.profile = profile
+        phase = analysis.profile.phase
+        lines = analysis.lines
+        branch_labels = analysis.branch_labels
+        data_labels = analysis.data_labels
+        coverage = analysis.coverage
+        tracer = Tracer(
+            mem, lines, branch_labels, data_labels, coverage, self.decoded
+        )
+
+        # --code
+        with phase("code", len(self.code)):
+            for rng in self.code:
+                branch_labels[rng.start] = Label(rng.start, set(["CO"]), set())
+                tracer.code_range(rng)
+
+        # --string
+        with phase("string", len(self.string)):
+            for rng in self.string:
+                coverage.mark(rng, STRING)
+                addr = rng.start
+                text = bytes2string(mem[addr : rng.stop])
+                line = f'DB    {text} ;[{addr:04x}] {" ".join(f"{b:02x}" for b in mem[addr:rng.stop])}'
+                lines[addr] = line
+                branch_labels[addr] = Label(addr, "ST", set())
+
+        # --addr
+        addrs = self.addr
+        if not lines and not addrs:
+            # no --code, no --addr. unmapped entries are skipped as branches are
+            entries = [addr for addr in mem.entries if mem.addr_in(addr)]
+            addrs = entries or [mem.start]
+        analysis.entries = list(addrs)
+
+        with phase("addr", len(addrs)):
+            for start_addr in addrs:
+                if start_addr not in branch_labels:
+                    label = Label(start_addr, set(["AO"]), set())
+                    branch_labels[start_addr] = label
+                if start_addr in lines:
+                    continue
+                tracer.walk(start_addr)
+
+        # branch addresses
+        walks = tracer.walks
+        with phase("branch", 0):
+            tracer.run()
+        analysis.profile.add_calls("branch", tracer.walks - walks)
+        with phase("scan_str_ref"):
+            scan_str_ref(lines, branch_labels)
+
+        # DB
+        data_ranges = analysis.data_ranges
+        with phase("data_ranges"):
+            splits = sorted(data_labels.keys())
+            for segment in mem.segments:
+                gaps = coverage.gaps(segment.start, segment.stop, splits)
+                data_ranges.extend(gaps)
+            for rng in data_ranges:
+                coverage.mark(rng, DATA)
+        with phase("db_lines", len(data_ranges)):
+            create_db_lines(lines, data_ranges, mem)
+
+        # add EX_
+        with phase("labels", len(branch_labels) + len(data_labels)):
+            for labels in [branch_labels, data_labels]:
+                for label in labels.values():
+                    label.check_external(mem)
+                    if self.prefix:
+                        label.name_cache = self.prefix + label.name
+        analysis.decodes = tracer.decodes
+        analysis.decoded_bytes = tracer.decoded_bytes
+        return analysis
+
+
+def disasm_eagerly(args, mem, out=None, profile=None, name=None, prefix=""):
+    """write the listing to out, returns the number of instructions
+
+    with a Profile, the render and write phases and the counters are added.
+    name is the image name of --sqlite, FILE by default. prefix is the label
+    prefix of a bank.
+    """
+    if out is None:
+        out = Writer(sys.stdout)
+
+    disassembler = Disassembler(args.code, args.string, args.addr, prefix=prefix)
+    analysis = disassembler.analyse(mem, profile)
+    if args.debug:
         breakpoint()
-
-    # DB
-    data_ranges = create_data_ranges(
-        ranges, mem.min_addr, mem.max_addr, sorted(data_labels.keys())
-    )
-    create_db_lines(lines, data_ranges, mem)
-
-    # add EX_
-    for labels in [branch_labels, data_labels]:
-        for label in labels.values():
-            label.check_external(mem)
-
-    # add labels
-    replace_branch_addr_ref(branch_labels, lines)
-    replace_branch_addr_ref(data_labels, lines)
-
-    # define external and in-code label with  EQU
-    define_equ(mem, lines.keys(), branch_labels, data_labels)
-
-    addrs = sorted(lines.keys())
-    # ORG
-    print(" " * 16 + f"ORG     ${addrs[0]:04X}\n")
-
-    for addr in addrs:
-        label = addr_label(addr, branch_labels, data_labels)
-        if label is None:
-            print(" " * 16, end="")
-        elif len(label) < 15:
-            label += ":"
-            print(f"\n{label:16}", end="")
-        else:
-            print(f"\n{label}:")
-        cols = lines[addr].split(";")
-        print(f"{cols[0].strip():40}; {cols[1].strip()}")
-
-    # data or code
-    output_information(mem, branch_labels, data_labels, data_ranges)
-
-
-def output_information(mem, branch_labels, data_labels, data_ranges):
-    def print_xref(name, refs):
-        ADDR_PER_LINE = 10
-        for index in range(0, len(refs), ADDR_PER_LINE):
-            print(f"; {name:16}", end="")
-            print(
-                " ".join(
-                    f"${x:04x}"
-                    for x in refs[index : min(index + ADDR_PER_LINE, len(refs))]
-                )
-            )
-            name = ""
-
-    print("\n; XREF information")
-    for addr in sorted(list(branch_labels.keys() | data_labels.keys())):
-        if addr in branch_labels:
-            print_xref(branch_labels[addr].name, sorted(branch_labels[addr].used_addr))
-        if addr in data_labels:
-            print_xref(data_labels[addr].name, sorted(data_labels[addr].used_addr))
-
-    print("\n; DATA summary")
-    for rng in data_ranges:
-        decoded = bytes2ascii(mem[rng.start : rng.stop])
-        print(f"; ${rng.start:04x}-${rng.stop - 1:04x}, [${len(rng):4x}] ", end="")
-        print(decoded[:48])
+    if args.sqlite:
+        from .export import export_analysis
+
+        with nullcontext() if profile is None else profile.phase("export"):
+            export_analysis(args.sqlite, name or args.FILE, analysis)
+
+    listing = renderer(args.format)(analysis)
+    if profile is not None:
+        with profile.phase("render"):
+            listing = list(listing)
+        profile.counters.update(analysis.counters)
+    count = len(analysis.instructions)
+
+    with nullcontext() if profile is None else profile.phase("write"):
+        out.write_lines(listing)
+        out.flush()
+    return count
@@ -6,3 +6,7 @@ class InstructionError(Exception):
 
 class AddressError(Exception):
     """The Address is not in Memory"""
+
+
+class FileFormatError(Exception):
+    """Invalid image file"""
@@ -0,0 +1,190 @@
+"""export of eager analyses to an sqlite database for queries across images
+
+every row is keyed by the id of its image, an image is identified by the digest
+of its memory contents and exporting it again replaces its rows. an image is
+written in a single transaction, so processes of yad80-batch can share a file.
+
+xrefs are the edges from an instruction(src) to its target or memory operand
+(dst), kind is call, jump, read or write. routines are the blocks(start-stop,
+stop is exclusive) reachable from each routine entry of the call graph.
+
+every routine writing $E000:
+
+    SELECT DISTINCT images.name, routines.entry FROM xrefs
+    JOIN routines ON routines.image = xrefs.image
+        AND xrefs.src >= routines.start AND xrefs.src < routines.stop
+    JOIN images ON images.id = xrefs.image
+    WHERE xrefs.dst = 0xE000 AND xrefs.kind = 'write';
+
+every caller of $0012:
+
+    SELECT images.name, xrefs.src FROM xrefs JOIN images ON images.id = xrefs.image
+    WHERE xrefs.dst = 0x0012 AND xrefs.kind = 'call';
+"""
+
+import hashlib
+import sqlite3
+
+from .instruction import CALL, JUMP
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    digest TEXT UNIQUE,
+    name TEXT,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS instructions (
+    image INTEGER,
+    addr INTEGER,
+    code BLOB,
+    mnemonic TEXT,
+    operands TEXT,
+    flow TEXT,
+    target INTEGER,
+    ref INTEGER,
+    PRIMARY KEY (image, addr)
+);
+CREATE INDEX IF NOT EXISTS instructions_target ON instructions (target);
+CREATE TABLE IF NOT EXISTS labels (
+    image INTEGER, addr INTEGER, name TEXT, kind TEXT, external INTEGER
+);
+CREATE INDEX IF NOT EXISTS labels_addr ON labels (image, addr);
+CREATE INDEX IF NOT EXISTS labels_name ON labels (name);
+CREATE TABLE IF NOT EXISTS xrefs (image INTEGER, src INTEGER, dst INTEGER, kind TEXT);
+CREATE INDEX IF NOT EXISTS xrefs_dst ON xrefs (dst, kind);
+CREATE INDEX IF NOT EXISTS xrefs_src ON xrefs (image, src);
+CREATE TABLE IF NOT EXISTS data_ranges (image INTEGER, start INTEGER, stop INTEGER);
+CREATE INDEX IF NOT EXISTS data_ranges_start ON data_ranges (image, start);
+CREATE TABLE IF NOT EXISTS routines (
+    image INTEGER, entry INTEGER, start INTEGER, stop INTEGER
+);
+CREATE INDEX IF NOT EXISTS routines_start ON routines (image, start);
+CREATE INDEX IF NOT EXISTS routines_entry ON routines (image, entry);
+"""
+
+TABLES = ["instructions", "labels", "xrefs", "data_ranges", "routines"]
+
+# seconds to wait for another process writing the database
+TIMEOUT = 60
+
+
+def image_digest(mem):
+    """digest of the memory contents"""
+    digest = hashlib.sha256()
+    for segment in mem.segments:
+        digest.update(f"{segment.start:x} {len(segment):x} {segment.kind};".encode())
+        digest.update(segment.block)
+    return digest.hexdigest()
+
+
+def xref_edges(insts):
+    """(src, dst, kind) of the branches and memory operands of insts"""
+    for inst in insts:
+        if inst.target is not None and inst.flow in {CALL, JUMP}:
+            yield inst.addr, inst.target, "call" if inst.flow == CALL else "jump"
+        if inst.ref is not None:
+            # LD (nn),r has the address as its first operand
+            kind = "write" if inst.operands[0] == inst.ref else "read"
+            yield inst.addr, inst.ref, kind
+
+
+def routine_blocks(cfg):
+    """(entry, start, stop) of the blocks of every routine"""
+    for entry, starts in cfg.call_graph.routines.items():
+        for start in sorted(starts):
+            yield entry, start, cfg.blocks[start].end
+
+
+class Exporter:
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, timeout=TIMEOUT, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def image_id(self, digest, name, size):
+        """id of the image, its old rows are removed"""
+        row = self.conn.execute("SELECT id FROM images WHERE digest = ?", (digest,))
+        row = row.fetchone()
+        if row is None:
+            cursor = self.conn.execute(
+                "INSERT INTO images (digest, name, size) VALUES (?, ?, ?)",
+                (digest, name, size),
+            )
+            return cursor.lastrowid
+        image = row[0]
+        self.conn.execute(
+            "UPDATE images SET name = ?, size = ? WHERE id = ?", (name, size, image)
+        )
+        for table in TABLES:
+            self.conn.execute(f"DELETE FROM {table} WHERE image = ?", (image,))
+        return image
+
+    def export(self, name, analysis):
+        """write the analysis of the image name, returns its id"""
+        mem = analysis.mem
+        insts = analysis.instructions
+        size = sum(len(segment) for segment in mem.segments)
+        # IMMEDIATE takes the write lock at once, other exports wait for it
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            image = self.image_id(image_digest(mem), name, size)
+            self.insert(image, analysis, insts)
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return image
+
+    def insert(self, image, analysis, insts):
+        mem = analysis.mem
+        self.conn.executemany(
+            "INSERT INTO instructions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    image,
+                    inst.addr,
+                    bytes(inst.code),
+                    inst.mnemonic,
+                    inst.operand_text(),
+                    inst.flow,
+                    inst.target,
+                    inst.ref,
+                )
+                for inst in insts
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO labels VALUES (?, ?, ?, ?, ?)",
+            (
+                (image, addr, label.name, kind, not mem.addr_in(addr))
+                for kind, labels in [
+                    ("branch", analysis.branch_labels),
+                    ("data", analysis.data_labels),
+                ]
+                for addr, label in labels.items()
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO xrefs VALUES (?, ?, ?, ?)",
+            ((image, *edge) for edge in xref_edges(insts)),
+        )
+        self.conn.executemany(
+            "INSERT INTO data_ranges VALUES (?, ?, ?)",
+            ((image, rng.start, rng.stop) for rng in analysis.data_ranges),
+        )
+        self.conn.executemany(
+            "INSERT INTO routines VALUES (?, ?, ?, ?)",
+            ((image, *block) for block in routine_blocks(analysis.cfg)),
+        )
+
+
+def export_analysis(path, name, analysis):
+    """write the analysis of the image name to the database path"""
+    exporter = Exporter(path)
+    try:
+        return exporter.export(name, analysis)
+    finally:
+        exporter.close()
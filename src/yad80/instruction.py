@@ -0,0 +1,92 @@
+FALL = "fallthrough"
+JUMP = "jump"
+CALL = "call"
+RETURN = "return"
+HALT = "halt"
+
+
+class Instruction:
+    """Decoded instruction
+
+    operands are str (register, condition, 8 bit value, ...) or int.
+    an int operand is a 16 bit address or value and is rendered as $XXXX or
+    its label, in parentheses when the instruction references memory.
+    code is sliced from the block of the decoded memory when it is read.
+    """
+
+    __slots__ = (
+        "addr",
+        "length",
+        "block",
+        "index",
+        "mnemonic",
+        "operands",
+        "target",
+        "ref",
+        "flow",
+        "conditional",
+    )
+
+    def __init__(
+        self,
+        mnemonic,
+        operands=(),
+        flow=FALL,
+        target=None,
+        ref=None,
+        conditional=False,
+    ):
+        self.addr = 0
+        self.length = 0
+        self.block = b""
+        self.index = 0
+        self.mnemonic = mnemonic
+        self.operands = operands
+        self.target = target
+        self.ref = ref
+        self.flow = flow
+        self.conditional = conditional
+
+    def __repr__(self):
+        return f"Instruction({self.addr:04x}: {self.text})"
+
+    @property
+    def code(self):
+        return self.block[self.index : self.index + self.length]
+
+    @code.setter
+    def code(self, code):
+        self.block = code
+        self.index = 0
+        self.length = len(code)
+
+    @property
+    def value(self):
+        """16 bit operand(address or immediate value) if any"""
+        for operand in self.operands:
+            if isinstance(operand, int):
+                return operand
+        return None
+
+    def operand_items(self, resolve=None):
+        """operands as a list of text, see operand_text"""
+        items = []
+        for operand in self.operands:
+            if not isinstance(operand, int):
+                items.append(operand)
+                continue
+            name = None if resolve is None else resolve(self, operand)
+            if name is None:
+                name = f"${operand:04X}"
+            items.append(name if self.ref is None else f"({name})")
+        return items
+
+    def operand_text(self, resolve=None):
+        """operands as text, resolve(inst, addr) returns a label name or None"""
+        return ",".join(self.operand_items(resolve))
+
+    @property
+    def text(self):
+        if not self.operands:
+            return self.mnemonic
+        return f"{self.mnemonic} {self.operand_text()}"
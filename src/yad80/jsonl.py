@@ -0,0 +1,97 @@
+"""JSON Lines listing, one record per line
+
+an instruction or data item record per listing line in address order, then
+the label records and the data range records.
+
+{"type": "inst", "addr", "bytes", "mnemonic", "operands", "label", "target",
+ "ref", "xrefs"}
+{"type": "data", "addr", "bytes", "label", "xrefs"}
+{"type": "label", "addr", "name", "kind", "external", "xrefs"}
+{"type": "data_range", "start", "end", "size"}
+
+bytes is a hex string, end is inclusive and xrefs are the addresses of the
+instructions which refer to the address.
+"""
+
+import json
+
+from .instruction import Instruction
+from .listing import addr_label, label_resolver
+
+
+def inst_record(inst, resolve=None, label=None, xrefs=()):
+    return {
+        "type": "inst",
+        "addr": inst.addr,
+        "bytes": bytes(inst.code).hex(),
+        "mnemonic": inst.mnemonic,
+        "operands": inst.operand_items(resolve),
+        "label": label,
+        "target": inst.target,
+        "ref": inst.ref,
+        "xrefs": list(xrefs),
+    }
+
+
+def inst_line(inst):
+    """record line of an instruction of simple mode"""
+    return json.dumps(inst_record(inst))
+
+
+def render_jsonl(analysis):
+    """record lines of an Analysis"""
+    mem = analysis.mem
+    branch_labels = analysis.branch_labels
+    data_labels = analysis.data_labels
+    resolve = label_resolver(branch_labels, data_labels)
+
+    def xrefs(addr):
+        refs = set()
+        for labels in (branch_labels, data_labels):
+            if addr in labels:
+                refs |= labels[addr].used_addr
+        return sorted(refs)
+
+    addrs = sorted(analysis.lines)
+    for n, addr in enumerate(addrs):
+        item = analysis.lines[addr]
+        label = addr_label(addr, branch_labels, data_labels)
+        if isinstance(item, Instruction):
+            record = inst_record(item, resolve, label, xrefs(addr))
+        else:
+            # a DB line lasts until the next line or the end of its segment
+            stop = mem.segment_at(addr).stop
+            if n + 1 < len(addrs):
+                stop = min(stop, addrs[n + 1])
+            record = {
+                "type": "data",
+                "addr": addr,
+                "bytes": bytes(mem[addr:stop]).hex(),
+                "label": label,
+                "xrefs": xrefs(addr),
+            }
+        yield json.dumps(record)
+
+    for addr in sorted(branch_labels.keys() | data_labels.keys()):
+        for kind, labels in (("branch", branch_labels), ("data", data_labels)):
+            label = labels.get(addr)
+            if label is None:
+                continue
+            record = {
+                "type": "label",
+                "addr": addr,
+                "name": label.name,
+                "kind": kind,
+                "external": not mem.addr_in(addr),
+                "xrefs": sorted(label.used_addr),
+            }
+            yield json.dumps(record)
+
+    for rng in analysis.data_ranges:
+        record = {
+            "type": "data_range",
+            "start": rng.start,
+            "end": rng.stop - 1,
+            "size": len(rng),
+        }
+        yield json.dumps(record)
@@ -0,0 +1,126 @@
+"""text listing of an eager analysis"""
+
+from .disasm import format_code, format_comment
+from .instruction import Instruction
+
+
+def label_resolver(branch_labels, data_labels):
+    """resolve an address operand to the label which records the instruction"""
+
+    def resolve(inst, addr):
+        for labels in (branch_labels, data_labels):
+            label = labels.get(addr)
+            if label is not None and inst.addr in label.used_addr:
+                return label.name
+        return None
+
+    return resolve
+
+
+def render_line(item, resolve):
+    if isinstance(item, Instruction):
+        return f"{format_code(item, resolve):40}; {format_comment(item)}"
+    cols = item.split(";")
+    return f"{cols[0].strip():40}; {cols[1].strip()}"
+
+
+def addr_label(addr, branch_labels, data_labels):
+    if addr in branch_labels:
+        return branch_labels[addr].name
+    if addr in data_labels:
+        return data_labels[addr].name
+
+
+def bytes2ascii(bstr):
+    block = bytearray(bstr)
+    for n, b in enumerate(block):
+        if b < 0x20 or b >= 0x7E:
+            block[n] = ord(".")
+    return block.decode("ascii")
+
+
+def define_equ(mem, line_addrs, *group):
+    for labels in group:
+        for addr in sorted(labels.keys()):
+            equ = f"{labels[addr].name:16}EQU     ${labels[addr].addr:04x}"
+            if not mem.addr_in(addr):
+                yield equ
+                continue
+            if addr not in line_addrs:
+                yield equ + " ; within CODE"
+                continue
+    yield ""
+
+
+def output_lines(lines, branch_labels, data_labels, orgs=()):
+    """listing lines, a new ORG is put at every address in orgs"""
+    resolve = label_resolver(branch_labels, data_labels)
+    addrs = sorted(lines.keys())
+    # ORG
+    yield " " * 16 + f"ORG     ${addrs[0]:04X}"
+    yield ""
+
+    for addr in addrs:
+        if addr in orgs and addr != addrs[0]:
+            yield ""
+            yield " " * 16 + f"ORG     ${addr:04X}"
+        label = addr_label(addr, branch_labels, data_labels)
+        line = render_line(lines[addr], resolve)
+        if label is None:
+            yield " " * 16 + line
+        elif len(label) < 15:
+            label += ":"
+            yield ""
+            yield f"{label:16}{line}"
+        else:
+            yield ""
+            yield f"{label}:"
+            yield line
+
+
+def output_information(mem, branch_labels, data_labels, data_ranges):
+    def xref_lines(name, refs):
+        ADDR_PER_LINE = 10
+        for index in range(0, len(refs), ADDR_PER_LINE):
+            yield f"; {name:16}" + " ".join(
+                f"${x:04x}" for x in refs[index : min(index + ADDR_PER_LINE, len(refs))]
+            )
+            name = ""
+
+    yield ""
+    yield "; XREF information"
+    for addr in sorted(list(branch_labels.keys() | data_labels.keys())):
+        if addr in branch_labels:
+            label = branch_labels[addr]
+            yield from xref_lines(label.name, sorted(label.used_addr))
+        if addr in data_labels:
+            label = data_labels[addr]
+            yield from xref_lines(label.name, sorted(label.used_addr))
+
+    yield ""
+    yield "; DATA summary"
+    for rng in data_ranges:
+        decoded = bytes2ascii(mem[rng.start : rng.stop])
+        yield f"; ${rng.start:04x}-${rng.stop - 1:04x}, [${len(rng):4x}] {decoded[:48]}"
+
+
+def renderer(fmt="text"):
+    """render function of an output format, text or jsonl"""
+    if fmt == "jsonl":
+        from .jsonl import render_jsonl
+
+        return render_jsonl
+    return render
+
+
+def render(analysis):
+    """listing lines of an Analysis"""
+    mem = analysis.mem
+    branch_labels = analysis.branch_labels
+    data_labels = analysis.data_labels
+    yield from (f"; start: {mem.start:04x}" for _ in analysis.code)
+    # define external and in-code label with  EQU
+    yield from define_equ(mem, analysis.lines.keys(), branch_labels, data_labels)
+    yield from output_lines(analysis.lines, branch_labels, data_labels, set(mem.starts))
+    # data or code
+    yield from output_information(mem, branch_labels, data_labels, analysis.data_ranges)
@@ -1,25 +1,51 @@
+import mmap
+import os
 import os.path
 import struct
 
-from .memory import Memory
+from .exceptions import AddressError, FileFormatError
+from .memory import RAM, Memory
+
+# files from this size on are memory mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
 
 
 def read_file(file):
     with open(file, "rb") as fp:
-        return fp.read()
+        if os.fstat(fp.fileno()).st_size < MMAP_THRESHOLD:
+            return fp.read()
+        return memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
 
 
-def load_mzt(file):
-    data = read_file(file)
-    if data[0] != 1:
-        print(f"invalid MZT file: {file}, : Attribute is ${data[0]:02X}")
-        exit()
-    size, offset, start = struct.unpack("<3H", data[0x12:0x18])
-    if size + 128 != len(data):
-        print(f"invalid MZT file: {file}, may be multiple data block")
-        exit()
+MZT_HEADER_SIZE = 128
+
 
-    return Memory(data[128 : size + 128], offset=offset, start=start)
+def mzt_records(fp, file):
+    """(addr, data) of the blocks of an MZT file, data is None for the exec"""
+    blocks = 0
+    while header := fp.read(MZT_HEADER_SIZE):
+        if len(header) < MZT_HEADER_SIZE:
+            raise FileFormatError(f"invalid MZT file: {file}, truncated header")
+        if header[0] != 1:
+            raise FileFormatError(
+                f"invalid MZT file: {file}, : Attribute is ${header[0]:02X}"
+            )
+        size, offset, start = struct.unpack("<3H", header[0x12:0x18])
+        data = fp.read(size)
+        if len(data) < size:
+            raise FileFormatError(f"invalid MZT file: {file}, truncated data")
+        blocks += 1
+        yield offset, data
+        yield start, None
+
+    if blocks == 0:
+        raise FileFormatError(f"invalid MZT file: {file}, no data block")
+
+
+def load_mzt(file):
+    """map every block at its load address, exec addresses are the entries"""
+    with open(file, "rb") as fp:
+        return map_records(Memory(), mzt_records(fp, file), file)
 
 
 def load_bin(file, offset):
@@ -27,10 +53,163 @@ def load_bin(file, offset):
     return Memory(data, offset=offset)
 
 
+def load_segment(mem, file, addr, kind=RAM):
+    """map a binary file at addr"""
+    mem.add_segment(addr, read_file(file), kind)
+
+
+def parse_record(line, file, lineno):
+    """bytes of a hex record line without its mark"""
+    try:
+        record = bytes.fromhex(line)
+    except ValueError:
+        raise FileFormatError(f"invalid record: {file}, line {lineno}")
+    if len(record) < 2:
+        raise FileFormatError(f"short record: {file}, line {lineno}")
+    return record
+
+
+# data size of Intel HEX records by type, any size for a data record
+HEX_DATA_SIZE = {0x01: 0, 0x02: 2, 0x03: 4, 0x04: 2, 0x05: 4}
+
+
+def hex_records(fp, file):
+    """(addr, data) of Intel HEX data records, data is None for the start"""
+    base = 0
+    for lineno, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith(":"):
+            raise FileFormatError(f"invalid record: {file}, line {lineno}")
+        record = parse_record(line[1:], file, lineno)
+        count = record[0]
+        if len(record) != count + 5:
+            raise FileFormatError(f"invalid length: {file}, line {lineno}")
+        if sum(record) & 0xFF:
+            raise FileFormatError(f"checksum error: {file}, line {lineno}")
+        addr = record[1] << 8 | record[2]
+        data = record[4:-1]
+        rectype = record[3]
+        if rectype in HEX_DATA_SIZE and len(data) != HEX_DATA_SIZE[rectype]:
+            raise FileFormatError(f"invalid length: {file}, line {lineno}")
+        if rectype == 0x00:
+            yield base + addr, data
+        elif rectype == 0x01:
+            return
+        elif rectype == 0x02:
+            base = int.from_bytes(data, "big") << 4
+        elif rectype == 0x03:
+            cs, ip = struct.unpack(">2H", data)
+            yield (cs << 4) + ip, None
+        elif rectype == 0x04:
+            base = int.from_bytes(data, "big") << 16
+        elif rectype == 0x05:
+            yield int.from_bytes(data, "big"), None
+        else:
+            raise FileFormatError(f"unknown record type: {file}, line {lineno}")
+
+
+# address size of S-records by type
+SREC_ADDR_SIZE = {"1": 2, "2": 3, "3": 4, "5": 2, "6": 3, "7": 4, "8": 3, "9": 2}
+
+
+def srec_records(fp, file):
+    """(addr, data) of Motorola S-record data records, data is None for the start"""
+    for lineno, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith("S") or len(line) < 2:
+            raise FileFormatError(f"invalid record: {file}, line {lineno}")
+        rectype = line[1]
+        record = parse_record(line[2:], file, lineno)
+        if len(record) != record[0] + 1:
+            raise FileFormatError(f"invalid length: {file}, line {lineno}")
+        if sum(record) & 0xFF != 0xFF:
+            raise FileFormatError(f"checksum error: {file}, line {lineno}")
+        if rectype == "0":
+            continue
+        if rectype not in SREC_ADDR_SIZE:
+            raise FileFormatError(f"unknown record type: {file}, line {lineno}")
+        size = SREC_ADDR_SIZE[rectype]
+        # a data record has data after the address, the others have none
+        data_size = len(record) - size - 2
+        if data_size < 0 or (data_size and rectype not in "123"):
+            raise FileFormatError(f"invalid length: {file}, line {lineno}")
+        addr = int.from_bytes(record[1 : 1 + size], "big")
+        if rectype in "123":
+            yield addr, record[1 + size : -1]
+        elif rectype in "789":
+            yield addr, None
+            return
+
+
+def map_records(mem, records, file):
+    """map the data of (addr, data) records, contiguous records are joined
+
+    the start addresses which are mapped are the entries.
+    """
+    runs = {}
+    starts = {}  # end of a run -> its start
+    for addr, data in records:
+        if data is None:
+            if addr not in mem.entries:
+                mem.entries.append(addr)
+            continue
+        start = starts.pop(addr, None)
+        if start is None:
+            if addr in runs:
+                raise AddressError(f"{addr:04x} is defined twice")
+            start = addr
+            runs[start] = bytearray()
+        runs[start] += data
+        starts[start + len(runs[start])] = start
+
+    # join runs which were out of order
+    merged = []
+    for start in sorted(runs):
+        if merged and merged[-1][0] + len(merged[-1][1]) == start:
+            merged[-1][1].extend(runs[start])
+        else:
+            merged.append((start, runs[start]))
+    if not merged:
+        raise FileFormatError(f"no data record: {file}")
+    for start, block in merged:
+        mem.add_segment(start, block)
+    # e.g. the exec address of an MZT data block is often an unmapped 0000
+    mem.entries = [addr for addr in mem.entries if mem.addr_in(addr)]
+    if mem.entries:
+        mem.start = mem.entries[0]
+    return mem
+
+
+def load_hex(file):
+    with open(file) as fp:
+        return map_records(Memory(), hex_records(fp, file), file)
+
+
+def load_srec(file):
+    with open(file) as fp:
+        return map_records(Memory(), srec_records(fp, file), file)
+
+
+LOADERS = {
+    ".mzt": load_mzt,
+    ".hex": load_hex,
+    ".ihx": load_hex,
+    ".ihex": load_hex,
+    ".s19": load_srec,
+    ".s28": load_srec,
+    ".s37": load_srec,
+    ".srec": load_srec,
+    ".mot": load_srec,
+}
+
+
 def load(file, offset):
     _, ext = os.path.splitext(file)
-    ext = ext.lower()
-    if ext == ".mzt":
-        return load_mzt(file)
-    else:
+    loader = LOADERS.get(ext.lower())
+    if loader is None:
         return load_bin(file, offset)
+    return loader(file)
@@ -1,17 +1,140 @@
+import copy
+from bisect import bisect_right
+
 from .exceptions import AddressError
 
+ROM = "ROM"
+RAM = "RAM"
+UNMAPPED = "unmapped"
+
+
+class Segment:
+    """block mapped at start, kind is ROM or RAM"""
+
+    __slots__ = ("start", "block", "kind")
+
+    def __init__(self, start, block, kind=RAM):
+        self.start = start
+        self.block = memoryview(block)
+        self.kind = kind
+
+    @property
+    def stop(self):
+        return self.start + len(self.block)
+
+    def __len__(self):
+        return len(self.block)
+
+    def __contains__(self, addr):
+        return self.start <= addr < self.stop
+
+    def __repr__(self):
+        return f"{self.kind} {self.start:04x}-{self.stop - 1:04x}"
+
 
 class Memory:
-    def __init__(self, block, start=0, offset=0):
-        self.block = block
+    """segments sorted by address
+
+    byte-adjacent segments are joined into one run, so an instruction or a
+    walk may cross from one into the other. the run of a single segment is
+    its block, only the blocks of adjacent segments are copied into a run.
+    block, offset and current are those of the run at addr, slicing within a
+    run returns a memoryview of its block. the kind(ROM or RAM) stays with
+    each segment.
+    """
+
+    def __init__(self, block=b"", start=0, offset=0, kind=RAM):
+        self.segments = []
+        self.starts = []
+        # segments of the joined blocks, their kind is None
+        self.runs = []
+        self.run_starts = []
+        self.block = memoryview(b"")
         self.offset = offset
         self.current = 0
-        self.min_addr = offset
-        self.max_addr = offset + len(block) - 1
-        if start != 0:
-            self.start = start
-        else:
-            self.start = self.min_addr
+        self.entry = start if start != 0 else None
+        # entry point candidates, e.g. exec addresses of the loaded blocks
+        self.entries = []
+        self.add_segment(offset, block, kind)
+
+    def add_segment(self, start, block, kind=RAM):
+        """map block at start, overlapping segments are an error"""
+        segment = Segment(start, block, kind)
+        if len(segment) == 0:
+            return
+        n = bisect_right(self.starts, start)
+        if n > 0 and self.segments[n - 1].stop > start:
+            raise AddressError(f"{segment} overlaps {self.segments[n - 1]}")
+        if n < len(self.segments) and self.segments[n].start < segment.stop:
+            raise AddressError(f"{segment} overlaps {self.segments[n]}")
+        self.segments.insert(n, segment)
+        self.starts.insert(n, start)
+        self.join_runs()
+        if len(self.segments) == 1:
+            self.rewind()
+        elif self.run_at(self.addr) is not None:
+            # the block of the run at addr may be a joined one now
+            self.addr = self.addr
+
+    def join_runs(self):
+        groups = []
+        for segment in self.segments:
+            if groups and groups[-1][-1].stop == segment.start:
+                groups[-1].append(segment)
+            else:
+                groups.append([segment])
+        runs = []
+        for group in groups:
+            if len(group) == 1:
+                runs.append(Segment(group[0].start, group[0].block, None))
+            else:
+                block = b"".join(segment.block for segment in group)
+                runs.append(Segment(group[0].start, block, None))
+        # in place, cursors share the lists
+        self.runs[:] = runs
+        self.run_starts[:] = [run.start for run in runs]
+
+    def cursor(self):
+        """Memory sharing the segments with its own addr"""
+        return copy.copy(self)
+
+    def segment_at(self, addr):
+        n = bisect_right(self.starts, addr) - 1
+        if n < 0 or addr >= self.segments[n].stop:
+            return None
+        return self.segments[n]
+
+    def run_at(self, addr):
+        """run of the adjacent segments at addr"""
+        n = bisect_right(self.run_starts, addr) - 1
+        if n < 0 or addr >= self.runs[n].stop:
+            return None
+        return self.runs[n]
+
+    def segment_after(self, addr):
+        """first segment which starts after addr"""
+        n = bisect_right(self.starts, addr)
+        return self.segments[n] if n < len(self.segments) else None
+
+    def kind_at(self, addr):
+        segment = self.segment_at(addr)
+        return UNMAPPED if segment is None else segment.kind
+
+    @property
+    def min_addr(self):
+        return self.starts[0] if self.segments else self.offset
+
+    @property
+    def max_addr(self):
+        return self.segments[-1].stop - 1 if self.segments else self.offset - 1
+
+    @property
+    def start(self):
+        return self.min_addr if self.entry is None else self.entry
+
+    @start.setter
+    def start(self, value):
+        self.entry = value
 
     def next_byte(self):
         if self.current < len(self.block):
@@ -21,13 +144,14 @@ class Memory:
         return None
 
     def rewind(self):
-        self.current = 0
+        if self.segments:
+            self.addr = self.min_addr
 
     def __repr__(self):
         return (
             f"offset:{self.offset:x}, start: {self.start:04x}, "
             f"addr:{self.min_addr:04x}-{self.max_addr:04x}, "
-            f"size:{len(self):04x}"
+            f"size:{len(self):04x}, segments:{self.segments}"
         )
 
     @property
@@ -36,21 +160,25 @@ class Memory:
 
     @addr.setter
     def addr(self, value):
-        if value < self.min_addr or value > self.max_addr:
+        run = self.run_at(value)
+        if run is None:
             raise AddressError(f"invalid addr {value:04x}")
-        self.current = value - self.offset
+        self.block = run.block
+        self.offset = run.start
+        self.current = value - run.start
 
     def __len__(self):
-        return len(self.block)
+        return sum(len(segment) for segment in self.segments)
 
     def addr_in(self, addr):
-        return self.min_addr <= addr <= self.max_addr
+        return self.segment_at(addr) is not None
 
     def __getitem__(self, index):
         if isinstance(index, int):
-            if index < self.min_addr or index > self.max_addr:
+            segment = self.segment_at(index)
+            if segment is None:
                 raise AddressError(f"{index:04x} out of range")
-            return self.block[index - self.offset]
+            return segment.block[index - segment.start]
 
         if not isinstance(index, slice):
             raise AddressError(f"invalid index {index!r}")
@@ -62,7 +190,7 @@ class Memory:
         if stop is None:
             stop = self.max_addr + 1
 
-        if start < self.min_addr or stop > self.max_addr + 1:
+        run = self.run_at(start)
+        if run is None or stop < start or stop > run.stop:
             raise AddressError(f"invalid slice ${start}:${stop:04x}")
-
-        return self.block[start - self.offset : stop - self.offset]
+        return run.block[start - run.start : stop - run.start]
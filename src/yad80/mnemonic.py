@@ -1,4 +1,5 @@
 from .exceptions import InstructionError
+from .instruction import CALL, HALT, JUMP, RETURN, Instruction
 from .mnemonic_cb import MNEMONIC_CB
 from .mnemonic_dd_fd import MNEMONIC_DD_FD
 from .mnemonic_defs import (
@@ -8,6 +9,8 @@ from .mnemonic_defs import (
     REG16_AF,
     REG16_SP,
     ROTATE_SHIFT,
+    arithmetic_operands,
+    next_word,
     uint8_to_int8,
 )
 from .mnemonic_ed import MNEMONIC_ED
@@ -17,162 +20,153 @@ def ld_reg8_reg8(op, _):
     r1 = (op >> 3) & 7
     r2 = op & 7
     if r1 == r2 == 6:  # just in case
-        return "HALT"
-    return f"LD {REG8[r1]},{REG8[r2]}"
+        return Instruction("HALT", flow=HALT)
+    return Instruction("LD", (REG8[r1], REG8[r2]))
 
 
 def ld_reg8_n(op, mem):
     r = (op >> 3) & 7
     n = mem.next_byte()
-    return f"LD {REG8[r]},${n:02X}"
+    return Instruction("LD", (REG8[r], f"${n:02X}"))
 
 
 def ld_reg16_nn(op, mem):
     rr = (op >> 4) & 3
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD {REG16_SP[rr]},${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("LD", (REG16_SP[rr], nn))
 
 
 def ld_mem_HL(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD (${n2:02X}{n1:02X}),HL"
+    nn = next_word(mem)
+    return Instruction("LD", (nn, "HL"), ref=nn)
 
 
 def ld_HL_mem(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD HL,(${n2:02X}{n1:02X})"
+    nn = next_word(mem)
+    return Instruction("LD", ("HL", nn), ref=nn)
 
 
 def ld_mem_A(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD (${n2:02X}{n1:02X}),A"
+    nn = next_word(mem)
+    return Instruction("LD", (nn, "A"), ref=nn)
 
 
 def ld_A_mem(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD A,(${n2:02X}{n1:02X})"
+    nn = next_word(mem)
+    return Instruction("LD", ("A", nn), ref=nn)
 
 
 def arithmetic_reg8(op, _):
     p = (op >> 3) & 7
     r = op & 7
-    return f"{ARITHMETIC[p]}{REG8[r]}"
+    return Instruction(ARITHMETIC[p], arithmetic_operands(p, REG8[r]))
 
 
 def arithmetic_reg8_n(op, mem):
     p = (op >> 3) & 7
     n = mem.next_byte()
-    return f"{ARITHMETIC[p]}${n:02X}"
+    return Instruction(ARITHMETIC[p], arithmetic_operands(p, f"${n:02X}"))
 
 
 def add_hl(op, _):
     rr = (op >> 4) & 3
-    return f"ADD HL,{REG16_SP[rr]}"
+    return Instruction("ADD", ("HL", REG16_SP[rr]))
 
 
 def inc_reg16(op, _):
     rr = (op >> 4) & 3
-    return f"INC {REG16_SP[rr]}"
+    return Instruction("INC", (REG16_SP[rr],))
 
 
 def dec_reg16(op, _):
     rr = (op >> 4) & 3
-    return f"DEC {REG16_SP[rr]}"
+    return Instruction("DEC", (REG16_SP[rr],))
 
 
 def inc_reg8(op, _):
     r = (op >> 3) & 7
-    return f"INC {REG8[r]}"
+    return Instruction("INC", (REG8[r],))
 
 
 def dec_reg8(op, _):
     r = (op >> 3) & 7
-    return f"DEC {REG8[r]}"
+    return Instruction("DEC", (REG8[r],))
 
 
 def rotate_shift(op, _):
     p = (op >> 3) & 7
-    return ROTATE_SHIFT[p]
+    return Instruction(ROTATE_SHIFT[p])
 
 
 def djnz(_, mem):
     n = mem.next_byte()
     addr = mem.addr + uint8_to_int8(n)
-    return f"DJNZ ${addr:04X}"
+    return Instruction("DJNZ", (addr,), JUMP, target=addr, conditional=True)
 
 
 def jr(_, mem):
     n = mem.next_byte()
     addr = mem.addr + uint8_to_int8(n)
-    return f"JR ${addr:04X}"
+    return Instruction("JR", (addr,), JUMP, target=addr)
 
 
 def jr_cc(op, mem):
     cc = (op >> 3) & 7 - 4
     n = mem.next_byte()
     addr = mem.addr + uint8_to_int8(n)
-    return f"JR {CC[cc]},${addr:04X}"
+    return Instruction("JR", (CC[cc], addr), JUMP, target=addr, conditional=True)
 
 
 def ret_cc(op, _):
     cc = (op >> 3) & 7
-    return f"RET {CC[cc]}"
+    return Instruction("RET", (CC[cc],), RETURN, conditional=True)
 
 
 def pop_reg16(op, _):
     rr = (op >> 4) & 3
-    return f"POP {REG16_AF[rr]}"
+    return Instruction("POP", (REG16_AF[rr],))
 
 
 def push_reg16(op, _):
     rr = (op >> 4) & 3
-    return f"PUSH {REG16_AF[rr]}"
+    return Instruction("PUSH", (REG16_AF[rr],))
 
 
 def jp_cc(op, mem):
     cc = (op >> 3) & 7
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"JP {CC[cc]},${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("JP", (CC[cc], nn), JUMP, target=nn, conditional=True)
 
 
 def jp(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"JP ${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("JP", (nn,), JUMP, target=nn)
 
 
 def call_cc(op, mem):
     cc = (op >> 3) & 7
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"CALL {CC[cc]},${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("CALL", (CC[cc], nn), CALL, target=nn, conditional=True)
 
 
 def call(_, mem):
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"CALL ${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("CALL", (nn,), CALL, target=nn)
 
 
 def rst(op, _):
     p = (op >> 3) & 7
-    return f"RST ${p * 8:02X}"
+    return Instruction("RST", (f"${p * 8:02X}",), CALL, target=p * 8)
 
 
 def out(_, mem):
     n = mem.next_byte()
-    return f"OUT (${n:02X}),A"
+    return Instruction("OUT", (f"(${n:02X})", "A"))
 
 
 def in_(_, mem):
     n = mem.next_byte()
-    return f"IN A,(${n:02X})"
+    return Instruction("IN", ("A", f"(${n:02X})"))
 
 
 def opecode_cb(_, mem):
@@ -198,30 +192,30 @@ def opecode_dd_fd(op1, mem):
 
 
 MNEMONIC = {
-    0x00: lambda *_: "NOP",
+    0x00: lambda *_: Instruction("NOP"),
     0x01: ld_reg16_nn,
-    0x02: lambda *_: "LD (BC),A",
+    0x02: lambda *_: Instruction("LD", ("(BC)", "A")),
     0x03: inc_reg16,
     0x04: inc_reg8,
     0x05: dec_reg8,
     0x06: ld_reg8_n,
     0x07: rotate_shift,
-    0x08: lambda *_: "EX AF,AF'",
+    0x08: lambda *_: Instruction("EX", ("AF", "AF'")),
     0x09: add_hl,
-    0x0A: lambda *_: "LD A,(BC)",
+    0x0A: lambda *_: Instruction("LD", ("A", "(BC)")),
     0x0B: dec_reg16,
     0x0C: dec_reg8,
     0x10: djnz,
-    0x12: lambda *_: "LD (DE),A",
+    0x12: lambda *_: Instruction("LD", ("(DE)", "A")),
     0x18: jr,
-    0x1A: lambda *_: "LD A,(DE)",
+    0x1A: lambda *_: Instruction("LD", ("A", "(DE)")),
     0x20: jr_cc,
     0x22: ld_mem_HL,
     0x2A: ld_HL_mem,
     0x32: ld_mem_A,
     0x3A: ld_A_mem,
     0x40: ld_reg8_reg8,
-    0x76: lambda *_: "HALT",
+    0x76: lambda *_: Instruction("HALT", flow=HALT),
     0x80: arithmetic_reg8,
     0xC0: ret_cc,
     0xC1: pop_reg16,
@@ -231,18 +225,18 @@ MNEMONIC = {
     0xC5: push_reg16,
     0xC6: arithmetic_reg8_n,
     0xC7: rst,
-    0xC9: lambda *_: "RET",
+    0xC9: lambda *_: Instruction("RET", flow=RETURN),
     0xCB: opecode_cb,
     0xCD: call,
     0xD3: out,
-    0xD9: lambda *_: "EXX",
+    0xD9: lambda *_: Instruction("EXX"),
     0xDB: in_,
-    0xE3: lambda *_: "EX (SP),HL",
-    0xE9: lambda *_: "JP (HL)",
-    0xEB: lambda *_: "EX DE,HL",
-    0xF3: lambda *_: "DI",
-    0xF9: lambda *_: "LD SP,HL",
-    0xFB: lambda *_: "EI",
+    0xE3: lambda *_: Instruction("EX", ("(SP)", "HL")),
+    0xE9: lambda *_: Instruction("JP", ("(HL)",), JUMP),
+    0xEB: lambda *_: Instruction("EX", ("DE", "HL")),
+    0xF3: lambda *_: Instruction("DI"),
+    0xF9: lambda *_: Instruction("LD", ("SP", "HL")),
+    0xFB: lambda *_: Instruction("EI"),
     0xDD: opecode_dd_fd,
     0xED: opecode_ed,
     0xFD: opecode_dd_fd,
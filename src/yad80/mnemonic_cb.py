@@ -1,4 +1,5 @@
 from .exceptions import InstructionError
+from .instruction import Instruction
 from .mnemonic_defs import BIT_OP, REG8, ROTATE_SHIFT_R
 
 
@@ -7,14 +8,14 @@ def rotate_shift_r(op, _):
     r = op & 7
     if ROTATE_SHIFT_R[p] is None:
         raise InstructionError(f"invalid instruction cb {op:02x}")
-    return f"{ROTATE_SHIFT_R[p]} {REG8[r]}"
+    return Instruction(ROTATE_SHIFT_R[p], (REG8[r],))
 
 
 def bit_operation(op, _):
     bit_op = op >> 6
     n = (op >> 3) & 7
     r = op & 7
-    return f"{BIT_OP[bit_op]} {n},{REG8[r]}"
+    return Instruction(BIT_OP[bit_op], (str(n), REG8[r]))
 
 
 MNEMONIC_CB = {
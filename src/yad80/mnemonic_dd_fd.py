@@ -1,109 +1,112 @@
 from .exceptions import InstructionError
+from .instruction import JUMP, Instruction
 from .mnemonic_defs import (
     ARITHMETIC,
     BIT_OP,
     REG8,
     REG16_SP,
     ROTATE_SHIFT_R,
+    arithmetic_operands,
+    next_word,
     uint8_to_int8,
 )
 
 
+def index_reg(op, suffix=""):
+    return ("IX" if op == 0xDD else "IY") + suffix
+
+
+def indexed(ixy, ofs):
+    sign = "-" if ofs < 0 else "+"
+    return f"({ixy}{sign}${abs(ofs):02X})"
+
+
 def add_reg16(op1, op2, _):
     ixy = "IX" if op1 == 0xDD else "IY"
     rr = (op2 >> 4) & 3
     src = ixy if rr == 2 else REG16_SP[rr]
-    return f"ADD {ixy},{src}"
+    return Instruction("ADD", (ixy, src))
 
 
 def ld_reg8_indexed(op1, op2, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     ofs = uint8_to_int8(mem.next_byte())
-    sign = "-" if ofs < 0 else "+"
     r = (op2 >> 3) & 7
     if r == 6:
         raise InstructionError(f"invalid instruction {op1:02x} {op2:02x}")
-    return f"LD {REG8[r]},({ixy}{sign}${abs(ofs):02X})"
+    return Instruction("LD", (REG8[r], indexed(ixy, ofs)))
 
 
 def ld_indexed_reg8(op1, op2, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     ofs = uint8_to_int8(mem.next_byte())
-    sign = "-" if ofs < 0 else "+"
     r = op2 & 7
-    return f"LD ({ixy}{sign}${abs(ofs):02x}),{REG8[r]}"
+    return Instruction("LD", (indexed(ixy, ofs), REG8[r]))
 
 
 def ld_index_n(op1, _, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD {ixy},${n2:02X}{n1:02X}"
+    nn = next_word(mem)
+    return Instruction("LD", (ixy, nn))
 
 
 def ld_mem_index(op1, _, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD (${n2:02X}{n1:02X}),{ixy}"
+    nn = next_word(mem)
+    return Instruction("LD", (nn, ixy), ref=nn)
 
 
 def ld_index_mem(op1, _, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD {ixy},(${n2:02X}{n1:02X})"
+    nn = next_word(mem)
+    return Instruction("LD", (ixy, nn), ref=nn)
 
 
 def ld_indexed_n(op1, _, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     ofs = uint8_to_int8(mem.next_byte())
-    sign = "-" if ofs < 0 else "+"
     n = mem.next_byte()
-    return f"LD ({ixy}{sign}${abs(ofs):02X}),${n:02X}"
+    return Instruction("LD", (indexed(ixy, ofs), f"${n:02X}"))
 
 
 def inc_dec_indexed(op1, op2, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     incdec = "INC" if op2 == 0x34 else "DEC"
     ofs = uint8_to_int8(mem.next_byte())
-    sign = "-" if ofs < 0 else "+"
-    return f"{incdec} ({ixy}{sign}${abs(ofs):02X})"
+    return Instruction(incdec, (indexed(ixy, ofs),))
 
 
 def bit_shift(op1, _, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     n = mem.next_byte()
     ofs = uint8_to_int8(n)
-    sign = "-" if ofs < 0 else "+"
     op2 = mem.next_byte()
     r = op2 & 7
-    if r != 6:
-        raise InstructionError(f"invalid instruction {op1:02x} cb {n:02x} {op2:02x}")
     mask = (op2 >> 6) & 3
+    shift_op = (op2 >> 3) & 7
+    if r != 6 or (mask == 0 and ROTATE_SHIFT_R[shift_op] is None):
+        raise InstructionError(f"invalid instruction {op1:02x} cb {n:02x} {op2:02x}")
     if mask == 0:
-        shift_op = (op2 >> 3) & 7
-        return f"{ROTATE_SHIFT_R[shift_op]} ({ixy}{sign}${abs(ofs):02X})"
+        return Instruction(ROTATE_SHIFT_R[shift_op], (indexed(ixy, ofs),))
     else:
         bit_op = (op2 >> 6) & 7
         n = (op2 >> 3) & 7
-        return f"{BIT_OP[bit_op]} {n},({ixy}{sign}${abs(ofs):02X})"
+        return Instruction(BIT_OP[bit_op], (str(n), indexed(ixy, ofs)))
 
 
 def arithmetic_indexed(op1, op2, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     n = mem.next_byte()
     ofs = uint8_to_int8(n)
-    sign = "-" if ofs < 0 else "+"
     p = (op2 >> 3) & 7
-    return f"{ARITHMETIC[p]} ({ixy}{sign}${abs(ofs):02X})"
+    return Instruction(ARITHMETIC[p], arithmetic_operands(p, indexed(ixy, ofs)))
 
 
 def ld_reg8_n(op1, op2, mem):
     ixy = "IX" if op1 == 0xDD else "IY"
     r = (op2 >> 3) & 7
     n = mem.next_byte()
-    return f"LD {ixy}{REG8[r]},${n:02X}"
+    return Instruction("LD", (ixy + REG8[r], f"${n:02X}"))
 
 
 def ld_reg8_reg8(op1, op2, _):
@@ -111,14 +114,14 @@ def ld_reg8_reg8(op1, op2, _):
     r1 = (op2 >> 3) & 7
     r2 = op2 & 7
     if r1 == r2 == 6:  # just in case
-        return "NOP"
+        return Instruction("NOP")
     reg1 = REG8[r1]
     reg2 = REG8[r2]
     if reg1 in {"H", "L"}:
         reg1 = ixy + reg1
     if reg2 in {"H", "L"}:
         reg2 = ixy + reg2
-    return f"LD {reg1},{reg2}"
+    return Instruction("LD", (reg1, reg2))
 
 
 def arithmetic_reg8(op1, op2, _):
@@ -129,7 +132,7 @@ def arithmetic_reg8(op1, op2, _):
     if reg in {"H", "L"}:
         reg = ixy + reg
 
-    return f"{ARITHMETIC[p]}{reg}"
+    return Instruction(ARITHMETIC[p], arithmetic_operands(p, reg))
 
 
 MNEMONIC_DD_FD = {
@@ -142,21 +145,21 @@ MNEMONIC_DD_FD = {
     0x36: ld_indexed_n,
     0x26: ld_reg8_n,  # undocumented
     0x2E: ld_reg8_n,  # undocumented
-    0x23: lambda op, *_: "INC IX" if op == 0xDD else "INC IY",
-    0x2B: lambda op, *_: "DEC IX" if op == 0xDD else "DEC IY",
-    0x24: lambda op, *_: "INC IXH" if op == 0xDD else "INC IYH",  # undocumented
-    0x25: lambda op, *_: "DEC IXH" if op == 0xDD else "DEC IYH",  # undocumented
-    0x2C: lambda op, *_: "INC IXL" if op == 0xDD else "INC IYL",  # undocumented
-    0x2D: lambda op, *_: "DEC IXL" if op == 0xDD else "DEC IYL",  # undocumented
+    0x23: lambda op, *_: Instruction("INC", (index_reg(op),)),
+    0x2B: lambda op, *_: Instruction("DEC", (index_reg(op),)),
+    0x24: lambda op, *_: Instruction("INC", (index_reg(op, "H"),)),  # undocumented
+    0x25: lambda op, *_: Instruction("DEC", (index_reg(op, "H"),)),  # undocumented
+    0x2C: lambda op, *_: Instruction("INC", (index_reg(op, "L"),)),  # undocumented
+    0x2D: lambda op, *_: Instruction("DEC", (index_reg(op, "L"),)),  # undocumented
     0x44: ld_reg8_reg8,
     0x46: ld_reg8_indexed,
     0x70: ld_indexed_reg8,
     0x86: arithmetic_indexed,
-    0xE1: lambda op, *_: "POP IX" if op == 0xDD else "POP IY",
-    0xE5: lambda op, *_: "PUSH IX" if op == 0xDD else "PUSH IY",
-    0xE3: lambda op, *_: "EX (SP),IX" if op == 0xDD else "EX (SP),IY",
-    0xE9: lambda op, *_: "JP (IX)" if op == 0xDD else "JP (IY)",
-    0xF9: lambda op, *_: "LD SP,IX" if op == 0xDD else "LD SP,IY",
+    0xE1: lambda op, *_: Instruction("POP", (index_reg(op),)),
+    0xE5: lambda op, *_: Instruction("PUSH", (index_reg(op),)),
+    0xE3: lambda op, *_: Instruction("EX", ("(SP)", index_reg(op))),
+    0xE9: lambda op, *_: Instruction("JP", (f"({index_reg(op)})",), JUMP),
+    0xF9: lambda op, *_: Instruction("LD", ("SP", index_reg(op))),
     0xCB: bit_shift,
 }
 
@@ -2,7 +2,7 @@ REG8 = ["B", "C", "D", "E", "H", "L", "(HL)", "A"]
 REG16_SP = ["BC", "DE", "HL", "SP"]
 REG16_AF = ["BC", "DE", "HL", "AF"]
 
-ARITHMETIC = ["ADD A,", "ADC A,", "SUB ", "SBC A,", "AND ", "XOR ", "OR ", "CP "]
+ARITHMETIC = ["ADD", "ADC", "SUB", "SBC", "AND", "XOR", "OR", "CP"]
 ROTATE_SHIFT = ["RLCA", "RRCA", "RLA", "RRA", "DAA", "CPL", "SCF", "CCF"]
 
 ROTATE_SHIFT_R = ["RLC", "RRC", "RL", "RR", "SLA", "SRA", None, "SRL"]
@@ -11,8 +11,20 @@ BIT_OP = [None, "BIT", "RES", "SET"]
 CC = ["NZ", "Z", "NC", "C", "PO", "PE", "P", "M"]
 
 
+def arithmetic_operands(p, src):
+    if ARITHMETIC[p] in {"ADD", "ADC", "SBC"}:
+        return ("A", src)
+    return (src,)
+
+
 def uint8_to_int8(value):
     if value <= 127:
         return value
     else:
         return value - 256
+
+
+def next_word(mem):
+    n1 = mem.next_byte()
+    n2 = mem.next_byte()
+    return n1 | n2 << 8
@@ -1,44 +1,43 @@
-from .mnemonic_defs import REG8, REG16_SP
+from .instruction import RETURN, Instruction
+from .mnemonic_defs import REG8, REG16_SP, next_word
 
 
 def in_r(op, _):
     r = (op >> 3) & 7
     if r == 6:
-        return "IN (C)"
+        return Instruction("IN", ("(C)",))
     else:
-        return f"IN {REG8[r]},(C)"
+        return Instruction("IN", (REG8[r], "(C)"))
 
 
 def out_r(op, _):
     r = (op >> 3) & 7
     if r == 6:
-        return "OUT (C),0"
+        return Instruction("OUT", ("(C)", "0"))
     else:
-        return f"OUT (C),{REG8[r]}"
+        return Instruction("OUT", ("(C)", REG8[r]))
 
 
 def sbc_hl(op, _):
     rr = (op >> 4) & 3
-    return f"SBC HL,{REG16_SP[rr]}"
+    return Instruction("SBC", ("HL", REG16_SP[rr]))
 
 
 def adc_hl(op, _):
     rr = (op >> 4) & 3
-    return f"ADC HL,{REG16_SP[rr]}"
+    return Instruction("ADC", ("HL", REG16_SP[rr]))
 
 
 def ld_mem_rr(op, mem):
     rr = (op >> 4) & 3
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD (${n2:02X}{n1:02X}),{REG16_SP[rr]}"
+    nn = next_word(mem)
+    return Instruction("LD", (nn, REG16_SP[rr]), ref=nn)
 
 
 def ld_rr_mem(op, mem):
     rr = (op >> 4) & 3
-    n1 = mem.next_byte()
-    n2 = mem.next_byte()
-    return f"LD {REG16_SP[rr]},(${n2:02X}{n1:02X})"
+    nn = next_word(mem)
+    return Instruction("LD", (REG16_SP[rr], nn), ref=nn)
 
 
 MNEMONIC_ED = {
@@ -54,34 +53,34 @@ MNEMONIC_ED = {
     0x6B: ld_rr_mem,
     0x5B: ld_rr_mem,
     0x7B: ld_rr_mem,
-    0x47: lambda *_: "LD I,A",
-    0x57: lambda *_: "LD A,I",
-    0x4F: lambda *_: "LD R,A",
-    0x5F: lambda *_: "LD A,R",
-    0xA0: lambda *_: "LDI",
-    0xA8: lambda *_: "LDD",
-    0xB0: lambda *_: "LDIR",
-    0xB8: lambda *_: "LDDR",
-    0xA1: lambda *_: "CPI",
-    0xA9: lambda *_: "CPD",
-    0xB1: lambda *_: "CPIR",
-    0xB9: lambda *_: "CPDR",
-    0xA2: lambda *_: "INI",
-    0xAA: lambda *_: "IND",
-    0xB2: lambda *_: "INIR",
-    0xBA: lambda *_: "INDR",
-    0xA3: lambda *_: "OUTI",
-    0xAB: lambda *_: "OUTD",
-    0xB3: lambda *_: "OTIR",
-    0xBB: lambda *_: "OTDR",
-    0x44: lambda *_: "NEG",
-    0x45: lambda *_: "RETN",
-    0x4D: lambda *_: "RETI",
-    0x46: lambda *_: "IM 0",
-    0x56: lambda *_: "IM 1",
-    0x5E: lambda *_: "IM 2",
-    0x67: lambda *_: "RRD",
-    0x6F: lambda *_: "RLD",
+    0x47: lambda *_: Instruction("LD", ("I", "A")),
+    0x57: lambda *_: Instruction("LD", ("A", "I")),
+    0x4F: lambda *_: Instruction("LD", ("R", "A")),
+    0x5F: lambda *_: Instruction("LD", ("A", "R")),
+    0xA0: lambda *_: Instruction("LDI"),
+    0xA8: lambda *_: Instruction("LDD"),
+    0xB0: lambda *_: Instruction("LDIR"),
+    0xB8: lambda *_: Instruction("LDDR"),
+    0xA1: lambda *_: Instruction("CPI"),
+    0xA9: lambda *_: Instruction("CPD"),
+    0xB1: lambda *_: Instruction("CPIR"),
+    0xB9: lambda *_: Instruction("CPDR"),
+    0xA2: lambda *_: Instruction("INI"),
+    0xAA: lambda *_: Instruction("IND"),
+    0xB2: lambda *_: Instruction("INIR"),
+    0xBA: lambda *_: Instruction("INDR"),
+    0xA3: lambda *_: Instruction("OUTI"),
+    0xAB: lambda *_: Instruction("OUTD"),
+    0xB3: lambda *_: Instruction("OTIR"),
+    0xBB: lambda *_: Instruction("OTDR"),
+    0x44: lambda *_: Instruction("NEG"),
+    0x45: lambda *_: Instruction("RETN", flow=RETURN),
+    0x4D: lambda *_: Instruction("RETI", flow=RETURN),
+    0x46: lambda *_: Instruction("IM", ("0",)),
+    0x56: lambda *_: Instruction("IM", ("1",)),
+    0x5E: lambda *_: Instruction("IM", ("2",)),
+    0x67: lambda *_: Instruction("RRD"),
+    0x6F: lambda *_: Instruction("RLD"),
 }
 
 
@@ -0,0 +1,77 @@
+import sys
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Writer:
+    """buffered sink for listing lines
+
+    lines are joined and written in chunks of about chunk_size characters.
+    """
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE, close_fp=False):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.close_fp = close_fp
+        self.buffer = []
+        self.size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def write(self, line):
+        self.buffer.append(line)
+        self.size += len(line) + 1
+        if self.size >= self.chunk_size:
+            self.flush()
+
+    def write_lines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def write_text(self, text):
+        """write text as it is, e.g. a listing from the cache"""
+        self.flush()
+        self.fp.write(text)
+        self.fp.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.buffer.append("")
+            self.fp.write("\n".join(self.buffer))
+            self.buffer.clear()
+            self.size = 0
+        self.fp.flush()
+
+    def close(self):
+        self.flush()
+        if self.close_fp:
+            self.fp.close()
+
+
+class Capture:
+    """file wrapper which also writes the text to copy, e.g. a CacheEntry"""
+
+    def __init__(self, fp, copy):
+        self.fp = fp
+        self.copy = copy
+
+    def write(self, text):
+        self.copy.write(text)
+        return self.fp.write(text)
+
+    def flush(self):
+        self.fp.flush()
+
+    def close(self):
+        self.fp.close()
+
+
+def open_writer(file=None):
+    """Writer to file, or to stdout if file is None"""
+    if file is None:
+        return Writer(sys.stdout)
+    return Writer(open(file, "w"), close_fp=True)
@@ -0,0 +1,45 @@
+"""wall time and calls of the phases of an eager run"""
+
+import time
+from contextlib import contextmanager
+
+
+class Profile:
+    def __init__(self):
+        # name -> [seconds, calls] in the order the phases were entered
+        self.phases = {}
+        self.counters = {}
+
+    @contextmanager
+    def phase(self, name, calls=1):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = self.phases.setdefault(name, [0.0, 0])
+            record[0] += time.perf_counter() - start
+            record[1] += calls
+
+    def add_calls(self, name, calls):
+        self.phases.setdefault(name, [0.0, 0])[1] += calls
+
+    def as_dict(self):
+        return {
+            "phases": {
+                name: {"time": seconds, "calls": calls}
+                for name, (seconds, calls) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def report(self):
+        """report lines of the phases and the counters"""
+        yield f"{'phase':16}{'time(ms)':>10}{'calls':>8}"
+        total = 0.0
+        for name, (seconds, calls) in self.phases.items():
+            total += seconds
+            yield f"{name:16}{seconds * 1000:10.2f}{calls:8}"
+        yield f"{'total':16}{total * 1000:10.2f}"
+        yield ""
+        for name, value in self.counters.items():
+            yield f"{name:16}{value:10}"
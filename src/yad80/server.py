@@ -0,0 +1,193 @@
+"""query server which keeps an eager analysis in memory
+
+a request is a JSON object per line, {"id": .., "method": .., "params": {..}},
+and the response is {"id": .., "result": ..} or {"id": .., "error": message}.
+requests are read from stdin or from clients of a Unix socket, every client
+shares the same analysis.
+
+methods
+    list    lines of the listing from params "addr" for "count" lines
+    xrefs   label and referring addresses of params "addr"
+    labels  every label name and its address
+    rename  give the label at params "addr" the name params "name"
+"""
+
+import asyncio
+import json
+import os
+import re
+import stat
+import sys
+from bisect import bisect_right
+
+from .listing import addr_label, label_resolver, render_line
+
+DEFAULT_COUNT = 32
+LABEL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class RequestError(Exception):
+    pass
+
+
+class Session:
+    """an Analysis and the requests against it"""
+
+    def __init__(self, analysis):
+        self.analysis = analysis
+        self.addrs = sorted(analysis.lines)
+        self.resolve = label_resolver(analysis.branch_labels, analysis.data_labels)
+        self.methods = {
+            "list": self.list,
+            "xrefs": self.xrefs,
+            "labels": self.labels,
+            "rename": self.rename,
+        }
+
+    def handle(self, request):
+        """response of a request object"""
+        response = {"id": request.get("id") if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise RequestError("request must be an object")
+            method = self.methods.get(request.get("method"))
+            if method is None:
+                raise RequestError(f"unknown method {request.get('method')}")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RequestError("params must be an object")
+            response["result"] = method(**params)
+        except TypeError as e:
+            response["error"] = f"invalid params: {e}"
+        except RequestError as e:
+            response["error"] = str(e)
+        return response
+
+    def handle_line(self, line):
+        """response line of a request line"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return json.dumps({"id": None, "error": f"invalid JSON: {e}"})
+        return json.dumps(self.handle(request))
+
+    def label_at(self, addr):
+        analysis = self.analysis
+        for labels in (analysis.branch_labels, analysis.data_labels):
+            if addr in labels:
+                return labels[addr]
+        return None
+
+    def list(self, addr=None, count=DEFAULT_COUNT):
+        """count lines from the line containing addr"""
+        analysis = self.analysis
+        if not isinstance(count, int) or count < 0:
+            raise RequestError(f"invalid count {count}")
+        if addr is None:
+            index = 0
+        else:
+            index = max(bisect_right(self.addrs, check_addr(addr)) - 1, 0)
+        lines = []
+        for line_addr in self.addrs[index : index + count]:
+            item = analysis.lines[line_addr]
+            label = addr_label(line_addr, analysis.branch_labels, analysis.data_labels)
+            text = render_line(item, self.resolve)
+            lines.append({"addr": line_addr, "label": label, "text": text})
+        stop = index + count
+        return {
+            "lines": lines,
+            "next": self.addrs[stop] if stop < len(self.addrs) else None,
+        }
+
+    def xrefs(self, addr):
+        label = self.label_at(check_addr(addr))
+        if label is None:
+            raise RequestError(f"no label at {addr:04x}")
+        refs = set()
+        for labels in (self.analysis.branch_labels, self.analysis.data_labels):
+            if addr in labels:
+                refs |= labels[addr].used_addr
+        return {"label": label.name, "refs": sorted(refs)}
+
+    def labels(self):
+        return self.analysis.labels
+
+    def rename(self, addr, name):
+        label = self.label_at(check_addr(addr))
+        if label is None:
+            raise RequestError(f"no label at {addr:04x}")
+        if not isinstance(name, str) or not LABEL_NAME.match(name):
+            raise RequestError(f"invalid label name {name}")
+        other = self.analysis.labels.get(name)
+        if other is not None and other != addr:
+            raise RequestError(f"{name} is already used at {other:04x}")
+        label.name_cache = name
+        return {"label": name}
+
+
+def check_addr(addr):
+    if not isinstance(addr, int) or not 0 <= addr <= 0xFFFF:
+        raise RequestError(f"invalid address {addr}")
+    return addr
+
+
+async def serve_stream(session, reader, writer):
+    """answer the request lines of one client"""
+    try:
+        while line := await reader.readline():
+            if not line.strip():
+                continue
+            writer.write(session.handle_line(line).encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def is_pipe(fp):
+    """True if fp is a pipe, a socket or a terminal, which the loop can read"""
+    try:
+        mode = os.fstat(fp.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)
+
+
+async def serve_stdio(session):
+    loop = asyncio.get_running_loop()
+    if is_pipe(sys.stdin):
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+        readline = reader.readline
+    else:
+        # connect_read_pipe rejects a regular file, e.g. < requests.jsonl
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+
+        def readline():
+            return loop.run_in_executor(None, stdin.readline)
+
+    while line := await readline():
+        if not line.strip():
+            continue
+        sys.stdout.write(session.handle_line(line) + "\n")
+        sys.stdout.flush()
+
+
+async def serve_socket(session, path):
+    server = await asyncio.start_unix_server(
+        lambda reader, writer: serve_stream(session, reader, writer), path
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def serve(session, path="-"):
+    """serve session on stdin/stdout for "-", otherwise on the Unix socket path"""
+    try:
+        if path == "-":
+            asyncio.run(serve_stdio(session))
+        else:
+            asyncio.run(serve_socket(session, path))
+    except KeyboardInterrupt:
+        pass
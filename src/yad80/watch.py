@@ -0,0 +1,129 @@
+"""re-render the listing whenever the input or the option file changes
+
+the files are polled by their mtime. the image is reloaded only when one of
+its files, or the segment options, changed. the decoded instructions are kept
+while the image is the same, so a change of the hints only decodes new code.
+"""
+
+import io
+import os
+import time
+import traceback
+
+from .cache import normalized_args
+from .cli import load_memory, parse_args, simple_renderer
+from .eager import Disassembler
+from .exceptions import AddressError, FileFormatError, InstructionError
+from .output import Writer, open_writer
+from .listing import renderer
+
+WATCH_INTERVAL = 0.5
+
+
+def mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def option_file(argv):
+    """path of the --option file in argv, or None"""
+    for n, arg in enumerate(argv[:-1]):
+        if arg == "--option":
+            return argv[n + 1]
+    return None
+
+
+def image_files(args):
+    return [args.FILE] + [file for _, file in args.load + args.rom]
+
+
+class Watcher:
+    """renders the listing of argv again when its files change"""
+
+    def __init__(self, argv):
+        self.argv = argv
+        self.stamps = {}
+        self.image_key = None
+        self.mem = None
+        self.decoded = {}
+        self.output_key = None
+
+    def check(self):
+        """render if a file changed since the last check, True if rendered"""
+        if self.stamps and all(
+            mtime(path) == stamp for path, stamp in self.stamps.items()
+        ):
+            return False
+        option = option_file(self.argv)
+        try:
+            args = parse_args(self.argv)
+        except SystemExit:
+            # argparse printed the error, wait for the next change
+            self.stamps = {option: mtime(option)} if option else {}
+            return False
+        paths = image_files(args) + ([option] if option else [])
+        self.stamps = {path: mtime(path) for path in paths}
+        return self.update(args)
+
+    def update(self, args):
+        image_key = (
+            [mtime(path) for path in image_files(args)],
+            args.offset,
+            args.load,
+            args.rom,
+        )
+        if image_key != self.image_key:
+            self.image_key = image_key
+            self.decoded = {}
+            self.output_key = None
+            try:
+                self.mem = load_memory(args)
+            except (AddressError, FileFormatError) as e:
+                print(e)
+                self.mem = None
+        if self.mem is None:
+            return False
+
+        output_key = normalized_args(args)
+        if output_key == self.output_key:
+            return False
+        self.output_key = output_key
+        try:
+            self.render(args)
+        except (AddressError, InstructionError) as e:
+            if args.debug:
+                traceback.print_exception(e)
+            else:
+                print(e)
+        return True
+
+    def render(self, args):
+        """render into memory first, --output is kept when the render fails"""
+        buffer = io.StringIO()
+        out = Writer(buffer)
+        if args.eager:
+            disassembler = Disassembler(args.code, args.string, args.addr, self.decoded)
+            analysis = disassembler.analyse(self.mem)
+            out.write_lines(renderer(args.format)(analysis))
+        else:
+            run = simple_renderer(args, self.mem)
+            # the error is printed by run
+            if run is None or run(out=out) is None:
+                return
+        out.flush()
+        with open_writer(args.output) as dst:
+            dst.write_text(buffer.getvalue())
+
+
+def watch(argv, interval=WATCH_INTERVAL):
+    """check the files of argv every interval seconds until interrupted"""
+    watcher = Watcher(argv)
+    try:
+        while True:
+            if watcher.check():
+                print(f"{time.strftime('%H:%M:%S')} rendered")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
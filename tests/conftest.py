@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("YAD80_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
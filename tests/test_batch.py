@@ -0,0 +1,78 @@
+import io
+from contextlib import redirect_stdout
+
+from src.yad80.batch import batch_main
+
+
+def run_batch(args):
+    fp = io.StringIO()
+    with redirect_stdout(fp):
+        summary = batch_main(args)
+    return summary, fp.getvalue()
+
+
+def test_batch(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    (images / "a.bin").write_bytes(bytes([0x3E, 0x01, 0xC9]))
+    (images / "b.bin").write_bytes(bytes([0x00, 0x00, 0xC9, 0x41, 0x42]))
+    (images / "b.bin.opt").write_text("-a 1 # skip first NOP\n")
+    (images / "c.mzt").write_bytes(bytes(10))
+
+    outdir = tmp_path / "out"
+    args = ["-e", "--jobs", "2", "--outdir", str(outdir), str(images)]
+    summary, text = run_batch(args)
+    assert summary["files"] == 3
+    assert summary["bytes"] == 18
+    assert summary["instructions"] == 4
+    assert summary["failures"] == 1
+    assert "c.mzt: invalid MZT file" in text
+    assert sorted(path.name for path in outdir.iterdir()) == ["a.bin.asm", "b.bin.asm"]
+    assert "AO_0001:        NOP" in (outdir / "b.bin.asm").read_text()
+
+    summary, _ = run_batch(["-m", "0", "--jobs", "1", str(images / "*.bin")])
+    assert summary["files"] == 2
+    assert summary["instructions"] == 6
+    assert (images / "a.bin.asm").read_text().startswith(" " * 16 + "LD      A,$01")
+
+
+def test_batch_outputs(tmp_path):
+    roms = tmp_path / "roms"
+    for name in ["x.bin", "x.mzt", "sub/x.bin", "other/x.bin"]:
+        (roms / name).parent.mkdir(parents=True, exist_ok=True)
+        (roms / name).write_bytes(bytes([0x00, 0xC9]))
+    (roms / "x.mzt").write_bytes(bytes(10))
+
+    outdir = tmp_path / "out"
+    args = ["-e", "--jobs", "1", "--outdir", str(outdir), str(roms / "**" / "x.*")]
+    summary, text = run_batch(args)
+    assert summary["files"] == 4
+    assert summary["instructions"] == 6
+    assert summary["failures"] == 1
+    listings = sorted(str(path.relative_to(outdir)) for path in outdir.rglob("*.asm"))
+    assert listings == ["other/x.bin.asm", "sub/x.bin.asm", "x.bin.asm"]
+
+    # the same listing path from two directories
+    args = ["-m", "0", "--outdir", str(outdir), str(roms / "sub"), str(roms / "other")]
+    summary, text = run_batch(args)
+    assert summary["failures"] == 1
+    assert "same listing" in text
+
+    # a file named twice is one input
+    summary, text = run_batch(["-m", "0", str(roms), str(roms / "*.bin")])
+    assert summary["files"] == 2
+    assert summary["bytes"] == 12
+    assert summary["failures"] == 1
+    assert "same listing" not in text
+
+
+def test_batch_failures(tmp_path):
+    (tmp_path / "a.bin").write_bytes(bytes([0x3E, 0x01, 0xC9]))
+    (tmp_path / "a.bin.opt").write_text("--format jsonl\n")
+    (tmp_path / "b.bin").write_bytes(bytes([0x00, 0xC9]))
+    (tmp_path / "b.bin.opt").write_text("--no-such-option\n")
+    summary, text = run_batch(["-e", "--jobs", "1", str(tmp_path)])
+    assert summary["instructions"] == 2
+    assert summary["failures"] == 1
+    assert "b.bin: yad80: error: argument --option" in text
+    assert not (tmp_path / "b.bin.asm").exists()
@@ -0,0 +1,73 @@
+import io
+import os
+from contextlib import redirect_stdout
+
+from src.yad80 import disasm, eager
+from src.yad80.cache import ResultCache
+from src.yad80.cli import cli_main
+
+
+def run(args):
+    fp = io.StringIO()
+    with redirect_stdout(fp):
+        cli_main(args)
+    return fp.getvalue()
+
+
+def test_cached_listing(tmp_path, cache_dir, monkeypatch):
+    decoded = []
+
+    def counting_decode(mem):
+        inst = disasm.decode(mem)
+        if inst is not None:
+            decoded.append(inst.addr)
+        return inst
+
+    monkeypatch.setattr(disasm, "disasm_line", counting_decode)
+    monkeypatch.setattr(eager, "disasm_line", counting_decode)
+    image = tmp_path / "image.bin"
+    image.write_bytes(bytes([0x3E, 0x01, 0xC9]))
+
+    for args in [["-m", "0"], ["-e"]]:
+        listing = run(args + [str(image)])
+        decoded.clear()
+        assert run(args + [str(image)]) == listing
+        assert decoded == []
+        assert run(args + ["--no-cache", str(image)]) == listing
+        assert decoded == [0, 2]
+
+    assert len(list(cache_dir.glob("*.lst"))) == 2
+    image.write_bytes(bytes([0x3E, 0x02, 0xC9]))
+    assert "LD      A,$02" in run(["-e", str(image)])
+    assert run(["-e", "-a", "2", "--", str(image)]).count("RET") == 1
+    assert len(list(cache_dir.glob("*.lst"))) == 4
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, size=70)
+    for n, key in enumerate(["a", "b", "c"]):
+        cache.put(key, "0123456789", 1)
+        os.utime(cache.path(key), ns=(n * 10**9, n * 10**9))
+    assert cache.get("a") == (1, "0123456789")
+    cache.put("d", "0123456789", 1)
+    assert sorted(path.stem for path in tmp_path.glob("*.lst")) == ["a", "c", "d"]
+
+
+def test_unparsable_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.path("a").write_text("")
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
+    cache.put("a", "0123456789", 1)
+    assert cache.get("a") == (1, "0123456789")
+
+
+def test_entry_over_limit(tmp_path):
+    cache = ResultCache(tmp_path, size=15)
+    entry = cache.entry("a")
+    entry.write("0123456789")
+    entry.write("0123456789")
+    cache.commit(entry, 2)
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
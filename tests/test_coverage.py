@@ -0,0 +1,33 @@
+from src.yad80.coverage import CODE, DATA, STRING, UNKNOWN, Coverage
+
+
+def test_runs_and_gaps():
+    cov = Coverage()
+    cov.mark(range(0x10, 0x20), CODE)
+    cov.mark(range(0x18, 0x30), CODE)
+    cov.mark(range(0x40, 0x48), STRING)
+    cov.mark(range(0xFFF0, 0x10010), CODE)
+
+    assert cov[0x17] == CODE and cov[0x30] == UNKNOWN
+    assert cov.runs(CODE) == [range(0x10, 0x30), range(0xFFF0, 0x10000)]
+    assert cov.runs(CODE, 0x20, 0x28) == [range(0x20, 0x28)]
+    assert cov.gaps(0x08, 0x50) == [
+        range(0x08, 0x10),
+        range(0x30, 0x40),
+        range(0x48, 0x50),
+    ]
+    assert cov.gaps(0x08, 0x50, [0x08, 0x20, 0x34, 0x38, 0x4C]) == [
+        range(0x08, 0x10),
+        range(0x30, 0x34),
+        range(0x34, 0x38),
+        range(0x38, 0x40),
+        range(0x48, 0x4C),
+        range(0x4C, 0x50),
+    ]
+
+
+def test_count():
+    cov = Coverage(0x100)
+    cov.mark(range(0, 0x10), DATA)
+    assert cov.count(DATA) == 0x10
+    assert cov.count(UNKNOWN) == 0xF0
@@ -0,0 +1,116 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.yad80.decoder import TABLES, boundaries, compile_tables, decode, length_at
+from src.yad80.exceptions import InstructionError
+from src.yad80.memory import Memory
+from src.yad80.mnemonic import MNEMONIC
+
+OPERANDS = [[0x00, 0x00], [0x7F, 0x01], [0x80, 0xFF], [0xFF, 0x80]]
+
+
+def handler_decode(mem):
+    addr = mem.addr
+    op = mem.next_byte()
+    inst = MNEMONIC[op](op, mem)
+    inst.addr = addr
+    inst.code = mem[addr : mem.addr]
+    inst.length = len(inst.code)
+    return inst
+
+
+def record(inst):
+    return (
+        inst.addr,
+        inst.length,
+        bytes(inst.code),
+        inst.text,
+        inst.flow,
+        inst.conditional,
+        inst.target,
+        inst.ref,
+    )
+
+
+def opcodes():
+    for op in range(256):
+        if op not in {0xCB, 0xDD, 0xED, 0xFD}:
+            yield [op]
+        yield [0xCB, op]
+        yield [0xED, op]
+        for prefix in [0xDD, 0xFD]:
+            if op != 0xCB:
+                yield [prefix, op]
+            yield [prefix, 0xCB, None, op]
+
+
+@pytest.mark.parametrize("operands", OPERANDS)
+def test_same_as_handlers(operands):
+    for opcode in opcodes():
+        if None in opcode:
+            code = [operands[0] if b is None else b for b in opcode]
+        else:
+            code = opcode + operands
+        try:
+            expected = record(handler_decode(Memory(bytes(code), offset=0x4000)))
+        except InstructionError as e:
+            with pytest.raises(InstructionError, match=f"^{e} at 4000$"):
+                decode(Memory(bytes(code), offset=0x4000))
+            continue
+        mem = Memory(bytes(code), offset=0x4000)
+        assert record(decode(mem)) == expected, code
+        assert length_at(mem, 0x4000) == expected[1]
+        assert mem.addr == 0x4000 + expected[1]
+
+
+def test_length_at_invalid():
+    assert length_at(Memory(bytes([0xED, 0x00])), 0) == 0
+    assert length_at(Memory(bytes([0xDD, 0xCB, 0x00, 0x00])), 0) == 0
+    # SLL (IY+d) is invalid as SLL r is
+    assert length_at(Memory(bytes([0xFD, 0xCB, 0x00, 0x36])), 0) == 0
+    assert length_at(Memory(bytes([0x21, 0x00])), 0) == 0
+    assert length_at(Memory(bytes([0x00]), offset=0x100), 0) == 0
+
+
+def test_boundaries():
+    code = [0x00, 0x21, 0x00, 0x10, 0xDD, 0xCB, 0x05, 0x06, 0xED, 0xB0, 0x3E]
+    mem = Memory(bytes(code), offset=0x100)
+    assert list(boundaries(mem, 0x100)) == [0x100, 0x101, 0x104, 0x108]
+    assert list(boundaries(mem, 0x100, 0x104)) == [0x100, 0x101]
+    assert list(boundaries(mem, 0x102)) == [0x102, 0x103, 0x105, 0x107, 0x109]
+
+
+def test_end_of_memory():
+    mem = Memory(bytes([0x00]))
+    assert decode(mem).text == "NOP"
+    assert decode(mem) is None
+
+
+@pytest.mark.parametrize("code", [[0x21, 0x00], [0xED], [0xDD, 0xCB, 0x00]])
+def test_incomplete(code):
+    with pytest.raises(InstructionError, match="incomplete instruction at 0000"):
+        decode(Memory(bytes(code)))
+
+
+def test_prebuilt_tables():
+    # regenerate with python -m yad80.build_tables when this fails
+    assert TABLES == compile_tables()
+
+
+def test_lazy_imports():
+    loaded = "print(sorted(m for m in sys.modules if m.startswith('src.yad80.')))"
+    code = f"import sys, src.yad80.cli; {loaded}; import src.yad80.decoder; {loaded}"
+    root = Path(__file__).parent.parent
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=root
+    )
+    cli_modules, decoder_modules = result.stdout.splitlines()
+    skipped = ["eager", "cache", "bank", "server", "export"]
+    skipped += ["disasm", "listing", "decoder", "decode_tables"]
+    for module in skipped:
+        assert f"'src.yad80.{module}'" not in cli_modules
+    assert "'src.yad80.decode_tables'" in decoder_modules
+    assert "'src.yad80.mnemonic'" not in decoder_modules
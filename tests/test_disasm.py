@@ -0,0 +1,88 @@
+import io
+
+import pytest
+
+from src.yad80.disasm import disasm_iter, disasm_line, disasm_nlines, format_line
+from src.yad80.exceptions import AddressError
+from src.yad80.instruction import CALL, FALL, HALT, JUMP, RETURN
+from src.yad80.memory import Memory
+from src.yad80.output import Writer
+
+
+def decode(code, offset=0):
+    return disasm_line(Memory(bytes(code), offset=offset))
+
+
+def test_instruction_record():
+    inst = decode([0xC2, 0x34, 0x12], 0x100)
+    assert inst.addr == 0x100
+    assert inst.length == 3
+    assert bytes(inst.code) == b"\xc2\x34\x12"
+    assert inst.mnemonic == "JP"
+    assert inst.operands == ("NZ", 0x1234)
+    assert inst.target == 0x1234
+    assert inst.ref is None
+    assert inst.flow == JUMP
+    assert inst.conditional
+    assert inst.text == "JP NZ,$1234"
+
+
+def test_flow():
+    assert decode([0x00]).flow == FALL
+    assert decode([0x76]).flow == HALT
+    assert decode([0xC9]).flow == RETURN
+    assert decode([0xED, 0x4D]).flow == RETURN
+    assert decode([0xCD, 0x00, 0x10]).flow == CALL
+    assert decode([0xFF]).target == 0x38
+    assert decode([0xDD, 0xE9]).flow == JUMP
+    assert decode([0x18, 0xFE], 0x200).target == 0x200
+
+
+def test_memory_reference():
+    inst = decode([0xED, 0x43, 0x00, 0xE0])
+    assert inst.ref == 0xE000
+    assert inst.text == "LD ($E000),BC"
+    inst = decode([0x21, 0x00, 0xE0])
+    assert inst.ref is None
+    assert inst.value == 0xE000
+
+
+def test_format_line():
+    inst = decode([0xDD, 0x96, 0xFE], 0x10)
+    assert format_line(inst) == f"{'SUB':8}{'(IX-$02)':32};[0010] dd 96 fe"
+
+
+def test_resolve_label():
+    labels = {0xE000: "DT_E000"}
+
+    def resolve(inst, addr):
+        return labels.get(addr)
+
+    inst = decode([0x3A, 0x00, 0xE0])
+    assert inst.operand_text(resolve) == "A,(DT_E000)"
+    labels[0xE000] = "VRAM"
+    assert inst.operand_text(resolve) == "A,(VRAM)"
+    assert decode([0x3A, 0x00, 0xE1]).operand_text(resolve) == "A,($E100)"
+
+
+def test_disasm_iter_range():
+    mem = Memory(bytes([0x00, 0x3E, 0x01, 0xC9, 0x00]), offset=0x100)
+    insts = list(disasm_iter(mem, 0x101, 0x104))
+    assert [inst.text for inst in insts] == ["LD A,$01", "RET"]
+    assert [inst.addr for inst in disasm_iter(mem, 0x100)] == [0x100, 0x101, 0x103, 0x104]
+
+
+def test_disasm_nlines_writer():
+    fp = io.StringIO()
+    mem = Memory(bytes([0x00] * 100))
+    disasm_nlines(mem, 0, 0, Writer(fp, chunk_size=64))
+    assert fp.getvalue().count("\n") == 100
+    fp = io.StringIO()
+    disasm_nlines(mem, 0, 10, Writer(fp), stop=5)
+    assert fp.getvalue().count("NOP") == 5
+
+
+def test_disasm_nlines_out_of_range():
+    mem = Memory(bytes([0x00] * 4), offset=0x100)
+    with pytest.raises(AddressError):
+        disasm_nlines(mem, 0, 0, Writer(io.StringIO()))
@@ -0,0 +1,221 @@
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from src.yad80.cli import cli_main
+
+
+def run_eager(tmp_path, image, args):
+    target = tmp_path / "image.bin"
+    target.write_bytes(bytes(image))
+    fp = io.StringIO()
+    with redirect_stdout(fp):
+        cli_main(args.split() + ["--", str(target)])
+    return fp.getvalue()
+
+
+def code_addrs(listing):
+    addrs = []
+    for line in listing.splitlines():
+        code, _, comment = line.partition("; [")
+        if comment and "DB" not in code.split():
+            addrs.append(int(comment[:4], base=16))
+    return addrs
+
+
+def test_walk_through_code_range(tmp_path):
+    image = bytearray(0x30)
+    image[0:2] = [0x18, 0x0C]  # JR $000E
+    image[2:0x0E] = b"ABCDEFGHIJKL"
+    image[0x24:0x28] = [0x3A, 0x00, 0x30, 0xC9]  # LD A,($3000); RET
+    image[0x28:0x30] = b"DATADATA"
+
+    listing = run_eager(tmp_path, image, "-e -c 10-1f 18-20 -a 0")
+    addrs = code_addrs(listing)
+    assert addrs == [0] + list(range(0x0E, 0x25)) + [0x27]
+    assert "LD      A,(EX_DT_3000)" in listing
+
+
+def test_branch_decoded_once(tmp_path):
+    # two branches into the same routine
+    image = bytearray([0xCD, 0x08, 0x00, 0xCD, 0x09, 0x00, 0x76, 0x00])
+    image += bytearray([0x00, 0x00, 0xC9])
+    listing = run_eager(tmp_path, image, "-e")
+    addrs = code_addrs(listing)
+    assert addrs == [0, 3, 6, 8, 9, 10]
+    assert "CD_0008:" in listing and "CD_0009:" in listing
+
+
+def test_control_flow_graph(tmp_path):
+    from src.yad80.cli import parse_args
+    from src.yad80.eager import Disassembler
+    from src.yad80.loader import load
+
+    image = bytearray(
+        [
+            0xCD, 0x07, 0x00,  # 0000 CALL $0007
+            0x20, 0xFB,  # 0003 JR NZ,$0000
+            0x76,  # 0005 HALT
+            0x00,  # 0006
+            0x3C,  # 0007 INC A
+            0xC8,  # 0008 RET Z
+            0x18, 0xFC,  # 0009 JR $0007
+        ]
+    )  # fmt: skip
+    target = tmp_path / "image.bin"
+    target.write_bytes(bytes(image))
+    args = parse_args(["-e", str(target)])
+    cfg = Disassembler().analyse(load(args.FILE, args.offset)).cfg
+
+    assert [(b.start, b.end, b.exit) for b in cfg] == [
+        (0x00, 0x03, "call"),
+        (0x03, 0x05, "jump"),
+        (0x05, 0x06, "halt"),
+        (0x07, 0x09, "return"),
+        (0x09, 0x0B, "jump"),
+    ]
+    assert cfg.blocks[0x03].successors == [0x05, 0x00]
+    assert sorted(cfg.blocks[0x07].predecessors) == [0x09]
+    assert cfg.block_at(0x0A).start == 0x09
+    assert cfg.block_at(0x06) is None
+    assert cfg.entries == [0x00]
+
+    cg = cfg.call_graph
+    assert cg.callers(0x07) == {0x00}
+    assert cg.callees(0x00) == {0x07}
+    assert cg.call_sites(0x07) == [0x00]
+    assert cg.routines[0x07] == {0x07, 0x09}
+
+
+def test_output_file(tmp_path):
+    image = bytearray([0x21, 0x00, 0x80, 0xCD, 0x07, 0x00, 0x76, 0xC9])
+    listing = run_eager(tmp_path, image, "-e")
+    output = tmp_path / "out.asm"
+    assert run_eager(tmp_path, image, f"-e --output {output}") == ""
+    assert output.read_text() == listing
+
+
+def test_segments(tmp_path):
+    rom = tmp_path / "rom.bin"
+    rom.write_bytes(bytes([0x3E, 0x01, 0xC9, 0x55]))  # LD A,$01; RET
+    # CALL $8000; LD ($C000),A; HALT
+    image = bytearray([0xCD, 0x00, 0x80, 0x32, 0x00, 0xC0, 0x76])
+    listing = run_eager(tmp_path, image, f"-e --rom 8000:{rom}")
+    assert "CALL    CD_8000" in listing
+    assert "EX_CD_8000" not in listing
+    assert "LD      (EX_DT_C000),A" in listing
+    assert "ORG     $8000" in listing
+    assert "; $8003-$8003, [$   1] U" in listing
+    assert "$0007" not in listing
+
+
+def test_banks(tmp_path):
+    common = tmp_path / "common.bin"
+    common.write_bytes(bytes([0xCD, 0x00, 0x80, 0xC9]))  # CALL $8000; RET
+    bank0 = bytes([0xCD, 0x00, 0x00, 0xC9, 0x00, 0x00, 0x00, 0x00])
+    bank1 = bytes([0x00, 0xC3, 0x04, 0x80, 0x76, 0x00, 0x00, 0x00])
+    args = f"-e --bank 8000-8007 --load 0:{common} -a 0 8000"
+    listing = run_eager(tmp_path, bank0 + bank1, args + " --jobs 2")
+    assert run_eager(tmp_path, bank0 + bank1, args + " --jobs 1") == listing
+
+    units = listing.split("; bank ")
+    assert len(units) == 3
+    assert units[0].startswith("; common")
+    assert "CALL    EX_CD_8000" in units[0]
+    assert units[1].startswith("00: 8000-8007")
+    assert "CALL    B00_EX_CD_0000" in units[1]
+    assert units[2].startswith("01: 8000-8007")
+    assert "B01_JP_8004:    HALT" in units[2]
+
+    # no label is defined twice in the combined listing
+    lines = [line for line in listing.splitlines() if not line.startswith(";")]
+    defined = [line.split()[0] for line in lines if ":" in line[:16] or " EQU " in line]
+    assert len(defined) == len(set(defined))
+
+
+def test_disassembler():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.yad80.eager import Disassembler
+    from src.yad80.exceptions import InstructionError
+    from src.yad80.memory import Memory
+    from src.yad80.listing import render
+
+    # LD A,($0010); CALL $000A; HALT; .. RET
+    image = bytearray([0x3A, 0x10, 0x00, 0xCD, 0x0A, 0x00, 0x76, 0x41, 0x42, 0x43])
+    image += bytearray([0xC9, 0x00, 0x00, 0x00, 0x00, 0x00, 0x55, 0x55])
+    mem = Memory(bytes(image))
+    mem.addr = 0x05
+    analysis = Disassembler().analyse(mem)
+    assert mem.addr == 0x05
+    assert [inst.addr for inst in analysis.instructions] == [0x00, 0x03, 0x06, 0x0A]
+    assert analysis.labels == {"AO_0000": 0x00, "CD_000A": 0x0A, "DT_0010": 0x10}
+    assert analysis.xrefs == {0x00: [], 0x0A: [0x03], 0x10: [0x00]}
+    assert analysis.data_ranges == [
+        range(0x07, 0x0A),
+        range(0x0B, 0x10),
+        range(0x10, 0x12),
+    ]
+    assert [block.start for block in analysis.cfg] == [0x00, 0x06, 0x0A]
+
+    listing = list(render(analysis))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(Disassembler().analyse, [mem] * 8))
+    assert all(list(render(result)) == listing for result in results)
+
+    with pytest.raises(InstructionError):
+        Disassembler(addr=[0x01]).analyse(Memory(bytes([0x00, 0xDD])))
+
+    # an unmapped entry, e.g. the exec address of a data block, is skipped
+    mem = Memory(bytes([0x00, 0xC9]), offset=0x1200)
+    mem.entries = [0x0000, 0x1201]
+    analysis = Disassembler().analyse(mem)
+    assert [inst.addr for inst in analysis.instructions] == [0x1201]
+
+
+def test_profile(tmp_path, capsys):
+    from src.yad80.eager import Disassembler
+    from src.yad80.memory import Memory
+    from src.yad80.profiling import Profile
+
+    # LD A,$00; JR $0001(into LD A,$00); .. data
+    image = bytes([0x3E, 0x00, 0x18, 0xFD, 0x55, 0x55])
+    profile = Profile()
+    analysis = Disassembler().analyse(Memory(image), profile)
+    assert analysis.profile is profile
+    assert list(profile.phases)[:4] == ["code", "string", "addr", "branch"]
+    assert profile.phases["branch"][1] == 1
+    assert analysis.counters == {
+        "instructions": 3,
+        "decoded": 3,
+        "code_bytes": 4,
+        "string_bytes": 0,
+        "data_bytes": 2,
+        "branch_labels": 2,
+        "data_labels": 0,
+        "redecoded_bytes": 1,
+    }
+
+    stats = tmp_path / "yad80.prof"
+    listing = run_eager(tmp_path, image, f"-e --no-cache --profile {stats}")
+    assert "JR      JR_0001" in listing
+    report = capsys.readouterr().err
+    assert "render" in report and "redecoded_bytes" in report
+    assert stats.stat().st_size > 0
+
+
+def test_code_across_load_boundary(tmp_path):
+    high = tmp_path / "high.bin"
+    # $0003 LD A,$05 straddles the boundary, then INC A; RET
+    high.write_bytes(bytes([0x05, 0x3C, 0xC9]))
+    low = bytes([0x00, 0x00, 0x00, 0x3E])
+    for mode in ["-e", "-m 0"]:
+        listing = run_eager(tmp_path, low, f"{mode} --no-cache --load 4:{high}")
+        assert "LD      A,$05" in listing
+        assert "INC     A" in listing and "RET" in listing
+
+    # a walk continues into the next segment
+    high.write_bytes(bytes([0x3C, 0xC9, 0x00]))
+    listing = run_eager(tmp_path, bytes(4), f"-e --no-cache --load 4:{high}")
+    assert code_addrs(listing) == [0, 1, 2, 3, 4, 5]
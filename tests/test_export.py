@@ -0,0 +1,62 @@
+import sqlite3
+
+from .test_batch import run_batch
+from .test_eager import run_eager
+
+# CALL $0008; LD A,($E000); JR $; LD A,$01; LD ($E000),A; RET
+IMAGE = bytes.fromhex("cd08003a00e018fe3e013200e0c9")
+
+WRITERS = """
+SELECT DISTINCT images.name, routines.entry FROM xrefs
+JOIN routines ON routines.image = xrefs.image
+    AND xrefs.src >= routines.start AND xrefs.src < routines.stop
+JOIN images ON images.id = xrefs.image
+WHERE xrefs.dst = ? AND xrefs.kind = 'write'
+"""
+
+
+def query(db, sql, *params):
+    conn = sqlite3.connect(db)
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+def test_export(tmp_path):
+    db = tmp_path / "images.db"
+    listing = run_eager(tmp_path, IMAGE, f"-e --sqlite {db}")
+    assert "CALL    CD_0008" in listing
+    assert run_eager(tmp_path, IMAGE, f"-e --sqlite {db} -a 0") == listing
+
+    assert query(db, "SELECT count(*) FROM images") == [(1,)]
+    assert query(db, "SELECT src, dst, kind FROM xrefs ORDER BY src") == [
+        (0x00, 0x08, "call"),
+        (0x03, 0xE000, "read"),
+        (0x06, 0x06, "jump"),
+        (0x0A, 0xE000, "write"),
+    ]
+    name = str(tmp_path / "image.bin")
+    assert query(db, WRITERS, 0xE000) == [(name, 0x08)]
+    rows = query(db, "SELECT mnemonic, operands FROM instructions")
+    assert ("LD", "A,($E000)") in rows
+    assert (0xE000, "EX_DT_E000", "data", 1) in query(
+        db, "SELECT addr, name, kind, external FROM labels"
+    )
+
+    assert "needs --eager" in run_eager(tmp_path, IMAGE, f"--sqlite {db}")
+
+
+def test_batch_export(tmp_path):
+    (tmp_path / "a.bin").write_bytes(IMAGE)
+    (tmp_path / "b.bin").write_bytes(bytes([0xCD, 0x08, 0x00, 0xC9]) + IMAGE[4:])
+    db = tmp_path / "images.db"
+    summary, _ = run_batch(["-e", "--sqlite", str(db), str(tmp_path / "*.bin")])
+    assert summary["failures"] == 0
+
+    callers = query(
+        db,
+        "SELECT images.name, xrefs.src FROM xrefs JOIN images ON images.id = image "
+        "WHERE dst = ? AND kind = 'call' ORDER BY images.name",
+        0x08,
+    )
+    assert [(name[-5:], src) for name, src in callers] == [("a.bin", 0), ("b.bin", 0)]
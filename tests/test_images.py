@@ -0,0 +1,20 @@
+import pytest
+
+from benchmarks.images import KINDS, SIZES, generate
+from src.yad80.disasm import disasm_iter
+from src.yad80.eager import Disassembler
+from src.yad80.memory import Memory
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_synthetic_image(kind):
+    image = generate(kind, SIZES["4k"])
+    assert len(image) == SIZES["4k"]
+    assert generate(kind, SIZES["4k"]) == image
+    assert generate(kind, SIZES["4k"], seed=1) != image
+
+    mem = Memory(image)
+    insts = list(disasm_iter(mem, 0))
+    assert insts[-1].addr + insts[-1].length == len(image)
+    analysis = Disassembler().analyse(mem)
+    assert analysis.instructions
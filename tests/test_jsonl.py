@@ -0,0 +1,59 @@
+import json
+
+from .test_eager import run_eager
+
+# LD HL,$E000; CALL $0008; JR $; LD A,$01; LD ($E000),A; RET; "AB",0; $12,$34
+IMAGE = bytes.fromhex("2100e0cd080018fe3e013200e0c94142001234")
+
+
+def records(listing):
+    return [json.loads(line) for line in listing.splitlines()]
+
+
+def test_eager_records(tmp_path):
+    listing = run_eager(tmp_path, IMAGE, "-e --no-cache --format jsonl -a 0 -s e-10")
+    items = records(listing)
+    assert [item["type"] for item in items[:8]] == ["inst"] * 6 + ["data"] * 2
+
+    call = items[1]
+    assert call["addr"] == 3
+    assert call["bytes"] == "cd0800"
+    assert call["mnemonic"] == "CALL"
+    assert call["operands"] == ["CD_0008"]
+    assert call["target"] == 8
+    assert items[3]["label"] == "CD_0008"
+    assert items[3]["xrefs"] == [3]
+    assert items[4]["operands"] == ["(EX_DT_E000)", "A"]
+    assert items[6] == {
+        "type": "data",
+        "addr": 0x0E,
+        "bytes": "414200",
+        "label": "ST_000E",
+        "xrefs": [],
+    }
+
+    labels = {item["name"]: item for item in items if item["type"] == "label"}
+    assert labels["EX_DT_E000"]["external"]
+    assert labels["EX_DT_E000"]["kind"] == "data"
+    assert labels["EX_DT_E000"]["xrefs"] == [0x0A]
+    assert items[-1] == {"type": "data_range", "start": 0x11, "end": 0x12, "size": 2}
+
+
+def test_simple_records(tmp_path):
+    listing = run_eager(tmp_path, IMAGE, "--no-cache --format jsonl -m 3")
+    items = records(listing)
+    assert [item["addr"] for item in items] == [0, 3, 6]
+    assert items[0]["operands"] == ["HL", "$E000"]
+    assert items[2]["target"] == 6
+
+
+def test_bank_records(tmp_path):
+    common = tmp_path / "common.bin"
+    common.write_bytes(bytes([0xCD, 0x00, 0x80, 0xC9]))  # CALL $8000; RET
+    banks = bytes([0xC9, 0, 0, 0, 0xC3, 0x00, 0x80, 0])
+    args = f"-e --no-cache --format jsonl --bank 8000-8003 --load 0:{common} -a 0"
+    items = records(run_eager(tmp_path, banks, args))
+    units = [item["name"] for item in items if item["type"] == "unit"]
+    assert units[0] == "common"
+    assert len(units) == 3
+    assert units[1].startswith("bank 00")
@@ -0,0 +1,165 @@
+import io
+import struct
+from contextlib import redirect_stdout
+
+import pytest
+
+from src.yad80.exceptions import FileFormatError
+from src.yad80.cli import cli_main
+from src.yad80.loader import load
+
+
+def mzt_block(data, load_addr, exec_addr, attribute=1):
+    header = bytearray(128)
+    header[0] = attribute
+    header[0x12:0x18] = struct.pack("<3H", len(data), load_addr, exec_addr)
+    return bytes(header) + bytes(data)
+
+
+def test_mzt_blocks(tmp_path):
+    file = tmp_path / "game.mzt"
+    file.write_bytes(
+        mzt_block([0xC3, 0x00, 0x80], 0x1200, 0x1200)
+        + mzt_block([0x76], 0x8000, 0x8000)
+        + mzt_block([0x00, 0x00], 0x9000, 0x1200)
+    )
+    mem = load(str(file), 0)
+    assert [(s.start, s.stop) for s in mem.segments] == [
+        (0x1200, 0x1203),
+        (0x8000, 0x8001),
+        (0x9000, 0x9002),
+    ]
+    assert mem.start == 0x1200
+    assert mem.entries == [0x1200, 0x8000]
+
+
+def test_mzt_contiguous_blocks(tmp_path):
+    file = tmp_path / "game.mzt"
+    # LD HL,$1234 is split between the blocks, the data block has exec 0000
+    file.write_bytes(
+        mzt_block([0x00, 0x21], 0x1200, 0x1200)
+        + mzt_block([0x34, 0x12, 0xC9], 0x1202, 0x0000)
+    )
+    mem = load(str(file), 0)
+    assert [(s.start, s.stop) for s in mem.segments] == [(0x1200, 0x1205)]
+    assert mem.entries == [0x1200]
+
+    fp = io.StringIO()
+    with redirect_stdout(fp):
+        cli_main(["-e", "--no-cache", str(file)])
+    listing = fp.getvalue()
+    assert "LD      HL,$1234" in listing
+    assert "invalid addr" not in listing
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        mzt_block([0x00], 0x1200, 0x1200, attribute=2),
+        mzt_block([0x00, 0x00], 0x1200, 0x1200)[:-1],
+        mzt_block([0x00], 0x1200, 0x1200) + bytes(10),
+        b"",
+    ],
+)
+def test_invalid_mzt(tmp_path, data):
+    file = tmp_path / "bad.mzt"
+    file.write_bytes(data)
+    with pytest.raises(FileFormatError):
+        load(str(file), 0)
+
+
+def hex_record(rectype, addr, data):
+    record = bytes([len(data), addr >> 8, addr & 0xFF, rectype]) + bytes(data)
+    return ":" + (record + bytes([-sum(record) & 0xFF])).hex().upper()
+
+
+def srec_record(rectype, addr, data):
+    size = {"1": 2, "9": 2, "2": 3, "8": 3}[rectype]
+    record = addr.to_bytes(size, "big") + bytes(data)
+    record = bytes([len(record) + 1]) + record
+    return f"S{rectype}" + (record + bytes([~sum(record) & 0xFF])).hex().upper()
+
+
+def test_intel_hex(tmp_path):
+    file = tmp_path / "image.hex"
+    lines = [
+        hex_record(0, 0x0102, [0x03, 0x04]),
+        hex_record(0, 0x0100, [0x01, 0x02]),
+        hex_record(0, 0x0104, [0x05]),
+        hex_record(0, 0x8000, [0x76]),
+        hex_record(4, 0, [0x00, 0x01]),
+        hex_record(0, 0x0000, [0xC9]),
+        hex_record(5, 0, [0x00, 0x00, 0x01, 0x00]),
+        hex_record(1, 0, []),
+    ]
+    file.write_text("\n".join(lines) + "\n")
+    mem = load(str(file), 0)
+    assert [(s.start, bytes(s.block)) for s in mem.segments] == [
+        (0x0100, bytes([1, 2, 3, 4, 5])),
+        (0x8000, bytes([0x76])),
+        (0x10000, bytes([0xC9])),
+    ]
+    assert not mem.addr_in(0x0105)
+    assert mem.start == 0x0100
+
+
+def test_srec(tmp_path):
+    file = tmp_path / "image.s19"
+    lines = [
+        "S00600004844521B",
+        srec_record("1", 0x1000, [0x3E, 0x01]),
+        srec_record("1", 0x1002, [0xC9]),
+        srec_record("2", 0x012000, [0x00]),
+        srec_record("9", 0x1000, []),
+    ]
+    file.write_text("\n".join(lines) + "\n")
+    mem = load(str(file), 0)
+    assert [(s.start, bytes(s.block)) for s in mem.segments] == [
+        (0x1000, bytes([0x3E, 0x01, 0xC9])),
+        (0x12000, bytes([0x00])),
+    ]
+    assert mem.start == 0x1000
+
+
+@pytest.mark.parametrize(
+    "name, line",
+    [
+        ("bad.hex", hex_record(0, 0x0100, [0x01])[:-2] + "00"),
+        ("bad.hex", hex_record(0, 0x0100, [0x01])[:-2]),
+        ("bad.hex", hex_record(1, 0, [])),
+        ("bad.hex", "0100000001FF"),
+        ("bad.s19", srec_record("1", 0x1000, [0x01])[:-2] + "00"),
+        ("bad.s19", "S4030000FC"),
+    ],
+)
+def test_invalid_records(tmp_path, name, line):
+    file = tmp_path / name
+    file.write_text(line + "\n")
+    with pytest.raises(FileFormatError):
+        load(str(file), 0)
+
+
+@pytest.mark.parametrize(
+    "name, line",
+    [
+        ("bad.hex", hex_record(1, 0, [0x00])),
+        ("bad.hex", hex_record(2, 0, [0x10])),
+        ("bad.hex", hex_record(3, 0, [0x00, 0x01])),
+        ("bad.hex", hex_record(4, 0, [0x00, 0x00, 0x01])),
+        ("bad.hex", hex_record(5, 0, [0x01, 0x00])),
+        ("bad.s19", srec_record("9", 0x1000, [0x01])),
+        # a 2 byte address for the 3 bytes of S8
+        ("bad.s19", "S8" + srec_record("9", 0x1000, [])[2:]),
+        # one byte of the 2 byte address
+        ("bad.s19", "S10210ED"),
+    ],
+)
+def test_record_data_size(tmp_path, name, line):
+    file = tmp_path / name
+    if name.endswith(".hex"):
+        first = hex_record(0, 0, [0x00])
+    else:
+        first = srec_record("1", 0, [0x00])
+    file.write_text(first + "\n" + line + "\n")
+    with pytest.raises(FileFormatError, match=f"{name}, line 2"):
+        load(str(file), 0)
@@ -0,0 +1,62 @@
+import pytest
+
+from src.yad80 import loader
+from src.yad80.exceptions import AddressError
+from src.yad80.memory import RAM, ROM, UNMAPPED, Memory
+
+
+def test_slice_is_view():
+    data = bytearray(range(16))
+    mem = Memory(data, offset=0x100)
+    view = mem[0x104:0x108]
+    assert isinstance(view, memoryview)
+    data[4] = 0xFF
+    assert list(view) == [0xFF, 5, 6, 7]
+    assert mem[0x10F] == 15
+    with pytest.raises(AddressError):
+        mem[0x0FF]
+
+
+def test_mmap_large_file(tmp_path, monkeypatch):
+    file = tmp_path / "dump.bin"
+    file.write_bytes(bytes(range(256)) * 4)
+    monkeypatch.setattr(loader, "MMAP_THRESHOLD", 1024)
+    mem = loader.load(str(file), 0x8000)
+    assert mem.max_addr == 0x83FF
+    assert bytes(mem[0x80FE:0x8102]) == b"\xfe\xff\x00\x01"
+
+
+def test_segments():
+    mem = Memory(bytes([1, 2, 3, 4]), offset=0x100)
+    mem.add_segment(0x104, bytes([5, 6]), ROM)
+    mem.add_segment(0x8000, bytes([7, 8]))
+    assert (mem.min_addr, mem.max_addr, len(mem)) == (0x100, 0x8001, 8)
+    assert mem.addr_in(0x105)
+    assert not mem.addr_in(0x106)
+    assert mem.kind_at(0x104) == ROM
+    assert mem.kind_at(0x8000) == RAM
+    assert mem.kind_at(0x200) == UNMAPPED
+    assert mem[0x8001] == 8
+    assert bytes(mem[0x102:0x106]) == bytes([3, 4, 5, 6])
+    with pytest.raises(AddressError):
+        mem[0x105:0x8001]
+    with pytest.raises(AddressError):
+        mem.addr = 0x106
+    with pytest.raises(AddressError):
+        mem.add_segment(0x7FFF, bytes(2))
+    mem.addr = 0x8001
+    assert mem.next_byte() == 8
+
+
+def test_adjacent_segments_are_one_run():
+    # LD A,$05 straddles the segments, then INC A; RET
+    mem = Memory(bytes([0x00, 0x00, 0x00, 0x3E]))
+    mem.add_segment(4, bytes([0x05, 0x3C, 0xC9]), ROM)
+    mem.add_segment(0x10, bytes([0x00]))
+    assert [(run.start, run.stop) for run in mem.runs] == [(0, 7), (0x10, 0x11)]
+    assert len(mem.segments) == 3
+    assert (mem.kind_at(3), mem.kind_at(4)) == (RAM, ROM)
+    assert bytes(mem[2:6]) == bytes([0x00, 0x3E, 0x05, 0x3C])
+    mem.addr = 3
+    assert mem.next_byte() == 0x3E
+    assert mem.next_byte() == 0x05
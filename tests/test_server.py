@@ -0,0 +1,92 @@
+import asyncio
+import io
+import json
+import socket
+import sys
+
+import pytest
+
+from src.yad80.eager import Disassembler
+from src.yad80.memory import Memory
+from src.yad80.server import Session, serve, serve_stream
+
+
+def make_session():
+    # LD A,($0010); CALL $000A; HALT; .. RET
+    image = bytearray([0x3A, 0x10, 0x00, 0xCD, 0x0A, 0x00, 0x76, 0x41, 0x42, 0x43])
+    image += bytearray([0xC9, 0x00, 0x00, 0x00, 0x00, 0x00, 0x55, 0x55])
+    return Session(Disassembler().analyse(Memory(bytes(image))))
+
+
+def test_requests():
+    session = make_session()
+    response = session.handle(
+        {"id": 1, "method": "list", "params": {"addr": 0x04, "count": 2}}
+    )
+    assert response["id"] == 1
+    lines = response["result"]["lines"]
+    assert [line["addr"] for line in lines] == [0x03, 0x06]
+    assert lines[0]["text"].startswith("CALL    CD_000A")
+    assert response["result"]["next"] == 0x07
+
+    response = session.handle({"id": 2, "method": "xrefs", "params": {"addr": 0x0A}})
+    assert response["result"] == {"label": "CD_000A", "refs": [0x03]}
+
+    response = session.handle(
+        {"id": 3, "method": "rename", "params": {"addr": 0x0A, "name": "SUB"}}
+    )
+    assert response["result"] == {"label": "SUB"}
+    response = session.handle({"method": "list", "params": {"addr": 0x03, "count": 1}})
+    assert response["result"]["lines"][0]["text"].startswith("CALL    SUB")
+    assert session.handle({"method": "labels"})["result"]["SUB"] == 0x0A
+
+
+def test_request_errors():
+    session = make_session()
+    assert "error" in session.handle({"id": 1, "method": "unknown"})
+    assert "error" in session.handle({"method": "xrefs", "params": {"addr": 0x01}})
+    assert "error" in session.handle({"method": "xrefs", "params": {"bad": 1}})
+    rename = {"method": "rename", "params": {"addr": 0x0A, "name": "DT_0010"}}
+    assert "already used" in session.handle(rename)["error"]
+    rename["params"]["name"] = "1ABC"
+    assert "invalid label name" in session.handle(rename)["error"]
+    assert json.loads(session.handle_line(b"{"))["error"].startswith("invalid JSON")
+
+
+def test_stdin_file(tmp_path, monkeypatch):
+    requests = tmp_path / "requests.jsonl"
+    requests.write_text('{"id": 1, "method": "labels"}\n\n{"id": 2}\n')
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    with open(requests) as fp:
+        monkeypatch.setattr(sys, "stdin", fp)
+        serve(make_session())
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [response["id"] for response in responses] == [1, 2]
+    assert responses[0]["result"]["CD_000A"] == 0x0A
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix socket")
+def test_socket_clients(tmp_path):
+    session = make_session()
+    path = str(tmp_path / "yad80.sock")
+
+    async def client(addr):
+        reader, writer = await asyncio.open_unix_connection(path)
+        request = {"id": addr, "method": "xrefs", "params": {"addr": addr}}
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        writer.close()
+        return response
+
+    async def main():
+        server = await asyncio.start_unix_server(
+            lambda reader, writer: serve_stream(session, reader, writer), path
+        )
+        async with server:
+            return await asyncio.gather(client(0x0A), client(0x10))
+
+    responses = asyncio.run(main())
+    assert responses[0]["result"] == {"label": "CD_000A", "refs": [0x03]}
+    assert responses[1]["result"] == {"label": "DT_0010", "refs": [0x00]}
@@ -0,0 +1,52 @@
+import os
+
+from src.yad80.watch import Watcher
+
+
+def touch(path, step):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + step * 1_000_000_000))
+
+
+def test_watcher(tmp_path):
+    image = tmp_path / "image.bin"
+    # CALL $0006; HALT; .. RET
+    image.write_bytes(bytes([0xCD, 0x06, 0x00, 0x76, 0x00, 0x00, 0xC9, 0x00]))
+    option = tmp_path / "image.opt"
+    option.write_text("-e\n")
+    output = tmp_path / "image.asm"
+    watcher = Watcher(["--option", str(option), "--output", str(output), str(image)])
+
+    assert watcher.check()
+    assert "CALL    CD_0006" in output.read_text()
+    assert not watcher.check()
+    decoded = dict(watcher.decoded)
+    assert sorted(decoded) == [0x00, 0x03, 0x06]
+
+    # a comment does not change the listing
+    option.write_text("-e ; eager\n")
+    touch(option, 1)
+    assert not watcher.check()
+
+    option.write_text("-e\n-a 0 4\n")
+    touch(option, 2)
+    assert watcher.check()
+    assert "AO_0004:" in output.read_text()
+    assert all(watcher.decoded[addr] is inst for addr, inst in decoded.items())
+
+    image.write_bytes(bytes([0xC3, 0x06, 0x00, 0x76, 0x00, 0x00, 0xC9, 0x00]))
+    touch(image, 3)
+    assert watcher.check()
+    assert "JP      JP_0006" in output.read_text()
+    assert watcher.decoded[0x00].mnemonic == "JP"
+
+    # a failed render keeps the last listing
+    listing = output.read_text()
+    image.write_bytes(bytes([0xED, 0xFF, 0xC9]))
+    touch(image, 4)
+    assert watcher.check()
+    assert output.read_text() == listing
+    option.write_text("-m 0\n")
+    touch(option, 5)
+    assert watcher.check()
+    assert output.read_text() == listing